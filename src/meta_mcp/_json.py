@@ -0,0 +1,39 @@
+"""
+Shared JSON encoding for files and JSON-RPC streams.
+
+Uses ``orjson`` when the ``speedups`` extra is installed and the standard
+library otherwise.  Both backends produce the same bytes, so files written
+by one are rewritten unchanged by the other.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document; errors subclass ``json.JSONDecodeError``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Encode *obj* as compact JSON followed by a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return (text + "\n").encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Encode *obj* as JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -26,6 +26,29 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Categorisation terms, highest priority first.
+_CATEGORY_TERMS: List[Tuple[MCPServerCategory, Tuple[str, ...]]] = [
+    (MCPServerCategory.VERSION_CONTROL, ("github", "gitlab", "git", "version")),
+    (MCPServerCategory.SEARCH, ("search", "brave", "google", "perplexity")),
+    (MCPServerCategory.AUTOMATION, ("browser", "puppeteer", "firecrawl", "automation")),
+    (MCPServerCategory.CODING, ("code", "serena", "ide", "coding")),
+    (MCPServerCategory.CONTEXT, ("context", "doc", "knowledge")),
+    (MCPServerCategory.ORCHESTRATION, ("zen", "router", "orchestr")),
+]
+
+# One named group per category, in priority order, inside a lookahead so a
+# match is reported at every position.  Where terms from two categories start
+# at the same position the higher-priority group wins, which is the one the
+# caller wants anyway.
+_CATEGORY_RE = re.compile(
+    "(?="
+    + "|".join(
+        f"(?P<c{i}>" + "|".join(re.escape(t) for t in terms) + ")"
+        for i, (_, terms) in enumerate(_CATEGORY_TERMS)
+    )
+    + ")"
+)
+
 
 class MCPDiscovery:
     """Discovers MCP servers from various sources."""
@@ -588,24 +611,21 @@ class MCPDiscovery:
         return list(set(matches))
 
     def _categorize_server(self, name: str, description: str) -> MCPServerCategory:
-        """Categorize a server based on its name and description."""
-        name_lower = name.lower()
-        desc_lower = description.lower()
-        
-        if any(term in name_lower or term in desc_lower for term in ["github", "gitlab", "git", "version"]):
-            return MCPServerCategory.VERSION_CONTROL
-        elif any(term in name_lower or term in desc_lower for term in ["search", "brave", "google", "perplexity"]):
-            return MCPServerCategory.SEARCH
-        elif any(term in name_lower or term in desc_lower for term in ["browser", "puppeteer", "firecrawl", "automation"]):
-            return MCPServerCategory.AUTOMATION
-        elif any(term in name_lower or term in desc_lower for term in ["code", "serena", "ide", "coding"]):
-            return MCPServerCategory.CODING
-        elif any(term in name_lower or term in desc_lower for term in ["context", "doc", "knowledge"]):
-            return MCPServerCategory.CONTEXT
-        elif any(term in name_lower or term in desc_lower for term in ["zen", "router", "orchestr"]):
-            return MCPServerCategory.ORCHESTRATION
-        else:
-            return MCPServerCategory.OTHER
+        """Categorize a server based on its name and description.
+
+        The first category in ``_CATEGORY_TERMS`` with a term in either
+        string wins; one regex pass over both replaces a substring test per
+        term.
+        """
+        text = f"{name.lower()}\n{description.lower()}"
+        best = len(_CATEGORY_TERMS)
+        for match in _CATEGORY_RE.finditer(text):
+            best = min(best, int(match.lastgroup[1:]))
+            if best == 0:
+                break
+        if best < len(_CATEGORY_TERMS):
+            return _CATEGORY_TERMS[best][0]
+        return MCPServerCategory.OTHER
 
     def _extract_keywords(self, name: str, description: str) -> List[str]:
         """Extract keywords from server name and description."""
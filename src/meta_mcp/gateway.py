@@ -14,20 +14,22 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from . import _json
 from .gateway_registry import BackendConfig, GatewayRegistry
 from .models import DiscoveredTool, ServerToolsResult
-from .orchestration import ServerOrchestrator
+
+if TYPE_CHECKING:
+    from .orchestration import ServerOrchestrator
 
 logger = logging.getLogger(__name__)
 
 # Estimated tokens per tool definition in the system prompt.
 _TOKENS_PER_TOOL_ESTIMATE = 60
 
-
 class GatewayServer:
     """Meta-MCP in gateway mode — single MCP server proxying to backends.
 
@@ -40,17 +42,31 @@ class GatewayServer:
 
     def __init__(self, registry: Optional[GatewayRegistry] = None) -> None:
         self.mcp = FastMCP("Meta MCP Gateway")
-        self.orchestrator = ServerOrchestrator()
+        # Created on first use: listing backends or reporting the budget
+        # never needs the process machinery.
+        self._orchestrator: Optional["ServerOrchestrator"] = None
         self.registry = registry or GatewayRegistry()
 
         # backend_name -> ServerToolsResult (discovered tools/prompts)
         self.active_backends: Dict[str, ServerToolsResult] = {}
         # tool_name -> (backend_name, original_tool_name)
         self._proxy_tool_map: Dict[str, tuple[str, str]] = {}
+        # backend_name -> proxy tool names registered for it (reverse index)
+        self._tools_by_backend: Dict[str, List[str]] = {}
         # Keep a few core meta-mcp tools from the existing codebase.
         self._core_tools_registered = False
 
         self._register_gateway_tools()
+        # Gateway tools are fixed after init; only proxies come and go, and
+        # _proxy_tool_map already tracks those, so the budget never rescans.
+        self._gateway_tool_count = len(self._get_gateway_tool_names())
+
+    @property
+    def orchestrator(self) -> "ServerOrchestrator":
+        if self._orchestrator is None:
+            from .orchestration import ServerOrchestrator
+            self._orchestrator = ServerOrchestrator()
+        return self._orchestrator
 
     # ------------------------------------------------------------------
     # Gateway tool registration
@@ -196,18 +212,19 @@ class GatewayServer:
             )
 
             # Register each discovered tool as a proxy on our FastMCP instance
-            registered_names: List[str] = []
-            for tool in result.tools:
-                proxy_name = f"{name}_{tool.name}"
-                proxy_fn = self._make_proxy(name, tool.name)
+            proxied = {f"{name}_{tool.name}": tool for tool in result.tools}
+            for proxy_name, tool in proxied.items():
                 self.mcp.tool(
                     name=proxy_name,
                     description=tool.description,
-                )(proxy_fn)
-                self._proxy_tool_map[proxy_name] = (name, tool.name)
-                registered_names.append(proxy_name)
+                )(self._make_proxy(name, tool.name))
+            self._proxy_tool_map.update(
+                {proxy_name: (name, tool.name) for proxy_name, tool in proxied.items()}
+            )
+            registered_names = list(proxied)
 
             self.active_backends[name] = result
+            self._tools_by_backend[name] = registered_names
 
             # Notify Claude Code that our tool list changed
             await self._send_tools_list_changed()
@@ -226,15 +243,13 @@ class GatewayServer:
         if name not in self.active_backends:
             return f"Backend '{name}' is not active."
 
-        result = self.active_backends.pop(name)
+        self.active_backends.pop(name)
 
-        # Remove proxied tools from FastMCP
-        removed: List[str] = []
-        for tool in result.tools:
-            proxy_name = f"{name}_{tool.name}"
+        # Remove exactly the proxies registered for this backend
+        removed = self._tools_by_backend.pop(name, [])
+        for proxy_name in removed:
             self._remove_tool(proxy_name)
             self._proxy_tool_map.pop(proxy_name, None)
-            removed.append(proxy_name)
 
         # Stop the server process
         try:
@@ -292,7 +307,7 @@ class GatewayServer:
 
     def _context_budget(self) -> str:
         """Report current context token usage."""
-        gateway_tool_count = len(self._get_gateway_tool_names())
+        gateway_tool_count = self._gateway_tool_count
         proxy_tool_count = len(self._proxy_tool_map)
         total_tools = gateway_tool_count + proxy_tool_count
         estimated_tokens = total_tools * _TOKENS_PER_TOOL_ESTIMATE
@@ -380,7 +395,7 @@ class GatewayServer:
             )
             if isinstance(result, str):
                 return result
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return _json.dumps_pretty(result)
 
         # Give the proxy a meaningful name and docstring for FastMCP introspection
         proxy.__name__ = f"{server_name}_{tool_name}"
@@ -448,13 +463,24 @@ class GatewayServer:
     # ------------------------------------------------------------------
 
     async def _auto_activate(self) -> None:
-        """Activate backends marked with ``auto_activate: true``."""
-        for name in self.registry.auto_activate_backends():
+        """Activate backends marked with ``auto_activate: true``.
+
+        Backends start concurrently: each activation is dominated by process
+        startup and the MCP handshake, so the total wait is the slowest
+        backend rather than the sum.
+        """
+        names = self.registry.auto_activate_backends()
+        for name in names:
             logger.info("Auto-activating backend '%s'", name)
-            try:
-                await self._activate_backend(name)
-            except Exception:
-                logger.exception("Failed to auto-activate '%s'", name)
+        results = await asyncio.gather(
+            *(self._activate_backend(name) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to auto-activate '%s'", name, exc_info=result,
+                )
 
     # ------------------------------------------------------------------
     # Run
@@ -517,4 +543,5 @@ class GatewayServer:
                 await self._deactivate_backend(name)
             except Exception:
                 logger.exception("Error deactivating '%s' during shutdown", name)
-        await self.orchestrator.shutdown()
+        if self._orchestrator is not None:
+            await self._orchestrator.shutdown()
@@ -8,15 +8,16 @@ Maps backend names to their startup commands. Loaded from
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol
 
 from pydantic import BaseModel, Field
 
+from . import _json
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_REGISTRY_PATH = Path.home() / ".mcp-manager" / "backends.json"
 
-
 class BackendConfig(BaseModel):
     """Configuration for a single backend MCP server."""
 
@@ -34,45 +35,105 @@ class BackendConfig(BaseModel):
     )
 
 
+class RegistryStorage(Protocol):
+    """Where a ``GatewayRegistry`` keeps its serialised backends."""
+
+    def read_bytes(self) -> Optional[bytes]:
+        """Return the stored document, or ``None`` if nothing is stored yet."""
+        ...
+
+    def write_bytes(self, data: bytes) -> None:
+        ...
+
+
+class FileStorage:
+    """Registry storage backed by a JSON file (the default)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return str(self.path)
+
+    def read_bytes(self) -> Optional[bytes]:
+        if not self.path.is_file():
+            return None
+        return self.path.read_bytes()
+
+    def write_bytes(self, data: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(data)
+
+
+class MemoryStorage:
+    """In-process registry storage, for tests and embedding."""
+
+    def __init__(self, initial: Optional[bytes] = None) -> None:
+        self.data = initial
+
+    def __repr__(self) -> str:
+        return "<memory>"
+
+    def read_bytes(self) -> Optional[bytes]:
+        return self.data
+
+    def write_bytes(self, data: bytes) -> None:
+        self.data = data
+
+
 class GatewayRegistry:
     """Manages the mapping from backend names to their startup configurations.
 
     Reads from ``~/.mcp-manager/backends.json`` on init.  Falls back to an
-    empty registry if the file doesn't exist.
+    empty registry if the file doesn't exist.  Pass *storage* (e.g. a
+    ``MemoryStorage``) to keep the document somewhere other than a file.
     """
 
-    def __init__(self, registry_path: Optional[Path] = None) -> None:
-        self._path = registry_path or _DEFAULT_REGISTRY_PATH
+    def __init__(
+        self,
+        registry_path: Optional[Path] = None,
+        storage: Optional[RegistryStorage] = None,
+    ) -> None:
+        self._storage: RegistryStorage = storage or FileStorage(
+            registry_path or _DEFAULT_REGISTRY_PATH
+        )
         self._backends: Dict[str, BackendConfig] = {}
+        # Set by add/remove; save() is a no-op while the file is current.
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
-        if not self._path.is_file():
-            logger.info("No backend registry at %s — starting empty", self._path)
+        try:
+            data = self._storage.read_bytes()
+        except OSError as exc:
+            logger.error("Failed to read backend registry: %s", exc)
+            return
+        if data is None:
+            logger.info("No backend registry at %s — starting empty", self._storage)
             return
 
         try:
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
+            raw = _json.loads(data)
             for name, cfg in raw.items():
                 try:
                     self._backends[name] = BackendConfig(**cfg)
                 except Exception:
                     logger.warning("Skipping invalid backend config for '%s'", name)
             logger.info(
-                "Loaded %d backend(s) from %s", len(self._backends), self._path
+                "Loaded %d backend(s) from %s", len(self._backends), self._storage
             )
-        except (json.JSONDecodeError, OSError) as exc:
+        except json.JSONDecodeError as exc:
             logger.error("Failed to read backend registry: %s", exc)
 
     def save(self) -> None:
-        """Persist current backends to disk."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
+        """Persist current backends if they changed since the last load/save."""
+        if not self._dirty:
+            logger.debug("Backend registry unchanged; not rewriting %s", self._storage)
+            return
         data = {name: cfg.model_dump() for name, cfg in self._backends.items()}
-        self._path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        logger.info("Saved %d backend(s) to %s", len(self._backends), self._path)
+        self._storage.write_bytes((_json.dumps_pretty(data) + "\n").encode("utf-8"))
+        self._dirty = False
+        logger.info("Saved %d backend(s) to %s", len(self._backends), self._storage)
 
     @property
     def backends(self) -> Dict[str, BackendConfig]:
@@ -82,10 +143,14 @@ class GatewayRegistry:
         return self._backends.get(name)
 
     def add(self, name: str, config: BackendConfig) -> None:
-        self._backends[name] = config
+        if self._backends.get(name) != config:
+            self._backends[name] = config
+            self._dirty = True
 
     def remove(self, name: str) -> bool:
-        return self._backends.pop(name, None) is not None
+        removed = self._backends.pop(name, None) is not None
+        self._dirty |= removed
+        return removed
 
     def auto_activate_backends(self) -> List[str]:
         """Return names of backends marked for auto-activation."""
@@ -2,11 +2,13 @@
 Conversational Memory and Learning (R7).
 
 Persists installation history, failure records, and learned user preferences
-to ``~/.mcp-manager/memory.json``.  Every mutating method saves state to disk
-immediately.  Thread safety via ``threading.Lock``.
+to ``~/.mcp-manager/memory.json`` as newline-delimited JSON.  Every mutating
+method appends one line to the file immediately; the file is rewritten from
+memory only when it grows past ``_COMPACT_AFTER`` lines or still holds the old
+single-document format.  Thread safety via ``threading.Lock``.
 """
 
-import json
+import functools
 import logging
 import threading
 from collections import Counter
@@ -14,6 +16,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from . import _json
 from .models import (
     FailureRecord,
     InstallationRecord,
@@ -26,7 +29,8 @@ logger = logging.getLogger(__name__)
 _DEFAULT_MEMORY_FILE = Path.home() / ".mcp-manager" / "memory.json"
 _MAX_RECORDS = 1000
 _COMBO_WINDOW_MINUTES = 5
-
+# Twice the lines a freshly compacted file can hold (both record lists full).
+_COMPACT_AFTER = 4 * _MAX_RECORDS
 
 class ConversationalMemory:
     """Persistent conversational memory for the MCP manager.
@@ -38,39 +42,121 @@ class ConversationalMemory:
     def __init__(self, memory_path: Optional[str] = None) -> None:
         self._path = Path(memory_path) if memory_path else _DEFAULT_MEMORY_FILE
         self._lock = threading.Lock()
+        self._lines = 0
+        self._compact_pending = False
         self._state = self._load()
 
     # ---- persistence -----------------------------------------------------
 
     def _load(self) -> MemoryState:
-        """Load state from disk, returning defaults on any error."""
+        """Replay the journal from disk, returning defaults on any error.
+
+        Each line is ``{"kind": ..., "data": ...}``.  Unparseable lines are
+        skipped rather than discarding the whole history.  A line without a
+        ``kind`` (or a file whose first line is a bare ``{``) is a snapshot in
+        the old single-document format and is migrated on the next write.
+        """
         if not self._path.exists():
             logger.debug("No memory file at %s; starting fresh", self._path)
             return MemoryState()
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
-            state = MemoryState.model_validate(data)
-            logger.info(
-                "Loaded memory: %d installations, %d failures",
-                len(state.installations), len(state.failures),
-            )
-            return state
-        except json.JSONDecodeError as exc:
-            logger.warning("Corrupt memory file -- resetting: %s", exc)
+            raw = self._path.read_bytes()
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to load memory -- resetting: %s", exc)
-        return MemoryState()
+            return MemoryState()
+
+        lines = raw.splitlines()
+        if lines and lines[0].strip() == b"{":
+            # Indented snapshot written by older versions.
+            lines = [raw]
+        state = MemoryState()
+        skipped = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            self._lines += 1
+            if not line.startswith(b"{"):
+                # Every entry is an object; skip garbage without parsing it.
+                skipped += 1
+                continue
+            try:
+                entry = _json.loads(line)
+                self._replay(state, entry)
+            except Exception as exc:  # noqa: BLE001
+                skipped += 1
+                logger.debug("Skipping unreadable memory line: %s", exc)
+        if skipped:
+            logger.warning(
+                "Corrupt memory file -- skipped %d unreadable line(s)", skipped,
+            )
+            self._compact_pending = True
+
+        self._state = state
+        self._trim()
+        self._recompute_preferences()
+        logger.info(
+            "Loaded memory: %d installations, %d failures",
+            len(state.installations), len(state.failures),
+        )
+        return state
+
+    def _replay(self, state: MemoryState, entry: Any) -> None:
+        """Apply one decoded journal line to *state*."""
+        kind = entry.get("kind") if isinstance(entry, dict) else None
+        if kind == "installation":
+            state.installations.append(InstallationRecord.model_validate(entry["data"]))
+        elif kind == "failure":
+            state.failures.append(FailureRecord.model_validate(entry["data"]))
+        elif kind == "preferences":
+            state.preferences = UserPreferences.model_validate(entry["data"])
+        elif kind is None:
+            snapshot = MemoryState.model_validate(entry)
+            state.installations.extend(snapshot.installations)
+            state.failures.extend(snapshot.failures)
+            state.preferences = snapshot.preferences
+            self._compact_pending = True
+        else:
+            raise ValueError(f"unknown memory entry kind {kind!r}")
+
+    @staticmethod
+    def _line(kind: str, model: Any) -> bytes:
+        """Serialise one journal entry as a compact JSON line."""
+        return _json.dumps_line({"kind": kind, "data": model.model_dump(mode="json")})
+
+    def _append(self, kind: str, model: Any) -> None:
+        """Persist one entry by appending a line, compacting when due.
+
+        Must be called while ``self._lock`` is held, after *model* has been
+        applied to ``self._state``.
+        """
+        self._state.last_updated = datetime.now()
+        if self._compact_pending or self._lines >= _COMPACT_AFTER:
+            self._save()
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "ab") as fh:
+                fh.write(self._line(kind, model))
+            self._lines += 1
+            logger.debug("Memory entry appended to %s", self._path)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Failed to save memory: %s", exc)
 
     def _save(self) -> None:
-        """Persist state via atomic tmp-file rename."""
+        """Rewrite the journal from in-memory state via atomic tmp-file rename."""
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
             self._state.last_updated = datetime.now()
-            payload = self._state.model_dump(mode="json")
+            lines = [self._line("installation", r) for r in self._state.installations]
+            lines += [self._line("failure", r) for r in self._state.failures]
+            lines.append(self._line("preferences", self._state.preferences))
             tmp = self._path.with_suffix(".json.tmp")
-            tmp.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+            tmp.write_bytes(b"".join(lines))
             tmp.replace(self._path)
-            logger.debug("Memory saved to %s", self._path)
+            self._lines = len(lines)
+            self._compact_pending = False
+            logger.debug("Memory compacted to %s", self._path)
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to save memory: %s", exc)
 
@@ -97,15 +183,19 @@ class ConversationalMemory:
             self._state.installations.append(record)
             self._trim()
             self._recompute_preferences()
-            self._save()
+            self._append("installation", record)
         logger.info("Recorded install: server=%s option=%s ok=%s", server, option, success)
         return record
 
     # ---- failure tracking ------------------------------------------------
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _extract_error_signature(error_msg: str) -> str:
-        """First non-empty line of *error_msg*, truncated to 200 chars."""
+        """First non-empty line of *error_msg*, truncated to 200 chars.
+
+        Memoised: retry loops record the same failure message repeatedly.
+        """
         for line in error_msg.splitlines():
             stripped = line.strip()
             if stripped:
@@ -126,7 +216,7 @@ class ConversationalMemory:
         with self._lock:
             self._state.failures.append(record)
             self._trim()
-            self._save()
+            self._append("failure", record)
         logger.info("Recorded failure: server=%s sig=%s", server, signature)
         return record
 
@@ -169,16 +259,14 @@ class ConversationalMemory:
         if client_counts:
             prefs.preferred_clients = [c for c, _ in client_counts.most_common()]
 
-        # prefers_official -- compare official/recommended vs others
-        official_kw = {"official", "recommended"}
+        # prefers_official -- compare official/recommended vs others, summed
+        # over the distinct option names already counted above
+        official_kw = ("official", "recommended")
         official = sum(
-            1 for r in installs
-            if r.success and any(k in r.option_name.lower() for k in official_kw)
-        )
-        enhanced = sum(
-            1 for r in installs
-            if r.success and not any(k in r.option_name.lower() for k in official_kw)
+            count for option, count in method_counts.items()
+            if any(k in option.lower() for k in official_kw)
         )
+        enhanced = sum(method_counts.values()) - official
         if official + enhanced > 0:
             prefs.prefers_official = official >= enhanced
 
@@ -225,7 +313,7 @@ class ConversationalMemory:
         with self._lock:
             self._state.preferences.interaction_count += 1
             self._recompute_preferences()
-            self._save()
+            self._append("preferences", self._state.preferences)
             logger.debug(
                 "Preferences updated (action=%s, interactions=%d)",
                 action, self._state.preferences.interaction_count,
@@ -14,6 +14,7 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from . import _json
 from .models import (
     ServerProcess,
     DiscoveredTool,
@@ -37,6 +38,12 @@ _MCP_PROTOCOL_VERSION = "2024-11-05"
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Sent after every initialize handshake; the bytes never change.
+_INITIALIZED_NOTIFICATION = _json.dumps_line(
+    {"jsonrpc": "2.0", "method": "notifications/initialized"}
+)
+
+
 def _build_jsonrpc_request(
     method: str,
     params: Optional[Dict[str, Any]] = None,
@@ -50,7 +57,7 @@ def _build_jsonrpc_request(
     }
     if params is not None:
         payload["params"] = params
-    return (json.dumps(payload) + "\n").encode("utf-8")
+    return _json.dumps_line(payload)
 
 
 async def _read_jsonrpc_response(
@@ -75,18 +82,19 @@ async def _read_jsonrpc_response(
         if not raw_line:
             raise ConnectionError("Server process closed stdout unexpectedly")
 
-        line = raw_line.decode("utf-8", errors="replace").strip()
+        # Parse the raw bytes; only decode to text for log messages.
+        line = raw_line.strip()
         if not line:
             continue
 
         try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            logger.debug("Non-JSON line from server: %s", line[:200])
+            msg = _json.loads(line)
+        except ValueError:
+            logger.debug("Non-JSON line from server: %r", line[:200])
             continue
 
         if "id" not in msg:
-            logger.debug("Server notification: %s", line[:300])
+            logger.debug("Server notification: %r", line[:300])
             continue
 
         return msg
@@ -270,7 +278,8 @@ class ServerOrchestrator:
             await proc.stdin.drain()
 
             init_resp = await _read_jsonrpc_response(proc.stdout, timeout=_STARTUP_TIMEOUT_S)
-            logger.debug("Initialize response: %s", json.dumps(init_resp)[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Initialize response: %s", json.dumps(init_resp)[:500])
             if "error" in init_resp:
                 err = init_resp["error"]
                 raise RuntimeError(f"MCP initialize failed: {err.get('message', err)}")
@@ -289,7 +298,8 @@ class ServerOrchestrator:
             await proc.stdin.drain()
 
             tools_resp = await _read_jsonrpc_response(proc.stdout, timeout=_TOOL_CALL_TIMEOUT_S)
-            logger.debug("tools/list response: %s", json.dumps(tools_resp)[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("tools/list response: %s", json.dumps(tools_resp)[:500])
             if "result" in tools_resp:
                 for td in tools_resp["result"].get("tools", []):
                     tools.append(DiscoveredTool(
@@ -442,10 +452,7 @@ class ServerOrchestrator:
             err = init_resp["error"]
             raise RuntimeError(f"MCP handshake failed for '{name}': {err.get('message', err)}")
 
-        proc.stdin.write(
-            (json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}) + "\n")
-            .encode("utf-8")
-        )
+        proc.stdin.write(_INITIALIZED_NOTIFICATION)
         await proc.stdin.drain()
         logger.info("MCP handshake completed for server '%s'", name)
 
@@ -461,12 +468,11 @@ class ServerOrchestrator:
         content = result_data.get("content")
         if not isinstance(content, list):
             return result_data
-        if len(content) == 1 and content[0].get("type") == "text":
-            return content[0].get("text", "")
-        texts = []
-        for item in content:
-            texts.append(item.get("text", "") if item.get("type") == "text" else item)
-        return texts if len(texts) != 1 else texts[0]
+        texts = [
+            item.get("text", "") if item.get("type") == "text" else item
+            for item in content
+        ]
+        return texts[0] if len(texts) == 1 else texts
 
     # -- shutdown ------------------------------------------------------------
 
@@ -10,8 +10,10 @@ import json
 import logging
 import os
 import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from .models import (
     ProjectContext,
@@ -77,6 +79,103 @@ def _read_yaml(path: Path) -> Optional[Any]:
         return None
 
 
+@dataclass(frozen=True)
+class _RootListing:
+    """Files and directories directly inside a project root.
+
+    Lookups ignore case, as a ``stat`` does on case-insensitive filesystems
+    (the macOS and Windows defaults), and return the on-disk name to open.
+    An entry spelled exactly like the marker wins over other spellings.
+    """
+
+    files: FrozenSet[str]
+    dirs: FrozenSet[str]
+    # Casefolded name -> on-disk name, for markers spelled differently.
+    folded_files: Dict[str, str]
+    folded_dirs: Dict[str, str]
+
+    def file(self, name: str) -> Optional[str]:
+        """On-disk name of the file matching *name*, or ``None``."""
+        if name in self.files:
+            return name
+        return self.folded_files.get(name.casefold())
+
+    def dir(self, name: str) -> Optional[str]:
+        """On-disk name of the directory matching *name*, or ``None``."""
+        if name in self.dirs:
+            return name
+        return self.folded_dirs.get(name.casefold())
+
+    def entry(self, name: str) -> Optional[str]:
+        """On-disk name of the file or directory matching *name*, or ``None``."""
+        return self.file(name) or self.dir(name)
+
+
+def _fold_names(names: List[str]) -> Dict[str, str]:
+    """Map casefolded names to on-disk names, first in sorted order winning."""
+    folded: Dict[str, str] = {}
+    for name in sorted(names):
+        folded.setdefault(name.casefold(), name)
+    return folded
+
+
+def _list_root(root: Path) -> _RootListing:
+    """List *root* once with ``os.scandir``.
+
+    One pass answers every marker check a detector makes, instead of one
+    ``stat`` per candidate name.  File/directory types come from the
+    directory listing itself; only symlinks need an extra ``stat``.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        files.append(entry.name)
+                    elif entry.is_dir():
+                        dirs.append(entry.name)
+                except OSError:
+                    continue
+    except OSError as exc:
+        logger.debug("Could not list %s: %s", root, exc)
+    return _RootListing(
+        frozenset(files), frozenset(dirs), _fold_names(files), _fold_names(dirs),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Root-level files read by the detectors
+# ---------------------------------------------------------------------------
+
+_COMPOSE_FILES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
+_DOCKER_FILES = ("Dockerfile",) + _COMPOSE_FILES + (".dockerignore",)
+_ENV_FILES = (".env", ".env.local", ".env.development", ".env.example")
+_AGENTS_MD_NAMES = ("AGENTS.md", "agents.md", "AGENTS.MD")
+_PYTHON_DEPENDENCY_FILES = ("requirements.txt", "pyproject.toml", "Pipfile", "setup.py")
+# (root entry, CI system), checked in order after .github/workflows.
+_CI_MARKERS = (
+    (".gitlab-ci.yml", "gitlab_ci"),
+    ("Jenkinsfile", "jenkins"),
+    (".circleci", "circleci"),
+    (".travis.yml", "travis"),
+    ("azure-pipelines.yml", "azure_devops"),
+    ("bitbucket-pipelines.yml", "bitbucket_pipelines"),
+)
+# Marker directories; every other CI marker is a file.
+_CI_DIRS = frozenset({".circleci"})
+
+# Project roots whose last analysis is kept; least recently used go first.
+_ANALYSIS_CACHE_SIZE = 32
+
+# Host part of the first remote URL in .git/config (https:// or scp-style).
+_GIT_REMOTE_HOST_RE = re.compile(r"url\s*=\s*(?:https?://|git@)([^/:\s]+)")
+
+# Fingerprint of a project root: (name, mtime_ns, size) per context entry.
+_Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
 # ---------------------------------------------------------------------------
 # ProjectAnalyzer
 # ---------------------------------------------------------------------------
@@ -169,12 +268,29 @@ class ProjectAnalyzer:
             "KAFKA_BROKERS": "kafka",
         }
 
+        # Root entries whose presence or contents feed the analysis; a change
+        # to any of them invalidates the cached result for that root.
+        self._context_names: FrozenSet[str] = frozenset(
+            [marker for marker, _ in self._language_markers]
+            + list(_DOCKER_FILES + _ENV_FILES + _AGENTS_MD_NAMES)
+            + [marker for marker, _ in _CI_MARKERS]
+            + [".git", ".github", ".mcp.json"]
+        )
+        # Resolved root -> (fingerprint, result) of the last analysis, LRU.
+        self._cache: OrderedDict[
+            Path, Tuple[_Fingerprint, ProjectAnalysisResult]
+        ] = OrderedDict()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def analyze_project(self, path: str) -> ProjectAnalysisResult:
-        """Scan *path* and return a full project analysis with recommendations."""
+        """Scan *path* and return a full project analysis with recommendations.
+
+        The result is cached per directory and reused while none of the files
+        the detectors read has changed (by name, mtime and size).
+        """
         root = Path(path).resolve()
         if not root.is_dir():
             logger.warning("Path is not a directory: %s", root)
@@ -185,17 +301,38 @@ class ProjectAnalyzer:
                 one_command_setup="Directory not found.",
             )
 
+        listing = _list_root(root)
+        fingerprint = self._fingerprint(root, listing)
+        cached = self._cache.get(root)
+        if cached is not None and cached[0] == fingerprint:
+            logger.debug("Project at %s unchanged; reusing analysis", root)
+            self._cache.move_to_end(root)
+            return cached[1].model_copy(deep=True)
+
+        result = self._analyze(root, listing)
+        self._cache[root] = (fingerprint, result.model_copy(deep=True))
+        self._cache.move_to_end(root)
+        while len(self._cache) > _ANALYSIS_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def _analyze(self, root: Path, listing: _RootListing) -> ProjectAnalysisResult:
+        """Run every detector against *root* and build recommendations.
+
+        All detectors share *listing*, so the root is read with a single
+        ``os.scandir`` and files that are absent are never opened.
+        """
         logger.info("Analyzing project at %s", root)
 
-        language = self._detect_language(root)
-        framework = self._detect_framework(root, language)
-        services = self._detect_services(root)
-        vcs, vcs_provider = self._detect_vcs(root)
-        ci_cd = self._detect_ci_cd(root)
-        has_docker = self._detect_docker(root)
-        has_mcp_config = (root / ".mcp.json").is_file()
-        env_vars = self._detect_env_vars(root)
-        agents_md = self._read_agents_md(root)
+        language = self._detect_language(root, listing)
+        framework = self._detect_framework(root, language, listing)
+        services = self._detect_services(root, listing)
+        vcs, vcs_provider = self._detect_vcs(root, listing)
+        ci_cd = self._detect_ci_cd(root, listing)
+        has_docker = self._detect_docker(root, listing)
+        has_mcp_config = listing.file(".mcp.json") is not None
+        env_vars = self._detect_env_vars(root, listing)
+        agents_md = self._read_agents_md(root, listing)
 
         context = ProjectContext(
             language=language,
@@ -379,23 +516,54 @@ class ProjectAnalyzer:
     # Detection helpers
     # ------------------------------------------------------------------
 
-    def _detect_language(self, root: Path) -> Optional[str]:
+    def _fingerprint(self, root: Path, listing: _RootListing) -> _Fingerprint:
+        """Return ``(name, mtime_ns, size)`` for each context entry in *root*.
+
+        ``.git/config`` is included as well, since the VCS provider is read
+        from it and an in-place edit does not touch ``.git`` itself.
+        """
+        names = {
+            found
+            for found in map(listing.entry, self._context_names)
+            if found is not None
+        }
+        git = listing.entry(".git")
+        if git is not None:
+            names.add(f"{git}/config")
+        stamps: List[Tuple[str, int, int]] = []
+        for name in sorted(names):
+            try:
+                st = os.stat(root / name)
+            except OSError:
+                continue
+            stamps.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def _detect_language(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> Optional[str]:
         """Return the primary language identifier or ``None``."""
+        listing = listing or _list_root(root)
         for marker, lang in self._language_markers:
-            if (root / marker).is_file():
+            if listing.file(marker) is not None:
                 logger.debug("Language marker found: %s -> %s", marker, lang)
                 # Prefer typescript over plain node when tsconfig exists
-                if lang == "node" and (root / "tsconfig.json").is_file():
+                if lang == "node" and listing.file("tsconfig.json") is not None:
                     return "typescript"
                 return lang
         return None
 
-    def _detect_framework(self, root: Path, language: Optional[str]) -> Optional[str]:
+    def _detect_framework(
+        self,
+        root: Path,
+        language: Optional[str],
+        listing: Optional[_RootListing] = None,
+    ) -> Optional[str]:
         """Detect the primary framework from dependency files."""
         if language in ("node", "typescript"):
             return self._detect_node_framework(root)
         if language == "python":
-            return self._detect_python_framework(root)
+            return self._detect_python_framework(root, listing or _list_root(root))
         return None
 
     def _detect_node_framework(self, root: Path) -> Optional[str]:
@@ -415,26 +583,16 @@ class ProjectAnalyzer:
                     return framework_name
         return None
 
-    def _detect_python_framework(self, root: Path) -> Optional[str]:
+    def _detect_python_framework(self, root: Path, listing: _RootListing) -> Optional[str]:
         """Inspect Python dependency files for known frameworks."""
         # Gather dependency text from multiple sources
         sources: List[str] = []
-
-        req_txt = _read_text(root / "requirements.txt")
-        if req_txt:
-            sources.append(req_txt)
-
-        pyproject = _read_text(root / "pyproject.toml")
-        if pyproject:
-            sources.append(pyproject)
-
-        pipfile = _read_text(root / "Pipfile")
-        if pipfile:
-            sources.append(pipfile)
-
-        setup_py = _read_text(root / "setup.py")
-        if setup_py:
-            sources.append(setup_py)
+        for name in _PYTHON_DEPENDENCY_FILES:
+            found = listing.file(name)
+            if found is not None:
+                text = _read_text(root / found)
+                if text:
+                    sources.append(text)
 
         combined = "\n".join(sources).lower()
 
@@ -444,14 +602,20 @@ class ProjectAnalyzer:
                 return framework_name
         return None
 
-    def _detect_services(self, root: Path) -> List[str]:
+    def _detect_services(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> List[str]:
         """Detect external services from docker-compose and env files."""
+        listing = listing or _list_root(root)
         services: List[str] = []
         seen: set = set()
 
         # --- docker-compose ---
-        for compose_name in ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"):
-            compose_data = _read_yaml(root / compose_name)
+        for compose_name in _COMPOSE_FILES:
+            found = listing.file(compose_name)
+            if found is None:
+                continue
+            compose_data = _read_yaml(root / found)
             if compose_data and isinstance(compose_data, dict):
                 svc_section = compose_data.get("services", {})
                 if isinstance(svc_section, dict):
@@ -470,7 +634,7 @@ class ProjectAnalyzer:
                                     seen.add(canonical)
 
         # --- Environment variable files ---
-        env_vars = self._scan_env_files(root)
+        env_vars = self._scan_env_files(root, listing)
         for var_name in env_vars:
             canonical = self._env_service_markers.get(var_name.upper())
             if canonical and canonical not in seen:
@@ -487,20 +651,22 @@ class ProjectAnalyzer:
                 return canonical
         return None
 
-    def _detect_vcs(self, root: Path) -> Tuple[Optional[str], Optional[str]]:
+    def _detect_vcs(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Return (vcs_type, provider) e.g. ('git', 'github')."""
-        if not (root / ".git").exists():
+        # ``.git`` is a directory in a clone and a file in worktrees/submodules.
+        git = (listing or _list_root(root)).entry(".git")
+        if git is None:
             return None, None
 
         provider: Optional[str] = None
 
         # Try to parse remote URL from .git/config
-        git_config_path = root / ".git" / "config"
+        git_config_path = root / git / "config"
         content = _read_text(git_config_path)
         if content:
-            remote_match = re.search(
-                r'url\s*=\s*(?:https?://|git@)([^/:\s]+)', content
-            )
+            remote_match = _GIT_REMOTE_HOST_RE.search(content)
             if remote_match:
                 host = remote_match.group(1).lower()
                 if "github" in host:
@@ -514,40 +680,33 @@ class ProjectAnalyzer:
 
         return "git", provider
 
-    def _detect_ci_cd(self, root: Path) -> Optional[str]:
+    def _detect_ci_cd(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> Optional[str]:
         """Detect CI/CD system in use."""
-        if (root / ".github" / "workflows").is_dir():
+        listing = listing or _list_root(root)
+        github = listing.dir(".github")
+        if github is not None and (root / github / "workflows").is_dir():
             return "github_actions"
-        if (root / ".gitlab-ci.yml").is_file():
-            return "gitlab_ci"
-        if (root / "Jenkinsfile").is_file():
-            return "jenkins"
-        if (root / ".circleci").is_dir():
-            return "circleci"
-        if (root / ".travis.yml").is_file():
-            return "travis"
-        if (root / "azure-pipelines.yml").is_file():
-            return "azure_devops"
-        if (root / "bitbucket-pipelines.yml").is_file():
-            return "bitbucket_pipelines"
+        for marker, system in _CI_MARKERS:
+            find = listing.dir if marker in _CI_DIRS else listing.file
+            if find(marker) is not None:
+                return system
         return None
 
-    def _detect_docker(self, root: Path) -> bool:
+    def _detect_docker(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> bool:
         """Return ``True`` if Docker files are present."""
-        docker_files = [
-            "Dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-            "compose.yml",
-            "compose.yaml",
-            ".dockerignore",
-        ]
-        return any((root / f).is_file() for f in docker_files)
+        listing = listing or _list_root(root)
+        return any(listing.file(f) is not None for f in _DOCKER_FILES)
 
-    def _detect_env_vars(self, root: Path) -> Dict[str, str]:
+    def _detect_env_vars(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> Dict[str, str]:
         """Scan env files and return detected variables with masked values."""
         env_vars: Dict[str, str] = {}
-        raw = self._scan_env_files(root)
+        raw = self._scan_env_files(root, listing or _list_root(root))
 
         for key, value in raw.items():
             if _SENSITIVE_PATTERNS.search(key):
@@ -557,13 +716,14 @@ class ProjectAnalyzer:
 
         return env_vars
 
-    def _scan_env_files(self, root: Path) -> Dict[str, str]:
+    def _scan_env_files(self, root: Path, listing: _RootListing) -> Dict[str, str]:
         """Parse .env-style files and return raw key-value pairs."""
         result: Dict[str, str] = {}
-        env_files = [".env", ".env.local", ".env.development", ".env.example"]
-
-        for env_name in env_files:
-            content = _read_text(root / env_name)
+        for env_name in _ENV_FILES:
+            found = listing.file(env_name)
+            if found is None:
+                continue
+            content = _read_text(root / found)
             if not content:
                 continue
             for line in content.splitlines():
@@ -579,12 +739,18 @@ class ProjectAnalyzer:
 
         return result
 
-    def _read_agents_md(self, root: Path) -> Optional[str]:
+    def _read_agents_md(
+        self, root: Path, listing: Optional[_RootListing] = None,
+    ) -> Optional[str]:
         """Return the contents of AGENTS.md if it exists."""
-        for name in ("AGENTS.md", "agents.md", "AGENTS.MD"):
-            content = _read_text(root / name)
+        listing = listing or _list_root(root)
+        for name in _AGENTS_MD_NAMES:
+            found = listing.file(name)
+            if found is None:
+                continue
+            content = _read_text(root / found)
             if content is not None:
-                logger.debug("Found %s", name)
+                logger.debug("Found %s", found)
                 return content
         return None
 
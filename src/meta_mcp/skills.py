@@ -10,13 +10,14 @@ Skill directories:
   - Project: .claude/skills/ (relative to project root)
 """
 
+import functools
 import logging
 import os
 import re
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import yaml
@@ -178,6 +179,18 @@ _INTENT_CATEGORY_MAP: Dict[str, List[str]] = {
     "health check": ["code-review", "quality", "testing"],
 }
 
+# Every intent keyword in one pass: the lookahead reports a match at each
+# position, so keywords nested inside longer ones ("review" in "code review")
+# are still found.  Longest alternatives first keep the match at a position
+# deterministic.
+_INTENT_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(k) for k in sorted(_INTENT_CATEGORY_MAP, key=len, reverse=True)
+    )
+    + "))"
+)
+
 # Known prompt patterns for common MCP servers (used by discover_prompts).
 _KNOWN_SERVER_PROMPTS: Dict[str, List[Dict[str, Any]]] = {
     "github": [
@@ -263,6 +276,26 @@ def _resolve_extra_skills_dirs() -> List[Path]:
     return list(get_settings().skills_extra_dirs)
 
 
+def _iter_skill_files(directory: Path) -> Iterator[Tuple[Path, Path]]:
+    """Yield ``(skill_dir, SKILL.md path)`` pairs under *directory*, by name.
+
+    Subdirectories are found with one ``os.scandir`` pass, whose entries
+    usually know their own type, instead of stat-ing every child.  Only the
+    sorted names are held; paths are built as the caller consumes them.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return
+
+    for name in names:
+        child = directory / name
+        skill_file = child / "SKILL.md"
+        if skill_file.is_file():
+            yield child, skill_file
+
+
 def _generate_frontmatter(
     name: str,
     description: str,
@@ -290,6 +323,19 @@ def _generate_frontmatter(
     return f"{FRONTMATTER_DELIMITER}\n{yaml_block}\n{FRONTMATTER_DELIMITER}"
 
 
+@functools.lru_cache(maxsize=512)
+def _expand_intent(intent_lower: str) -> FrozenSet[str]:
+    """Categories of every ``_INTENT_CATEGORY_MAP`` keyword found in *intent_lower*.
+
+    Memoised: interactive sessions repeat the same intents, and the frozen
+    result is safe to share between callers.
+    """
+    expanded: set = set()
+    for match in _INTENT_KEYWORD_RE.finditer(intent_lower):
+        expanded.update(_INTENT_CATEGORY_MAP[match.group(1)])
+    return frozenset(expanded)
+
+
 # ─── SkillsManager ───────────────────────────────────────────────────────────
 
 class SkillsManager:
@@ -330,11 +376,7 @@ class SkillsManager:
         if not intent_lower:
             return []
 
-        # Determine expanded tags from intent
-        expanded_tags: set = set()
-        for keyword, categories in _INTENT_CATEGORY_MAP.items():
-            if keyword in intent_lower:
-                expanded_tags.update(categories)
+        expanded_tags = _expand_intent(intent_lower)
 
         scored: List[tuple] = []
 
@@ -396,7 +438,8 @@ class SkillsManager:
         logger.info("search_skills(%r) returned %d results", intent, len(results))
         return results
 
-    def _score_skill(self, skill: AgentSkill, intent: str, expanded_tags: set) -> int:
+    @staticmethod
+    def _score_skill(skill: AgentSkill, intent: str, expanded_tags: set) -> int:
         """Score an AgentSkill against an intent string."""
         score = 0
         name_lower = skill.name.lower()
@@ -428,7 +471,8 @@ class SkillsManager:
 
         return score
 
-    def _score_skill_entry(self, entry: Dict[str, Any], intent: str, expanded_tags: set) -> int:
+    @staticmethod
+    def _score_skill_entry(entry: Dict[str, Any], intent: str, expanded_tags: set) -> int:
         """Score a built-in registry entry against an intent string."""
         score = 0
         name_lower = entry["name"].lower()
@@ -493,15 +537,7 @@ class SkillsManager:
     def _scan_directory(self, directory: Path, scope: SkillScope) -> List[AgentSkill]:
         """Scan *directory* for SKILL.md files and parse each one."""
         skills: List[AgentSkill] = []
-        if not directory.is_dir():
-            return skills
-
-        for child in sorted(directory.iterdir()):
-            if not child.is_dir():
-                continue
-            skill_file = child / "SKILL.md"
-            if not skill_file.is_file():
-                continue
+        for _child, skill_file in _iter_skill_files(directory):
             data = parse_skill_md(skill_file)
             if data is not None:
                 skills.append(_skill_from_frontmatter(data, scope))
@@ -722,14 +758,7 @@ class SkillsManager:
             (SkillScope.GLOBAL, self.global_dir),
             (SkillScope.PROJECT, self.project_dir),
         ]:
-            if not directory.is_dir():
-                continue
-            for child in sorted(directory.iterdir()):
-                if not child.is_dir():
-                    continue
-                skill_file = child / "SKILL.md"
-                if not skill_file.is_file():
-                    continue
+            for child, skill_file in _iter_skill_files(directory):
                 data = parse_skill_md(skill_file)
                 if data is None:
                     continue
@@ -5,18 +5,46 @@ Implements R1-R10 tool surface.
 
 import asyncio
 import json
+import threading
 from typing import Dict, List, Optional
 
+_loop_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its daemon thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="meta-mcp-tools-loop", daemon=True
+            ).start()
+        return _loop
+
+
 def run_async_safely(coro):
-    """Run an async coroutine safely, handling existing event loop conflicts."""
+    """Run an async coroutine safely, handling existing event loop conflicts.
+
+    Coroutines run on one long-lived background loop instead of a fresh
+    ``asyncio.run`` loop per call, so repeated tool calls skip loop setup and
+    teardown and loop-bound state (child processes, sessions) survives between
+    calls.
+    """
+    loop = _background_loop()
     try:
-        loop = asyncio.get_running_loop()
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        # Called from a coroutine already on the shared loop: blocking here
+        # would deadlock it, so run on a throwaway loop in a worker thread.
         import concurrent.futures
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
-            return future.result()
-    except RuntimeError:
-        return asyncio.run(coro)
+            return executor.submit(asyncio.run, coro).result()
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
 
 from .discovery import MCPDiscovery
 from .installer import MCPInstaller
@@ -79,19 +107,19 @@ class SearchMcpServersTool(Tool):
         if not result.servers:
             return f"No MCP servers found matching your criteria.\nSearch took {result.search_time_ms}ms"
 
-        content = f"Found {result.total_count} MCP servers (showing {len(result.servers)}):\n\n"
+        parts = [f"Found {result.total_count} MCP servers (showing {len(result.servers)}):\n\n"]
         for server in result.servers:
-            content += f"**{server.display_name}** (`{server.name}`)\n"
-            content += f"- Category: {server.category.value}\n"
-            content += f"- Description: {server.description}\n"
-            content += f"- Options: {len(server.options)} available\n"
+            parts.append(f"**{server.display_name}** (`{server.name}`)\n")
+            parts.append(f"- Category: {server.category.value}\n")
+            parts.append(f"- Description: {server.description}\n")
+            parts.append(f"- Options: {len(server.options)} available\n")
             if server.stars:
-                content += f"- GitHub Stars: {server.stars}\n"
+                parts.append(f"- GitHub Stars: {server.stars}\n")
             if server.repository_url:
-                content += f"- Repository: {server.repository_url}\n"
-            content += "\n"
-        content += f"Search completed in {result.search_time_ms}ms"
-        return content
+                parts.append(f"- Repository: {server.repository_url}\n")
+            parts.append("\n")
+        parts.append(f"Search completed in {result.search_time_ms}ms")
+        return "".join(parts)
 
 
 class GetServerInfoTool(Tool):
@@ -250,12 +278,12 @@ class ListInstalledServersTool(Tool):
         if not installed_servers:
             return "No MCP servers are currently installed.\n\nUse 'search_mcp_servers' to find servers to install."
 
-        content = f"**Installed MCP Servers ({len(installed_servers)}):**\n\n"
+        parts = [f"**Installed MCP Servers ({len(installed_servers)}):**\n\n"]
         for server in installed_servers:
-            content += f"**{server.display_name}** (`{server.name}`)\n"
-            content += f"- Status: {server.status.value}\n"
-            content += f"- Category: {server.category.value}\n\n"
-        return content
+            parts.append(f"**{server.display_name}** (`{server.name}`)\n")
+            parts.append(f"- Status: {server.status.value}\n")
+            parts.append(f"- Category: {server.category.value}\n\n")
+        return "".join(parts)
 
 
 class UninstallMcpServerTool(Tool):
@@ -359,6 +387,9 @@ class RefreshServerCacheTool(Tool):
 
 # ─── R3: Post-Install Verification ───────────────────────────────────────────
 
+_HEALTH_ICONS = {"healthy": "OK", "unhealthy": "FAIL", "degraded": "WARN", "unknown": "??"}
+
+
 class CheckEcosystemHealthTool(Tool):
     """Check the health of ALL configured MCP servers by probing each one. Returns status, latency, tool count, and fix suggestions for any unhealthy servers."""
 
@@ -375,26 +406,26 @@ class CheckEcosystemHealthTool(Tool):
 
         result = run_async_safely(self.verifier.check_ecosystem_health(config.mcpServers))
 
-        content = "# Ecosystem Health Report\n\n"
+        parts = ["# Ecosystem Health Report\n\n"]
         for report in result.servers:
-            icon = {"healthy": "OK", "unhealthy": "FAIL", "degraded": "WARN", "unknown": "??"}.get(report.status.value, "??")
-            content += f"[{icon}] **{report.name}**"
+            icon = _HEALTH_ICONS.get(report.status.value, "??")
+            parts.append(f"[{icon}] **{report.name}**")
             if report.latency_ms is not None:
-                content += f" ({report.latency_ms}ms)"
+                parts.append(f" ({report.latency_ms}ms)")
             if report.tools_count is not None:
-                content += f" — {report.tools_count} tools"
-            content += "\n"
+                parts.append(f" — {report.tools_count} tools")
+            parts.append("\n")
             if report.error:
-                content += f"  Error: {report.error}\n"
+                parts.append(f"  Error: {report.error}\n")
             if report.suggestion:
-                content += f"  Fix: {report.suggestion}\n"
-            content += "\n"
+                parts.append(f"  Fix: {report.suggestion}\n")
+            parts.append("\n")
 
-        content += f"**Summary:** {result.summary.get('healthy', 0)} healthy, "
-        content += f"{result.summary.get('unhealthy', 0)} unhealthy, "
-        content += f"{result.summary.get('degraded', 0)} degraded out of "
-        content += f"{sum(result.summary.values())} total"
-        return content
+        parts.append(f"**Summary:** {result.summary.get('healthy', 0)} healthy, ")
+        parts.append(f"{result.summary.get('unhealthy', 0)} unhealthy, ")
+        parts.append(f"{result.summary.get('degraded', 0)} degraded out of ")
+        parts.append(f"{sum(result.summary.values())} total")
+        return "".join(parts)
 
 
 # ─── R4: Project Context Awareness ───────────────────────────────────────────
@@ -506,13 +537,15 @@ class SearchFederatedTool(Tool):
         if not results:
             return f"No servers found across any registry for '{query}'."
 
-        content = f"# Federated Search: '{query}'\n\n"
-        content += f"Found {len(results)} servers across registries:\n\n"
+        parts = [
+            f"# Federated Search: '{query}'\n\n",
+            f"Found {len(results)} servers across registries:\n\n",
+        ]
         for r in results:
-            content += f"**{r.server}** (trust: {r.trust_score.score}/100, {r.confidence})\n"
-            content += f"  Sources: {', '.join(r.sources)}\n"
-            content += f"  {r.trust_score.explanation}\n\n"
-        return content
+            parts.append(f"**{r.server}** (trust: {r.trust_score.score}/100, {r.confidence})\n")
+            parts.append(f"  Sources: {', '.join(r.sources)}\n")
+            parts.append(f"  {r.trust_score.explanation}\n\n")
+        return "".join(parts)
 
 
 # ─── R6: Multi-Client Configuration ──────────────────────────────────────────
@@ -4,14 +4,41 @@ Base classes for Meta MCP tools following the Serena FastMCP pattern.
 
 import inspect
 import traceback
-from abc import ABC, abstractmethod
 from typing import Any, Dict, Protocol
 
 from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
 
 
-class Tool(ABC):
-    """Base class for all Meta MCP tools following Serena's pattern."""
+class Tool:
+    """Base class for all Meta MCP tools following Serena's pattern.
+
+    Subclasses are registered by tool name as they are defined, so the
+    abstract ``apply`` check happens once at class creation instead of via
+    ``ABCMeta`` on every instantiation.  Tool names must be unique.
+    """
+
+    _registry: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "apply" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must define apply")
+        name = cls.get_name_from_cls()
+        existing = Tool._registry.get(name)
+        # Redefining the same class (e.g. on module reload) replaces it.
+        if existing is not None and (
+            existing.__module__, existing.__qualname__
+        ) != (cls.__module__, cls.__qualname__):
+            raise TypeError(
+                f"Tool name {name!r} of {cls.__qualname__} is already "
+                f"registered by {existing.__module__}.{existing.__qualname__}"
+            )
+        Tool._registry[name] = cls
+
+    @classmethod
+    def get_tool_class(cls, name: str) -> type:
+        """Look up a registered tool class by its tool name."""
+        return Tool._registry[name]
     
     def __init__(self):
         """Initialize the tool."""
@@ -31,7 +58,6 @@ class Tool(ABC):
         """Get tool name."""
         return self.get_name_from_cls()
     
-    @abstractmethod
     def apply(self, **kwargs) -> str:
         """
         Apply the tool with the given arguments.
@@ -40,7 +66,6 @@ class Tool(ABC):
         It should return a string result that will be automatically
         wrapped by the FastMCP framework.
         """
-        pass
     
     def get_apply_docstring(self) -> str:
         """Get the docstring for the apply method."""
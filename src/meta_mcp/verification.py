@@ -8,14 +8,22 @@ self-healing for common failure modes and ecosystem-wide health checks.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import math
 import os
+import shlex
 import shutil
+import signal
+import sys
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from . import _json
 from .models import (
     SmokeTestResult,
     VerificationResult,
@@ -35,6 +43,28 @@ _PROTOCOL_VERSION = "2024-11-05"
 _CLIENT_INFO = {"name": "meta-mcp-verifier", "version": "0.1.0"}
 _DEFAULT_TIMEOUT = 10  # seconds
 _MAX_SELF_HEAL_ATTEMPTS = 3
+_UV_INSTALL_URL = "https://astral.sh/uv/install.sh"
+_MAX_HEALTH_CONCURRENCY = 32  # default cap on concurrent health checks
+_EXIT_GRACE = 0.3  # seconds to wait for an exit after a failed handshake
+_STDERR_READ_TIMEOUT = 2  # seconds to collect stderr from an exited process
+_TERMINATE_GRACE = 3  # seconds between SIGTERM and SIGKILL
+_KILL_WAIT = 2  # seconds to wait for a process to die after SIGKILL
+_HEAL_CACHE_SIZE = 128
+_SHARED_VERIFIERS_MAX = 8  # distinct wrapper settings kept, least recent first out
+_HEAL_CACHE_TTL = 300  # seconds a successful auto-fix verdict is reused
+_WARM_SESSION_MAX_AGE = 600  # seconds before a warm session is re-verified
+# Smoke-test argument values by JSON Schema type.  Containers are built fresh
+# per call so no two inputs share a mutable default.
+_TYPE_DEFAULTS: Dict[str, Any] = {
+    "string": "test",
+    "integer": 1,
+    "number": 1.0,
+    "boolean": True,
+}
+_CONTAINER_DEFAULTS: Dict[str, Any] = {"array": list, "object": dict}
+_SMOKE_TEST_ID = 3  # follows the initialize (1) and tools/list (2) ids
+_PING_FIRST_ID = 100  # request ids for pings, clear of the handshake ids
+_HEALTH_CHECK_METHODS = ("verify", "ping", "skip")
 
 # JSON-RPC message templates ------------------------------------------------
 
@@ -65,7 +95,12 @@ _INITIALIZED_NOTIFICATION: Dict[str, Any] = {
 # Remediation map for self-healing
 # ---------------------------------------------------------------------------
 
-_REMEDIATION_MAP: List[Tuple[List[str], str, str]] = [
+_TIMEOUT_SUGGESTION = (
+    "The server timed out during startup. It may need more time to "
+    "initialize, or a network dependency might be unreachable."
+)
+
+_REMEDIATION_MAP_RAW: List[Tuple[List[str], str, str]] = [
     # (error_patterns, category, suggestion)
     (
         ["ENOENT", "not found", "No such file"],
@@ -108,8 +143,7 @@ _REMEDIATION_MAP: List[Tuple[List[str], str, str]] = [
     (
         ["ETIMEDOUT", "timeout", "Timeout", "ETIME"],
         "timeout",
-        "The server timed out during startup. It may need more time to "
-        "initialize, or a network dependency might be unreachable.",
+        _TIMEOUT_SUGGESTION,
     ),
     (
         ["ECONNREFUSED", "Connection refused"],
@@ -120,20 +154,133 @@ _REMEDIATION_MAP: List[Tuple[List[str], str, str]] = [
 ]
 
 
+# Frozen, lowercased form of the map; matching runs on the lowercased error.
+_REMEDIATION_MAP: Tuple[Tuple[Tuple[str, ...], str, str], ...] = tuple(
+    (tuple(dict.fromkeys(p.lower() for p in patterns)), category, suggestion)
+    for patterns, category, suggestion in _REMEDIATION_MAP_RAW
+)
+
+@functools.lru_cache(maxsize=256)
+def _categorize_error(error: str) -> Optional[Tuple[str, str]]:
+    """Return ``(category, suggestion)`` for the first matching map entry.
+
+    Entries are checked in ``_REMEDIATION_MAP`` order, so when an error
+    mentions several failure classes the earliest entry wins.  Every pattern
+    is a plain literal, so substring checks decide the match without a regex.
+    Results are memoised: broken servers tend to fail with identical text.
+    """
+    low = error.lower()
+    for patterns, category, suggestion in _REMEDIATION_MAP:
+        if any(pattern in low for pattern in patterns):
+            return category, suggestion
+    return None
+
+
+# The request templates never change, so encode them once at import time.
+_INITIALIZE_BYTES = _json.dumps_line(_INITIALIZE_REQUEST)
+_TOOLS_LIST_BYTES = _json.dumps_line(_TOOLS_LIST_REQUEST)
+_INITIALIZED_BYTES = _json.dumps_line(_INITIALIZED_NOTIFICATION)
+
+# initialize -> initialized -> tools/list sent back-to-back in one write.  The
+# notification has no reply and request ids are unique, so both responses can
+# be collected afterwards and matched by id.
+_HANDSHAKE_BURST = _INITIALIZE_BYTES + _INITIALIZED_BYTES + _TOOLS_LIST_BYTES
+
+
 # ---------------------------------------------------------------------------
 # Helper: read a single JSON-RPC response from stdout
 # ---------------------------------------------------------------------------
 
+_CONTENT_LENGTH_HEADER = b"content-length:"
+_READ_CHUNK = 65536
+
+
+class _StdioFramer:
+    """Buffered reader over a server's stdout, shared by one verification run.
+
+    Keeps a single ``bytearray`` across messages and pulls data from the pipe
+    in large chunks, so frames are sliced out of one buffer instead of each
+    message being scanned and copied through the ``StreamReader``.  Lines are
+    not bound by the ``StreamReader`` line limit, which large ``tools/list``
+    responses can exceed.  Exposes the ``readline``/``readexactly`` subset of
+    ``asyncio.StreamReader`` used by the JSON-RPC helpers below.
+    """
+
+    def __init__(self, stdout: asyncio.StreamReader) -> None:
+        self._stdout = stdout
+        self._buf = bytearray()
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        """Append the next chunk to the buffer; ``False`` once at EOF."""
+        if self._eof:
+            return False
+        data = await self._stdout.read(_READ_CHUNK)
+        if not data:
+            self._eof = True
+            return False
+        if self._pos:
+            # Drop already-consumed frames before growing the buffer.
+            del self._buf[:self._pos]
+            self._pos = 0
+        self._buf += data
+        return True
+
+    def _take(self, end: int) -> bytes:
+        chunk = bytes(self._buf[self._pos:end])
+        self._pos = end
+        return chunk
+
+    async def readline(self) -> bytes:
+        """Return the next line including ``\\n``, or the tail at EOF."""
+        scanned = 0
+        while True:
+            nl = self._buf.find(b"\n", self._pos + scanned)
+            if nl != -1:
+                return self._take(nl + 1)
+            scanned = len(self._buf) - self._pos
+            if not await self._fill():
+                return self._take(len(self._buf))
+
+    async def readexactly(self, n: int) -> bytes:
+        """Return exactly *n* bytes, raising ``IncompleteReadError`` at EOF."""
+        while len(self._buf) - self._pos < n:
+            if not await self._fill():
+                raise asyncio.IncompleteReadError(self._take(len(self._buf)), n)
+        return self._take(self._pos + n)
+
+
+_Reader = Union[asyncio.StreamReader, _StdioFramer]
+
+
+async def _read_framed_response(
+    stdout: _Reader,
+    header: bytes,
+) -> bytes:
+    """Read the body of a ``Content-Length`` framed message.
+
+    *header* is the already-consumed ``Content-Length: N`` line.  Any further
+    headers are skipped up to the blank separator line, then exactly ``N``
+    bytes are read without scanning for an end-of-line.
+    """
+    length = int(header.split(b":", 1)[1].strip())
+    while (await stdout.readline()).strip():
+        pass
+    return await stdout.readexactly(length)
+
+
 async def _read_jsonrpc_response(
-    stdout: asyncio.StreamReader,
+    stdout: _Reader,
     timeout: float = _DEFAULT_TIMEOUT,
 ) -> Optional[Dict[str, Any]]:
-    """Read a single newline-delimited JSON-RPC message from *stdout*.
+    """Read a single JSON-RPC message from *stdout*.
 
     MCP stdio servers communicate via newline-delimited JSON.  We read one
     line at a time and attempt to parse it.  Non-JSON lines (e.g. log output
     sent to stdout by accident) are silently skipped so that we are resilient
-    to noisy servers.
+    to noisy servers.  Servers that use LSP-style ``Content-Length`` framing
+    are detected from the header line and their body is read in one go.
     """
     deadline = time.monotonic() + timeout
     while time.monotonic() < deadline:
@@ -152,32 +299,264 @@ async def _read_jsonrpc_response(
             # EOF – process likely exited
             break
 
-        text = line.decode("utf-8", errors="replace").strip()
-        if not text:
+        if line[:len(_CONTENT_LENGTH_HEADER)].lower() == _CONTENT_LENGTH_HEADER:
+            try:
+                line = await asyncio.wait_for(
+                    _read_framed_response(stdout, line),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+            except (ValueError, asyncio.IncompleteReadError):
+                logger.debug("Malformed Content-Length frame from server")
+                continue
+            except asyncio.TimeoutError:
+                break
+
+        if not line.strip():
             continue
 
         try:
-            msg = json.loads(text)
+            msg = _json.loads(line)
             if isinstance(msg, dict):
                 return msg
-        except json.JSONDecodeError:
+        except ValueError:
             # Likely a log line emitted on stdout – skip it.
-            logger.debug("Skipped non-JSON line from server: %s", text[:120])
+            logger.debug("Skipped non-JSON line from server: %r", line[:120])
             continue
 
     return None
 
 
+async def _read_responses(
+    stdout: _Reader,
+    ids: Tuple[int, ...],
+    timeout: float = _DEFAULT_TIMEOUT,
+) -> Dict[int, Dict[str, Any]]:
+    """Read messages until a response for every id in *ids* has arrived.
+
+    Responses are matched by ``id`` so a server may answer pipelined requests
+    in any order; notifications and unrelated messages are dropped.  *timeout*
+    bounds the whole exchange, not each message.  Stops early on timeout or
+    EOF and returns whatever was collected.
+    """
+    deadline = time.monotonic() + timeout
+    pending = set(ids)
+    responses: Dict[int, Dict[str, Any]] = {}
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        msg = await _read_jsonrpc_response(stdout, timeout=remaining)
+        if msg is None:
+            break
+        msg_id = msg.get("id")
+        if isinstance(msg_id, int) and msg_id in pending:
+            pending.discard(msg_id)
+            responses[msg_id] = msg
+    return responses
+
+
 async def _write_jsonrpc_message(
     stdin: asyncio.StreamWriter,
     message: Dict[str, Any],
 ) -> None:
     """Write a newline-delimited JSON-RPC message to *stdin*."""
-    payload = json.dumps(message) + "\n"
-    stdin.write(payload.encode("utf-8"))
+    await _write_bytes(stdin, _json.dumps_line(message))
+
+
+async def _write_bytes(
+    stdin: asyncio.StreamWriter,
+    payload: bytes,
+) -> None:
+    """Write an already-encoded JSON-RPC message to *stdin*."""
+    stdin.write(payload)
     await stdin.drain()
 
 
+# ---------------------------------------------------------------------------
+# Helper: PATH lookups cached process-wide with a TTL
+# ---------------------------------------------------------------------------
+
+_WHICH_TTL = 30.0  # seconds
+_WHICH_CACHE: Dict[Tuple[str, Optional[str]], Tuple[float, Optional[str]]] = {}
+
+
+def _cached_which(
+    command: str,
+    path: Optional[str] = None,
+    ttl: float = _WHICH_TTL,
+) -> Optional[str]:
+    """``shutil.which`` memoised per (command, PATH) for *ttl* seconds.
+
+    The cache is keyed on the effective PATH string, so a changed PATH (for
+    example after an installer extends it) is searched afresh at once.
+    """
+    if path is None:
+        path = os.environ.get("PATH", os.defpath)
+    key = (command, path)
+    now = time.monotonic()
+    cached = _WHICH_CACHE.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    resolved = shutil.which(command, path=path)
+    _WHICH_CACHE[key] = (now, resolved)
+    return resolved
+
+
+def clear_which_cache() -> None:
+    """Forget every cached PATH lookup."""
+    _WHICH_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Helper: argv for remediation commands
+# ---------------------------------------------------------------------------
+
+def _command_argv(command: str) -> List[str]:
+    """Split a configured command string into argv without invoking a shell."""
+    try:
+        argv = shlex.split(command, posix=os.name != "nt")
+    except ValueError:
+        argv = [command]
+    return argv or [command]
+
+
+# ---------------------------------------------------------------------------
+# Helper: a discovered tool's input schema
+# ---------------------------------------------------------------------------
+
+def _tool_schema(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Return *tool*'s input schema, ``{}`` if it has none or it is malformed.
+
+    ``inputSchema`` is the MCP field; some servers send ``parameters``
+    instead, and a null or empty ``inputSchema`` falls through to it.
+    """
+    schema = tool.get("inputSchema") or tool.get("parameters") or {}
+    return schema if isinstance(schema, dict) else {}
+
+
+# ---------------------------------------------------------------------------
+# Helper: read a remediation process's output without buffering all of it
+# ---------------------------------------------------------------------------
+
+# npm and puppeteer can print megabytes; only the head is ever reported.
+_OUTPUT_CAP = 4096
+
+
+async def _collect_capped(
+    stream: Optional[asyncio.StreamReader],
+    limit: int = _OUTPUT_CAP,
+) -> bytes:
+    """Read *stream* to EOF, keeping at most *limit* bytes.
+
+    Output past the cap is drained and discarded so the child never blocks
+    on a full pipe.
+    """
+    if stream is None:
+        return b""
+    data = bytearray()
+    while len(data) < limit:
+        chunk = await stream.read(limit - len(data))
+        if not chunk:
+            return bytes(data)
+        data += chunk
+    while await stream.read(_READ_CHUNK):
+        pass
+    return bytes(data)
+
+
+def _decode_head(data: Optional[bytes], chars: int = 300) -> str:
+    """Decode the first *chars* characters of *data* without decoding it all.
+
+    A UTF-8 character is at most four bytes, so ``4 * chars`` bytes always
+    cover them; a sequence split at that boundary lies past the kept text.
+    """
+    if not data:
+        return ""
+    return data[: 4 * chars].decode("utf-8", errors="replace")[:chars]
+
+
+async def _run_capped(proc: asyncio.subprocess.Process) -> Tuple[bytes, bytes]:
+    """Wait for *proc*, returning the capped heads of its stdout and stderr."""
+    stdout_data, stderr_data, _ = await asyncio.gather(
+        _collect_capped(proc.stdout),
+        _collect_capped(proc.stderr),
+        proc.wait(),
+    )
+    return stdout_data, stderr_data
+
+
+# ---------------------------------------------------------------------------
+# Helper: stop a remediation process and everything it spawned
+# ---------------------------------------------------------------------------
+
+async def _kill_process_group(proc: asyncio.subprocess.Process) -> None:
+    """SIGTERM *proc*'s process group, then SIGKILL it if it lingers.
+
+    Expects *proc* to have been started with ``start_new_session=True``;
+    where process groups are unavailable only *proc* itself is killed.
+    """
+    if proc.returncode is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2)
+                return
+            except asyncio.TimeoutError:
+                os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+        await asyncio.wait_for(proc.wait(), timeout=2)
+    except (ProcessLookupError, asyncio.TimeoutError):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Helper: kernel process state (Linux only)
+# ---------------------------------------------------------------------------
+
+# "T" stopped by job control, "t" stopped by a tracer.
+_UNRESPONSIVE_STATES = frozenset({"T", "t"})
+
+
+def _proc_state(pid: Optional[int]) -> Optional[str]:
+    """Return the one-letter state of *pid* from ``/proc``, if available."""
+    if pid is None or not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("State:"):
+                    return line.split()[1]
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Warm sessions
+# ---------------------------------------------------------------------------
+
+@dataclass
+class WarmSession:
+    """A verified server process kept alive so later checks can just ping it.
+
+    Sessions are bound to the event loop that spawned them; subprocess pipes
+    cannot be used from another loop.
+    """
+
+    process: asyncio.subprocess.Process
+    stdout: _StdioFramer
+    tools_count: int
+    started_at: float = field(default_factory=time.monotonic)
+    loop: asyncio.AbstractEventLoop = field(default_factory=asyncio.get_running_loop)
+    next_id: int = _PING_FIRST_ID
+    # Nobody reads stderr once verification ends; this task discards it so a
+    # chatty server never blocks on a full pipe.
+    stderr_drain: Optional["asyncio.Task[bytes]"] = None
+
+
 # ---------------------------------------------------------------------------
 # ServerVerifier
 # ---------------------------------------------------------------------------
@@ -195,8 +574,37 @@ class ServerVerifier:
     * Perform ecosystem-wide health checks across all configured servers.
     """
 
-    def __init__(self, timeout: float = _DEFAULT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        timeout: float = _DEFAULT_TIMEOUT,
+        max_concurrency: Optional[int] = None,
+        health_check_method: str = "verify",
+        healthy_cache_ttl: float = 0,
+    ) -> None:
+        if health_check_method not in _HEALTH_CHECK_METHODS:
+            raise ValueError(
+                f"health_check_method must be one of {_HEALTH_CHECK_METHODS}, "
+                f"got {health_check_method!r}"
+            )
         self.timeout = timeout
+        # "verify" spawns every server per check, "ping" keeps verified
+        # servers running and pings them on later checks, "skip" reports
+        # every server as unknown without probing it.
+        self.health_check_method = health_check_method
+        self.warm_sessions: Dict[str, WarmSession] = {}
+        # With a positive TTL, a healthy report is reused until it expires or
+        # the server's binary (by mtime) or config changes.  0 disables this.
+        self.healthy_cache_ttl = healthy_cache_ttl
+        self._healthy_cache: Dict[
+            str, Tuple[float, Tuple[Any, ...], ServerHealthReport]
+        ] = {}
+        # ``None`` means min(_MAX_HEALTH_CONCURRENCY, number of servers).
+        self.max_concurrency = max_concurrency
+        # (server_name, category) -> (monotonic time, self_heal result) for
+        # auto-fixes that succeeded, so a repeat failure skips the fix.
+        self._heal_cache: OrderedDict[
+            Tuple[str, str], Tuple[float, Dict[str, Any]]
+        ] = OrderedDict()
 
     # -- Public API ---------------------------------------------------------
 
@@ -206,14 +614,19 @@ class ServerVerifier:
         command: str,
         args: Optional[List[str]] = None,
         env: Optional[Dict[str, str]] = None,
+        keep_warm: bool = False,
     ) -> VerificationResult:
         """Run a complete smoke-test against a single MCP server.
 
+        With *keep_warm*, a process that completed the handshake is kept
+        running in ``warm_sessions`` instead of being terminated.
+
         Steps executed in order:
         1. Spawn the server subprocess (stdio transport).
-        2. Send ``initialize`` and validate the response.
-        3. Send ``notifications/initialized``.
-        4. Send ``tools/list`` and capture discovered tools.
+        2. Send ``initialize``, ``notifications/initialized`` and
+           ``tools/list`` in a single pipelined write.
+        3. Validate the ``initialize`` response.
+        4. Capture discovered tools from the ``tools/list`` response.
         5. If a simple tool is available, attempt to call it.
         6. Collect timing data for each phase.
         7. Terminate the process and return ``VerificationResult``.
@@ -251,12 +664,39 @@ class ServerVerifier:
 
             assert process.stdin is not None
             assert process.stdout is not None
+            stdout = _StdioFramer(process.stdout)
 
-            # ---- Step 2: MCP initialize handshake ------------------------
-            handshake_ok, handshake_err = await self._perform_handshake(
-                process.stdin, process.stdout,
+            # ---- Steps 2-4: initialize, initialized, tools/list ----------
+            # The handshake is raced against process exit so that servers
+            # crashing on startup are caught without a fixed grace sleep.
+            handshake = asyncio.ensure_future(
+                self._perform_handshake(process.stdin, stdout),
             )
+            exited = asyncio.ensure_future(process.wait())
+            try:
+                done, _ = await asyncio.wait(
+                    {handshake, exited}, return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                exited.cancel()
+                if not handshake.done():
+                    handshake.cancel()
+
+            if handshake in done:
+                handshake_ok, handshake_err, responses = handshake.result()
+            else:
+                handshake_ok, handshake_err, responses = False, None, {}
             if not handshake_ok:
+                exit_error = await self._startup_exit_error(process)
+                if exit_error:
+                    errors.append(exit_error)
+                    return self._build_result(
+                        process_started=False,
+                        mcp_handshake=False,
+                        tools_discovered=[],
+                        smoke_test=None,
+                        errors=errors,
+                    )
                 errors.append(handshake_err or "MCP handshake failed")
                 return self._build_result(
                     process_started=True,
@@ -269,19 +709,8 @@ class ServerVerifier:
             mcp_handshake = True
             logger.info("MCP handshake succeeded for '%s'", server_name)
 
-            # ---- Step 3: Send initialized notification -------------------
-            try:
-                await _write_jsonrpc_message(
-                    process.stdin, _INITIALIZED_NOTIFICATION,
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Failed to send initialized notification: %s", exc,
-                )
-
-            # ---- Step 4: Discover tools ----------------------------------
-            tools_discovered, tools_raw, tools_err = await self._discover_tools(
-                process.stdin, process.stdout,
+            tools_discovered, tools_raw, tools_err = self._discover_tools(
+                responses.get(_TOOLS_LIST_REQUEST["id"]),
             )
             if tools_err:
                 errors.append(tools_err)
@@ -297,7 +726,7 @@ class ServerVerifier:
             if tools_discovered and tools_raw:
                 smoke_test = await self._smoke_test_tool(
                     process.stdin,
-                    process.stdout,
+                    stdout,
                     tools_raw,
                     server_name,
                 )
@@ -309,8 +738,24 @@ class ServerVerifier:
             logger.exception("Unexpected error verifying '%s'", server_name)
             errors.append(f"Unexpected error: {exc}")
         finally:
-            # ---- Step 6: Terminate the process ---------------------------
-            await self._terminate_process(process)
+            # ---- Step 6: Terminate the process (or keep it warm) ---------
+            if (
+                keep_warm
+                and mcp_handshake
+                and process is not None
+                and process.returncode is None
+            ):
+                await self._evict_warm_session(server_name)
+                self.warm_sessions[server_name] = WarmSession(
+                    process=process,
+                    stdout=stdout,
+                    tools_count=len(tools_discovered),
+                    stderr_drain=asyncio.ensure_future(
+                        _collect_capped(process.stderr, limit=0)
+                    ),
+                )
+            else:
+                await self._terminate_process(process)
 
         elapsed_ms = int((time.monotonic() - overall_start) * 1000)
         logger.info(
@@ -327,6 +772,50 @@ class ServerVerifier:
             errors=errors,
         )
 
+    async def fast_ping(self, server_name: str) -> bool:
+        """Send ``ping`` over a warm session and report whether it answered.
+
+        Sessions that are stale, dead, from another event loop, or that fail
+        to answer are evicted, so a ``False`` result means the caller should
+        fall back to a full ``verify_server``.
+        """
+        session = self.warm_sessions.get(server_name)
+        if session is None:
+            return False
+        if (
+            session.loop is not asyncio.get_running_loop()
+            or session.process.returncode is not None
+            or time.monotonic() - session.started_at > _WARM_SESSION_MAX_AGE
+        ):
+            await self._evict_warm_session(server_name)
+            return False
+
+        request_id = session.next_id
+        session.next_id += 1
+        responses: Dict[int, Dict[str, Any]] = {}
+        try:
+            assert session.process.stdin is not None
+            await _write_jsonrpc_message(
+                session.process.stdin,
+                {"jsonrpc": "2.0", "id": request_id, "method": "ping"},
+            )
+            responses = await _read_responses(
+                session.stdout, (request_id,), timeout=self.timeout,
+            )
+        except Exception as exc:
+            logger.debug("Ping to warm session '%s' failed: %s", server_name, exc)
+
+        response = responses.get(request_id)
+        if response is None or "error" in response:
+            await self._evict_warm_session(server_name)
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Terminate every warm session."""
+        for name in list(self.warm_sessions):
+            await self._evict_warm_session(name)
+
     async def self_heal(
         self,
         server_name: str,
@@ -341,25 +830,39 @@ class ServerVerifier:
         * ``auto_fix_attempted`` – whether an automatic fix was tried.
         * ``auto_fix_result`` – outcome of the auto-fix (if attempted).
         """
-        error_lower = error.lower()
-
-        # Walk through the remediation map and find first match.
-        for patterns, category, suggestion in _REMEDIATION_MAP:
-            if any(p.lower() in error_lower for p in patterns):
-                logger.info(
-                    "Self-heal matched category '%s' for server '%s'",
-                    category,
-                    server_name,
-                )
-                auto_fix_attempted, auto_fix_result = await self._attempt_auto_fix(
-                    category, command, server_name, error,
-                )
-                return {
-                    "category": category,
-                    "suggestion": suggestion,
-                    "auto_fix_attempted": auto_fix_attempted,
-                    "auto_fix_result": auto_fix_result,
-                }
+        match = _categorize_error(error)
+        if match is not None:
+            category, suggestion = match
+            logger.info(
+                "Self-heal matched category '%s' for server '%s'",
+                category,
+                server_name,
+            )
+            key = (server_name, category)
+            cached = self._heal_cache.get(key)
+            if cached is not None:
+                stored_at, cached_result = cached
+                if time.monotonic() - stored_at < _HEAL_CACHE_TTL:
+                    self._heal_cache.move_to_end(key)
+                    return dict(cached_result)
+                del self._heal_cache[key]
+
+            auto_fix_attempted, auto_fix_result = await self._attempt_auto_fix(
+                category, command, server_name, error,
+            )
+            result = {
+                "category": category,
+                "suggestion": suggestion,
+                "auto_fix_attempted": auto_fix_attempted,
+                "auto_fix_result": auto_fix_result,
+            }
+            if auto_fix_attempted:
+                # An auto-fix may have installed binaries; re-resolve them.
+                clear_which_cache()
+                self._heal_cache[key] = (time.monotonic(), dict(result))
+                if len(self._heal_cache) > _HEAL_CACHE_SIZE:
+                    self._heal_cache.popitem(last=False)
+            return result
 
         logger.warning(
             "No remediation match for server '%s', error: %s",
@@ -387,29 +890,87 @@ class ServerVerifier:
         Iterates over all servers in the provided MCP configuration, runs
         ``verify_server`` for each, and aggregates the results into an
         ``EcosystemHealthResult``.
+
+        The run is bounded by ``_health_deadline``.  A server still being
+        probed at the deadline is reported as timed out.  Auto-fixes share
+        the same budget: one still running is cancelled, and its servers keep
+        their probe result and remediation advice.
         """
         reports: List[ServerHealthReport] = []
+        # One wall-clock stamp per run; per-server latency uses monotonic().
+        checked_at = datetime.now()
 
         if not config:
             logger.info("No servers configured – ecosystem is trivially healthy")
             return EcosystemHealthResult(
                 servers=[],
                 summary={"healthy": 0, "unhealthy": 0, "degraded": 0, "unknown": 0},
-                checked_at=datetime.now(),
+                checked_at=checked_at,
             )
 
-        # Run verification for each server concurrently (bounded).
-        semaphore = asyncio.Semaphore(4)  # at most 4 concurrent checks
-
-        async def _check_one(name: str, entry: MCPConfigEntry) -> ServerHealthReport:
-            async with semaphore:
-                return await self._check_single_server_health(name, entry)
-
-        tasks = [
-            _check_one(name, entry)
-            for name, entry in config.items()
-        ]
-        reports = await asyncio.gather(*tasks, return_exceptions=False)
+        # Servers sharing a command and failure category share one self-heal
+        # (and so at most one auto-fix) per run.
+        heal_tasks: Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"] = {}
+        # Reports of servers whose probe finished but whose heal is pending,
+        # used if the deadline cuts the heal short.
+        probed: Dict[str, ServerHealthReport] = {}
+
+        # Run verification for each server concurrently.  A semaphore is only
+        # needed when there are more servers than the concurrency limit.
+        limit = self.max_concurrency or min(_MAX_HEALTH_CONCURRENCY, len(config))
+        if len(config) <= limit:
+            checks = [
+                self._check_single_server_health(name, entry, heal_tasks, probed)
+                for name, entry in config.items()
+            ]
+        else:
+            semaphore = asyncio.Semaphore(limit)
+
+            async def _check_one(
+                name: str, entry: MCPConfigEntry,
+            ) -> ServerHealthReport:
+                async with semaphore:
+                    return await self._check_single_server_health(
+                        name, entry, heal_tasks, probed,
+                    )
+
+            checks = [_check_one(name, entry) for name, entry in config.items()]
+
+        # Bound the total wall time so one hung server or slow auto-fix
+        # cannot hold back the rest.
+        deadline = self._health_deadline(math.ceil(len(config) / limit))
+        tasks = [asyncio.ensure_future(check) for check in checks]
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            # Heals are shielded from their checks, so stop them explicitly;
+            # this also runs when the caller cancels the whole check.
+            unfinished = [t for t in tasks if not t.done()]
+            unfinished += [t for t in heal_tasks.values() if not t.done()]
+            for task in unfinished:
+                task.cancel()
+            # Let cancelled checks terminate their server processes.
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+        for name, task in zip(config, tasks):
+            if task in pending:
+                # Cut off mid-check; a verify may have left the server warm.
+                await self._evict_warm_session(name)
+                self._healthy_cache.pop(name, None)
+                report = probed.get(name) or self._timeout_report(name, deadline)
+            elif task.exception() is not None:
+                # One crashed check must not poison the whole result set.
+                logger.error(
+                    "Health check for '%s' raised: %s", name, task.exception(),
+                )
+                report = ServerHealthReport(
+                    name=name,
+                    status=HealthStatus.UNKNOWN,
+                    error=f"Health check exception: {task.exception()}",
+                )
+            else:
+                report = task.result()
+            reports.append(report)
 
         # Build summary counts.
         summary: Dict[str, int] = {
@@ -431,11 +992,32 @@ class ServerVerifier:
         return EcosystemHealthResult(
             servers=list(reports),
             summary=summary,
-            checked_at=datetime.now(),
+            checked_at=checked_at,
         )
 
     # -- Internal helpers ---------------------------------------------------
 
+    def _health_deadline(self, batches: int) -> float:
+        """Wall-clock bound on an ecosystem check run in *batches* waves.
+
+        Each wave gets one ``timeout`` per probe phase: spawn, handshake and
+        smoke test, plus a ping first in "ping" mode.  Auto-fixes must fit in
+        the same budget; terminating cut-off servers comes on top.
+        """
+        phases = 4 if self.health_check_method == "ping" else 3
+        return self.timeout * phases * batches
+
+    @staticmethod
+    def _timeout_report(name: str, deadline: float) -> ServerHealthReport:
+        """Report for a server still being probed when the deadline passed."""
+        logger.error("Health check for '%s' timed out", name)
+        return ServerHealthReport(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            error=f"Health check timed out after {deadline:g}s",
+            suggestion=_TIMEOUT_SUGGESTION,
+        )
+
     async def _spawn_process(
         self,
         command: str,
@@ -447,13 +1029,13 @@ class ServerVerifier:
         Returns ``(process, None)`` on success, or ``(None, error_msg)`` on
         failure.
         """
-        # Build the environment: inherit the current env and overlay extras.
-        full_env = os.environ.copy()
-        if env:
-            full_env.update(env)
+        # Build the environment only when there is something to overlay;
+        # with ``env=None`` the child inherits ours without a copy.
+        full_env = {**os.environ, **env} if env else None
+        search_path = (full_env or os.environ).get("PATH")
 
         # Verify the command binary exists before spawning.
-        resolved = shutil.which(command, path=full_env.get("PATH"))
+        resolved = self._which(command, search_path)
         if resolved is None:
             msg = (
                 f"Command '{command}' not found on PATH. "
@@ -474,27 +1056,6 @@ class ServerVerifier:
                 ),
                 timeout=self.timeout,
             )
-            # Give the process a moment to crash immediately on startup.
-            await asyncio.sleep(0.3)
-            if process.returncode is not None:
-                stderr_bytes = b""
-                if process.stderr:
-                    try:
-                        stderr_bytes = await asyncio.wait_for(
-                            process.stderr.read(4096), timeout=2,
-                        )
-                    except asyncio.TimeoutError:
-                        pass
-                stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
-                msg = (
-                    f"Server process exited immediately with code "
-                    f"{process.returncode}"
-                )
-                if stderr_text:
-                    msg += f": {stderr_text[:500]}"
-                logger.error(msg)
-                return None, msg
-
             return process, None
 
         except asyncio.TimeoutError:
@@ -513,22 +1074,119 @@ class ServerVerifier:
             logger.error(msg)
             return None, msg
 
+    async def _evict_warm_session(self, server_name: str) -> None:
+        """Drop a warm session and stop its process."""
+        session = self.warm_sessions.pop(server_name, None)
+        if session is None:
+            return
+        if session.loop is asyncio.get_running_loop():
+            if session.stderr_drain is not None:
+                session.stderr_drain.cancel()
+                await asyncio.gather(session.stderr_drain, return_exceptions=True)
+            await self._terminate_process(session.process)
+            return
+        # The drain task ends by itself once the killed process closes stderr.
+        try:
+            session.process.kill()
+        except Exception:
+            pass  # The owning loop is gone; best effort only.
+
+    async def _startup_exit_error(
+        self,
+        process: asyncio.subprocess.Process,
+    ) -> Optional[str]:
+        """Describe a process that exited during startup.
+
+        Returns ``None`` if the process is still running after a short grace
+        period, i.e. the failure was not caused by an early exit.
+        """
+        if process.returncode is None:
+            try:
+                await asyncio.wait_for(process.wait(), timeout=_EXIT_GRACE)
+            except asyncio.TimeoutError:
+                return None
+
+        stderr_bytes = b""
+        if process.stderr:
+            try:
+                stderr_bytes = await asyncio.wait_for(
+                    process.stderr.read(4096), timeout=_STDERR_READ_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                pass
+        stderr_text = stderr_bytes.decode("utf-8", errors="replace").strip()
+        msg = (
+            f"Server process exited immediately with code "
+            f"{process.returncode}"
+        )
+        if stderr_text:
+            msg += f": {stderr_text[:500]}"
+        logger.error(msg)
+        return msg
+
+    def _health_signature(
+        self,
+        entry: MCPConfigEntry,
+    ) -> Optional[Tuple[Any, ...]]:
+        """Fingerprint what a health check depends on: binary and config.
+
+        Returns ``None`` when the binary cannot be resolved or stat'ed, in
+        which case nothing is cached.
+        """
+        env = entry.env or {}
+        search_path = env.get("PATH", os.environ.get("PATH"))
+        resolved = self._which(entry.command, search_path)
+        if resolved is None:
+            return None
+        try:
+            mtime = os.stat(resolved).st_mtime_ns
+        except OSError:
+            return None
+        return (
+            resolved,
+            mtime,
+            tuple(entry.args),
+            entry.cwd,
+            tuple(sorted(env.items())),
+        )
+
+    def _which(self, command: str, path: Optional[str]) -> Optional[str]:
+        """Resolve *command* against *path* via the shared which-cache.
+
+        Commands given as a path are checked directly; PATH is not searched.
+        """
+        if os.sep in command or (os.altsep and os.altsep in command):
+            if os.path.isfile(command) and os.access(command, os.X_OK):
+                return command
+            return None
+        return _cached_which(command, path)
+
     async def _perform_handshake(
         self,
         stdin: asyncio.StreamWriter,
-        stdout: asyncio.StreamReader,
-    ) -> Tuple[bool, Optional[str]]:
-        """Send the ``initialize`` request and validate the response."""
+        stdout: _Reader,
+    ) -> Tuple[bool, Optional[str], Dict[int, Dict[str, Any]]]:
+        """Pipeline the handshake and ``tools/list``, then validate ``initialize``.
+
+        Returns ``(ok, error, responses)`` where *responses* maps request ids
+        to the responses collected, so the ``tools/list`` reply can be parsed
+        without another round trip.
+        """
         try:
-            await _write_jsonrpc_message(stdin, _INITIALIZE_REQUEST)
+            await _write_bytes(stdin, _HANDSHAKE_BURST)
         except Exception as exc:
-            return False, f"Failed to send initialize request: {exc}"
+            return False, f"Failed to send initialize request: {exc}", {}
 
-        response = await _read_jsonrpc_response(stdout, timeout=self.timeout)
+        responses = await _read_responses(
+            stdout,
+            (_INITIALIZE_REQUEST["id"], _TOOLS_LIST_REQUEST["id"]),
+            timeout=self.timeout,
+        )
+        response = responses.get(_INITIALIZE_REQUEST["id"])
         if response is None:
             return False, (
                 "No response to initialize request (timeout or process exited)"
-            )
+            ), responses
 
         # Validate the response structure.
         if "error" in response:
@@ -536,14 +1194,14 @@ class ServerVerifier:
             return False, (
                 f"Server returned error on initialize: "
                 f"{err.get('message', err)}"
-            )
+            ), responses
 
         result = response.get("result")
         if not isinstance(result, dict):
             return False, (
                 f"Invalid initialize response: expected 'result' dict, "
                 f"got {type(result).__name__}"
-            )
+            ), responses
 
         # Check for required fields.
         protocol_version = result.get("protocolVersion")
@@ -559,20 +1217,13 @@ class ServerVerifier:
             protocol_version or "unknown",
         )
 
-        return True, None
+        return True, None, responses
 
-    async def _discover_tools(
+    def _discover_tools(
         self,
-        stdin: asyncio.StreamWriter,
-        stdout: asyncio.StreamReader,
+        response: Optional[Dict[str, Any]],
     ) -> Tuple[List[str], List[Dict[str, Any]], Optional[str]]:
-        """Send ``tools/list`` and return (tool_names, raw_tools, error)."""
-        try:
-            await _write_jsonrpc_message(stdin, _TOOLS_LIST_REQUEST)
-        except Exception as exc:
-            return [], [], f"Failed to send tools/list request: {exc}"
-
-        response = await _read_jsonrpc_response(stdout, timeout=self.timeout)
+        """Parse the ``tools/list`` response into (tool_names, raw_tools, error)."""
         if response is None:
             return [], [], "No response to tools/list request"
 
@@ -598,7 +1249,7 @@ class ServerVerifier:
     async def _smoke_test_tool(
         self,
         stdin: asyncio.StreamWriter,
-        stdout: asyncio.StreamReader,
+        stdout: _Reader,
         tools_raw: List[Dict[str, Any]],
         server_name: str,
     ) -> Optional[SmokeTestResult]:
@@ -621,7 +1272,7 @@ class ServerVerifier:
 
         call_request: Dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": 3,
+            "id": _SMOKE_TEST_ID,
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -632,7 +1283,10 @@ class ServerVerifier:
         start = time.monotonic()
         try:
             await _write_jsonrpc_message(stdin, call_request)
-            response = await _read_jsonrpc_response(stdout, timeout=self.timeout)
+            responses = await _read_responses(
+                stdout, (_SMOKE_TEST_ID,), timeout=self.timeout,
+            )
+            response = responses.get(_SMOKE_TEST_ID)
             latency_ms = int((time.monotonic() - start) * 1000)
 
             if response is None:
@@ -683,42 +1337,28 @@ class ServerVerifier:
         2. Tools whose only required parameter is a simple string.
         3. Fall back to the first tool if nothing else matches.
         """
-        zero_params: List[Dict[str, Any]] = []
-        simple_string: List[Dict[str, Any]] = []
+        simple_string: Optional[Dict[str, Any]] = None
 
         for tool in tools_raw:
             if not isinstance(tool, dict):
                 continue
-            schema = tool.get("inputSchema", tool.get("parameters", {}))
-            if not isinstance(schema, dict):
-                schema = {}
-
-            properties = schema.get("properties", {})
+            schema = _tool_schema(tool)
             required = schema.get("required", [])
-
-            if not required and not properties:
-                # No parameters at all – best candidate.
-                zero_params.append(tool)
-                continue
-
             if not required:
-                zero_params.append(tool)
-                continue
-
-            # Check if all required params are simple strings.
-            all_simple = True
-            for req_name in required:
-                prop = properties.get(req_name, {})
-                if prop.get("type") != "string":
-                    all_simple = False
-                    break
-            if all_simple and len(required) <= 2:
-                simple_string.append(tool)
-
-        if zero_params:
-            return zero_params[0]
-        if simple_string:
-            return simple_string[0]
+                # No required parameters – best candidate, stop scanning.
+                return tool
+
+            if simple_string is None and len(required) <= 2:
+                # Check if all required params are simple strings.
+                properties = schema.get("properties", {})
+                if all(
+                    properties.get(req_name, {}).get("type") == "string"
+                    for req_name in required
+                ):
+                    simple_string = tool
+
+        if simple_string is not None:
+            return simple_string
         if tools_raw:
             return tools_raw[0]
         return None
@@ -728,33 +1368,19 @@ class ServerVerifier:
         tool: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Build a minimal test input for the given tool schema."""
-        schema = tool.get("inputSchema", tool.get("parameters", {}))
-        if not isinstance(schema, dict):
-            return {}
-
+        schema = _tool_schema(tool)
         properties = schema.get("properties", {})
         required = schema.get("required", [])
         test_input: Dict[str, Any] = {}
 
         for param_name in required:
-            prop = properties.get(param_name, {})
-            param_type = prop.get("type", "string")
-
-            if param_type == "string":
-                # Use a sensible default test value.
-                test_input[param_name] = "test"
-            elif param_type == "integer":
-                test_input[param_name] = 1
-            elif param_type == "number":
-                test_input[param_name] = 1.0
-            elif param_type == "boolean":
-                test_input[param_name] = True
-            elif param_type == "array":
-                test_input[param_name] = []
-            elif param_type == "object":
-                test_input[param_name] = {}
-            else:
-                test_input[param_name] = "test"
+            param_type = properties.get(param_name, {}).get("type", "string")
+            if not isinstance(param_type, str):
+                param_type = "string"  # e.g. ["string", "null"] unions
+            factory = _CONTAINER_DEFAULTS.get(param_type)
+            test_input[param_name] = (
+                factory() if factory else _TYPE_DEFAULTS.get(param_type, "test")
+            )
 
         return test_input
 
@@ -771,9 +1397,16 @@ class ServerVerifier:
 
         logger.debug("Terminating server process (pid=%s)", process.pid)
         try:
+            if _proc_state(process.pid) in _UNRESPONSIVE_STATES:
+                # A stopped process will not act on SIGTERM until resumed,
+                # so skip the graceful window.
+                logger.debug("Process %s is stopped, sending SIGKILL", process.pid)
+                process.kill()
+                await asyncio.wait_for(process.wait(), timeout=_KILL_WAIT)
+                return
             process.terminate()
             try:
-                await asyncio.wait_for(process.wait(), timeout=3)
+                await asyncio.wait_for(process.wait(), timeout=_TERMINATE_GRACE)
             except asyncio.TimeoutError:
                 logger.warning(
                     "Process did not exit after SIGTERM, sending SIGKILL "
@@ -781,7 +1414,7 @@ class ServerVerifier:
                     process.pid,
                 )
                 process.kill()
-                await asyncio.wait_for(process.wait(), timeout=2)
+                await asyncio.wait_for(process.wait(), timeout=_KILL_WAIT)
         except ProcessLookupError:
             pass  # Already gone.
         except Exception as exc:
@@ -867,8 +1500,9 @@ class ServerVerifier:
         command: str,
     ) -> Tuple[bool, Optional[str]]:
         """Check if the binary exists and provide targeted advice."""
+        command = _command_argv(command)[0]
         # Check common package managers.
-        which_result = shutil.which(command)
+        which_result = _cached_which(command)
         if which_result:
             return False, (
                 f"Binary '{command}' found at {which_result} but the server "
@@ -878,7 +1512,7 @@ class ServerVerifier:
 
         # Try to detect if it is an npx-style command.
         if command == "npx" or command == "node":
-            node_path = shutil.which("node")
+            node_path = _cached_which("node")
             if node_path is None:
                 return False, (
                     "Node.js is not installed. Install it from "
@@ -904,7 +1538,7 @@ class ServerVerifier:
         error: str,
     ) -> Tuple[bool, Optional[str]]:
         """Attempt ``npm install`` to restore missing Node modules."""
-        npm_path = shutil.which("npm")
+        npm_path = _cached_which("npm")
         if npm_path is None:
             return False, (
                 "npm is not installed. Install Node.js from "
@@ -913,33 +1547,42 @@ class ServerVerifier:
 
         # Try a global npm install if we can extract the package name.
         # This is a best-effort approach.
+        package = _command_argv(command)[0]
+        if package.startswith("-"):
+            return False, f"Refusing to pass '{package}' to npm as a package name."
+        proc: Optional[asyncio.subprocess.Process] = None
         try:
             proc = await asyncio.create_subprocess_exec(
-                "npm", "install", "-g", command,
-                stdout=asyncio.subprocess.PIPE,
+                "npm", "install", "-g", package,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
             )
-            stdout_data, stderr_data = await asyncio.wait_for(
-                proc.communicate(), timeout=60,
+            _, stderr_data = await asyncio.wait_for(
+                _run_capped(proc), timeout=60,
             )
             if proc.returncode == 0:
                 return True, (
-                    f"Successfully ran 'npm install -g {command}'. "
+                    f"Successfully ran 'npm install -g {package}'. "
                     "Try verifying the server again."
                 )
             else:
-                stderr_text = stderr_data.decode("utf-8", errors="replace")
                 return False, (
-                    f"'npm install -g {command}' failed: {stderr_text[:300]}"
+                    f"'npm install -g {package}' failed: "
+                    f"{_decode_head(stderr_data)}"
                 )
         except asyncio.TimeoutError:
             return False, "npm install timed out after 60 seconds"
         except Exception as exc:
             return False, f"Failed to run npm install: {exc}"
+        finally:
+            # Also reached on cancellation, which the handlers above miss.
+            if proc is not None and proc.returncode is None:
+                await _kill_process_group(proc)
 
     async def _fix_missing_browser(self) -> Tuple[bool, Optional[str]]:
         """Attempt to install Chromium via puppeteer."""
-        npx_path = shutil.which("npx")
+        npx_path = _cached_which("npx")
         if npx_path is None:
             return False, (
                 "npx is not available. Install Node.js from "
@@ -947,14 +1590,16 @@ class ServerVerifier:
                 "'npx puppeteer install chromium'."
             )
 
+        proc: Optional[asyncio.subprocess.Process] = None
         try:
             proc = await asyncio.create_subprocess_exec(
                 "npx", "puppeteer", "install", "chromium",
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
             )
-            stdout_data, stderr_data = await asyncio.wait_for(
-                proc.communicate(), timeout=120,
+            _, stderr_data = await asyncio.wait_for(
+                _run_capped(proc), timeout=120,
             )
             if proc.returncode == 0:
                 return True, (
@@ -962,22 +1607,25 @@ class ServerVerifier:
                     "Try verifying the server again."
                 )
             else:
-                stderr_text = stderr_data.decode("utf-8", errors="replace")
                 return False, (
                     f"'npx puppeteer install chromium' failed: "
-                    f"{stderr_text[:300]}"
+                    f"{_decode_head(stderr_data)}"
                 )
         except asyncio.TimeoutError:
             return False, "Chromium installation timed out after 120 seconds"
         except Exception as exc:
             return False, f"Failed to install Chromium: {exc}"
+        finally:
+            # Also reached on cancellation, which the handlers above miss.
+            if proc is not None and proc.returncode is None:
+                await _kill_process_group(proc)
 
     async def _fix_permission(
         self,
         command: str,
     ) -> Tuple[bool, Optional[str]]:
         """Suggest permission fixes without running dangerous commands."""
-        which_result = shutil.which(command)
+        which_result = _cached_which(_command_argv(command)[0])
         if which_result:
             return False, (
                 f"Binary found at '{which_result}'. Try running: "
@@ -990,7 +1638,7 @@ class ServerVerifier:
 
     async def _try_install_uv(self) -> Tuple[bool, Optional[str]]:
         """Attempt to install uv (which provides uvx)."""
-        curl_path = shutil.which("curl")
+        curl_path = _cached_which("curl")
         if curl_path is None:
             return False, (
                 "uv/uvx is not installed and 'curl' is not available to "
@@ -998,41 +1646,130 @@ class ServerVerifier:
                 "https://docs.astral.sh/uv/"
             )
 
+        # curl | sh as two processes joined by a pipe, without a parent shell.
+        # Each gets its own session so a timeout can kill the whole group.
+        procs: List[asyncio.subprocess.Process] = []
         try:
-            proc = await asyncio.create_subprocess_shell(
-                "curl -LsSf https://astral.sh/uv/install.sh | sh",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout_data, stderr_data = await asyncio.wait_for(
-                proc.communicate(), timeout=60,
+            read_fd, write_fd = os.pipe()
+            try:
+                curl = await asyncio.create_subprocess_exec(
+                    curl_path, "-LsSf", _UV_INSTALL_URL,
+                    stdout=write_fd,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                )
+                procs.append(curl)
+                sh = await asyncio.create_subprocess_exec(
+                    "sh",
+                    stdin=read_fd,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True,
+                )
+                procs.append(sh)
+            finally:
+                os.close(write_fd)
+                os.close(read_fd)
+
+            (_, curl_stderr), (_, sh_stderr) = await asyncio.wait_for(
+                asyncio.gather(curl.communicate(), sh.communicate()),
+                timeout=60,
             )
-            if proc.returncode == 0:
+            if curl.returncode != 0:
+                return False, (
+                    "Downloading the uv installer failed: "
+                    f"{_decode_head(curl_stderr)}"
+                )
+            if sh.returncode == 0:
                 return True, (
                     "Successfully installed uv/uvx. You may need to "
                     "restart your shell or source your profile for the "
                     "PATH changes to take effect."
                 )
             else:
-                stderr_text = stderr_data.decode("utf-8", errors="replace")
                 return False, (
-                    f"uv installer failed: {stderr_text[:300]}"
+                    f"uv installer failed: {_decode_head(sh_stderr)}"
                 )
         except asyncio.TimeoutError:
             return False, "uv installation timed out after 60 seconds"
         except Exception as exc:
             return False, f"Failed to install uv: {exc}"
+        finally:
+            # Also reached on cancellation, which the handlers above miss.
+            for proc in procs:
+                if proc.returncode is None:
+                    await _kill_process_group(proc)
 
     # -- Ecosystem health helpers ------------------------------------------
 
+    async def _shared_self_heal(
+        self,
+        server_name: str,
+        error: str,
+        command: str,
+        heal_tasks: Optional[
+            Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"]
+        ],
+    ) -> Dict[str, Any]:
+        """``self_heal`` deduplicated by (category, command) via *heal_tasks*.
+
+        Unrecognised errors are not shared: their suggestion quotes the
+        server name and error text.
+        """
+        match = _categorize_error(error) if heal_tasks is not None else None
+        if match is None:
+            return await self.self_heal(server_name, error, command)
+        key = (match[0], command)
+        heal = heal_tasks.get(key)
+        if heal is None:
+            heal = heal_tasks[key] = asyncio.ensure_future(
+                self.self_heal(server_name, error, command),
+            )
+        # Shielded so one cancelled check does not abort the others' heal.
+        return dict(await asyncio.shield(heal))
+
     async def _check_single_server_health(
         self,
         name: str,
         entry: MCPConfigEntry,
+        heal_tasks: Optional[
+            Dict[Tuple[str, str], "asyncio.Future[Dict[str, Any]]"]
+        ] = None,
+        probed: Optional[Dict[str, ServerHealthReport]] = None,
     ) -> ServerHealthReport:
-        """Verify a single server and produce a ``ServerHealthReport``."""
+        """Verify a single server and produce a ``ServerHealthReport``.
+
+        *heal_tasks* is shared across one ecosystem check so that servers
+        failing the same way run ``self_heal`` only once.  Before healing,
+        the report is stored in *probed* in case the heal is cut short.
+        """
+        if self.health_check_method == "skip":
+            return ServerHealthReport(
+                name=name,
+                status=HealthStatus.UNKNOWN,
+                suggestion="Health probing is disabled (health_check_method='skip').",
+            )
+
         start = time.monotonic()
-        suggestion: Optional[str] = None
+        keep_warm = self.health_check_method == "ping"
+
+        signature = self._health_signature(entry) if self.healthy_cache_ttl else None
+        cached = self._healthy_cache.get(name)
+        if (
+            cached is not None
+            and signature is not None
+            and cached[1] == signature
+            and start - cached[0] < self.healthy_cache_ttl
+        ):
+            return cached[2].model_copy()
+
+        if keep_warm and await self.fast_ping(name):
+            return ServerHealthReport(
+                name=name,
+                status=HealthStatus.HEALTHY,
+                latency_ms=int((time.monotonic() - start) * 1000),
+                tools_count=self.warm_sessions[name].tools_count,
+            )
 
         try:
             result = await self.verify_server(
@@ -1040,8 +1777,8 @@ class ServerVerifier:
                 command=entry.command,
                 args=entry.args,
                 env=entry.env,
+                keep_warm=keep_warm,
             )
-
             latency_ms = int((time.monotonic() - start) * 1000)
 
             if result.verdict == "fully_operational":
@@ -1054,26 +1791,38 @@ class ServerVerifier:
                 status = HealthStatus.UNHEALTHY
                 error = "; ".join(result.errors) if result.errors else "Verification failed"
 
-            # If unhealthy or degraded, run self-heal to get a suggestion.
-            if status in (HealthStatus.UNHEALTHY, HealthStatus.DEGRADED) and error:
-                heal_result = await self.self_heal(
-                    server_name=name,
-                    error=error,
-                    command=entry.command,
-                )
-                suggestion = heal_result.get("suggestion")
+            if status is not HealthStatus.HEALTHY:
+                # Only fully healthy servers may be answered by a ping later.
+                await self._evict_warm_session(name)
+                self._healthy_cache.pop(name, None)
 
-            return ServerHealthReport(
+            report = ServerHealthReport(
                 name=name,
                 status=status,
                 latency_ms=latency_ms,
                 tools_count=len(result.tools_discovered),
                 error=error,
-                suggestion=suggestion,
             )
 
+            # If unhealthy or degraded, run self-heal to get a suggestion.
+            if status in (HealthStatus.UNHEALTHY, HealthStatus.DEGRADED) and error:
+                if probed is not None:
+                    match = _categorize_error(error)
+                    probed[name] = report.model_copy(
+                        update={"suggestion": match[1] if match else None},
+                    )
+                heal_result = await self._shared_self_heal(
+                    name, error, entry.command, heal_tasks,
+                )
+                report.suggestion = heal_result.get("suggestion")
+
+            if status is HealthStatus.HEALTHY and signature is not None:
+                self._healthy_cache[name] = (start, signature, report.model_copy())
+            return report
+
         except Exception as exc:
             latency_ms = int((time.monotonic() - start) * 1000)
+            self._healthy_cache.pop(name, None)
             logger.exception("Health check failed for '%s'", name)
             return ServerHealthReport(
                 name=name,
@@ -1089,6 +1838,33 @@ class ServerVerifier:
 # Module-level convenience functions
 # ---------------------------------------------------------------------------
 
+# Shared verifiers, so the heal cache survives between wrapper calls.
+_VERIFIERS: OrderedDict[Tuple[float, Optional[int]], ServerVerifier] = OrderedDict()
+
+
+def _get_verifier(
+    timeout: float = _DEFAULT_TIMEOUT,
+    max_concurrency: Optional[int] = None,
+) -> ServerVerifier:
+    """Return the shared ``ServerVerifier`` for these settings."""
+    key = (timeout, max_concurrency)
+    verifier = _VERIFIERS.get(key)
+    if verifier is None:
+        verifier = _VERIFIERS[key] = ServerVerifier(
+            timeout=timeout, max_concurrency=max_concurrency,
+        )
+        while len(_VERIFIERS) > _SHARED_VERIFIERS_MAX:
+            _VERIFIERS.popitem(last=False)
+    else:
+        _VERIFIERS.move_to_end(key)
+    return verifier
+
+
+def clear_verifiers() -> None:
+    """Forget every shared verifier, along with its heal cache."""
+    _VERIFIERS.clear()
+
+
 async def verify_server(
     server_name: str,
     command: str,
@@ -1097,7 +1873,7 @@ async def verify_server(
     timeout: float = _DEFAULT_TIMEOUT,
 ) -> VerificationResult:
     """Convenience wrapper: verify a single MCP server."""
-    verifier = ServerVerifier(timeout=timeout)
+    verifier = _get_verifier(timeout)
     return await verifier.verify_server(server_name, command, args, env)
 
 
@@ -1107,14 +1883,15 @@ async def self_heal(
     command: str,
 ) -> Dict[str, Any]:
     """Convenience wrapper: attempt self-healing for a server error."""
-    verifier = ServerVerifier()
+    verifier = _get_verifier()
     return await verifier.self_heal(server_name, error, command)
 
 
 async def check_ecosystem_health(
     config: Dict[str, MCPConfigEntry],
     timeout: float = _DEFAULT_TIMEOUT,
+    max_concurrency: Optional[int] = None,
 ) -> EcosystemHealthResult:
     """Convenience wrapper: check health of all configured MCP servers."""
-    verifier = ServerVerifier(timeout=timeout)
+    verifier = _get_verifier(timeout, max_concurrency)
     return await verifier.check_ecosystem_health(config)
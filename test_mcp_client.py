@@ -4,79 +4,88 @@ Test script to verify the Meta MCP server works correctly with MCP protocol.
 """
 
 import asyncio
-import json
-import subprocess
+import os
 import sys
-from mcp import ClientSession
+from typing import Any, Dict, List, Tuple
+
+from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Built once: every check below runs against this one server process.
+_SERVER_PARAMS = StdioServerParameters(
+    command=sys.executable,
+    args=["-m", "meta_mcp", "--stdio"],
+)
+
+_DEFAULT_CASES: List[Tuple[str, Dict[str, Any]]] = [
+    ("search_mcp_servers", {"query": "file", "limit": 2}),
+    ("get_server_info", {"server_name": "filesystem"}),
+]
+
+
+def _text(content) -> str:
+    """Return the text of an MCP content item, or its repr if it has none."""
+    try:
+        return content.text
+    except AttributeError:
+        return str(content)
+
+
+def _emit(lines) -> None:
+    """Write one section of status lines in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _smoke_cases() -> List[Tuple[str, Dict[str, Any]]]:
+    """Tool calls to run; ``MCP_SMOKE_CALLS=N`` repeats the default set N times."""
+    repeat = int(os.environ.get("MCP_SMOKE_CALLS", "1"))
+    return _DEFAULT_CASES * max(repeat, 1)
+
+
+async def _run_checks(
+    session: ClientSession,
+    cases: List[Tuple[str, Dict[str, Any]]],
+) -> None:
+    """Call each tool in *cases* in turn on the already-open *session*."""
+    for tool_name, arguments in cases:
+        lines = [f"\n🔍 Testing {tool_name}..."]
+        result = await session.call_tool(tool_name, arguments=arguments)
+        if result.content:
+            content = _text(result.content[0])
+            lines.append(f"✅ {tool_name} completed. Result preview: {content[:200]}...")
+        else:
+            lines.append(f"❌ {tool_name} returned no content")
+        _emit(lines)
+
 
 async def test_mcp_server():
     """Test the Meta MCP server using the MCP protocol client."""
     print("Starting Meta MCP server test...")
-    
-    # Start the server as a subprocess
-    server_process = subprocess.Popen(
-        [sys.executable, "-m", "meta_mcp", "--stdio"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-    
+
     try:
-        # Connect to the server
-        async with stdio_client(server_process.stdout, server_process.stdin) as (read_stream, write_stream):
+        # stdio_client starts the server and stops it when the block exits.
+        async with stdio_client(_SERVER_PARAMS) as (read_stream, write_stream):
             async with ClientSession(read_stream, write_stream) as session:
                 # Initialize the session
                 await session.initialize()
-                print("✅ Session initialized successfully")
-                
+                lines = ["✅ Session initialized successfully"]
+
                 # List available tools
                 tools_result = await session.list_tools()
-                print(f"✅ Found {len(tools_result.tools)} tools:")
+                lines.append(f"✅ Found {len(tools_result.tools)} tools:")
                 for tool in tools_result.tools:
-                    print(f"  - {tool.name}: {tool.description[:80]}...")
-                
-                # Test search functionality
-                print("\n🔍 Testing search_mcp_servers...")
-                search_result = await session.call_tool(
-                    "search_mcp_servers",
-                    arguments={"query": "file", "limit": 2}
-                )
-                
-                if search_result.content:
-                    content = search_result.content[0].text if hasattr(search_result.content[0], 'text') else str(search_result.content[0])
-                    print(f"✅ Search completed. Result preview: {content[:200]}...")
-                else:
-                    print("❌ Search returned no content")
-                
-                # Test server info functionality
-                print("\n📋 Testing get_server_info...")
-                info_result = await session.call_tool(
-                    "get_server_info",
-                    arguments={"server_name": "filesystem"}
-                )
-                
-                if info_result.content:
-                    content = info_result.content[0].text if hasattr(info_result.content[0], 'text') else str(info_result.content[0])
-                    print(f"✅ Server info completed. Result preview: {content[:200]}...")
-                else:
-                    print("❌ Server info returned no content")
-                
+                    lines.append(f"  - {tool.name}: {(tool.description or '')[:80]}...")
+                _emit(lines)
+
+                await _run_checks(session, _smoke_cases())
+
     except Exception as e:
         print(f"❌ Test failed: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        # Clean up
-        server_process.terminate()
-        try:
-            server_process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            server_process.kill()
-        print("🧹 Server process cleaned up")
+    print("🧹 Server process cleaned up")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_mcp_server())
\ No newline at end of file
+    asyncio.run(test_mcp_server())
@@ -4,18 +4,23 @@ Pytest configuration and shared fixtures for Meta MCP tests.
 
 import json
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
-from unittest.mock import patch, AsyncMock, MagicMock
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest.mock import patch, AsyncMock, Mock
+
+# File contents for sample_project_dir, encoded once per session.
+_PACKAGE_JSON = json.dumps(
+    {"name": "test-project", "dependencies": {"react": "^18.0.0"}}
+).encode("utf-8")
+_GIT_CONFIG = b'[remote "origin"]\n\turl = https://github.com/test/project.git\n'
+_ENV_EXAMPLE = b"DATABASE_URL=postgres://localhost/test\nAPI_KEY=your-key\n"
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Per-test temporary directory (pytest's ``tmp_path``)."""
+    return tmp_path
 
 
 @pytest.fixture
@@ -37,7 +42,7 @@ def mock_config_paths(temp_dir):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_server_definitions():
     """Sample server definitions for testing."""
     return {
@@ -103,7 +108,7 @@ def sample_server_definitions():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_installation_result():
     """Create a mock successful installation result."""
     from src.meta_mcp.models import MCPInstallationResult
@@ -123,7 +128,7 @@ def memory_file(temp_dir):
     return temp_dir / "memory.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mcp_config():
     """Sample MCP configuration dict for testing."""
     return {
@@ -154,43 +159,60 @@ def mock_httpx_client():
 def sample_project_dir(temp_dir):
     """Create a sample project directory with common files."""
     # Create basic project structure
-    (temp_dir / "package.json").write_text(
-        json.dumps({"name": "test-project", "dependencies": {"react": "^18.0.0"}}),
-        encoding="utf-8",
-    )
+    (temp_dir / "package.json").write_bytes(_PACKAGE_JSON)
     (temp_dir / ".git").mkdir()
-    (temp_dir / ".git" / "config").write_text(
-        '[remote "origin"]\n\turl = https://github.com/test/project.git\n',
-        encoding="utf-8",
-    )
-    (temp_dir / ".env.example").write_text(
-        "DATABASE_URL=postgres://localhost/test\nAPI_KEY=your-key\n",
-        encoding="utf-8",
-    )
+    (temp_dir / ".git" / "config").write_bytes(_GIT_CONFIG)
+    (temp_dir / ".env.example").write_bytes(_ENV_EXAMPLE)
     return temp_dir
 
 
+@dataclass
+class FakeProc:
+    """Lightweight stand-in for ``asyncio.subprocess.Process``.
+
+    Plain attributes with mock leaves only where tests inspect calls, so no
+    ``MagicMock`` attribute machinery runs for the process itself.
+    """
+
+    returncode: Optional[int] = 0
+    stdout_data: bytes = b""
+    stderr_data: bytes = b""
+    # Lines handed out by ``stdout.readline()`` in order, then EOF (``b""``).
+    stdout_lines: List[bytes] = field(default_factory=list)
+    pid: int = 12345
+    stdin: SimpleNamespace = field(init=False)
+    stdout: SimpleNamespace = field(init=False)
+    stderr: SimpleNamespace = field(init=False)
+    communicate: AsyncMock = field(init=False)
+    wait: AsyncMock = field(init=False)
+    terminate: Mock = field(default_factory=Mock)
+    kill: Mock = field(default_factory=Mock)
+
+    def __post_init__(self):
+        self.stdin = SimpleNamespace(write=Mock(), drain=AsyncMock(), close=Mock())
+        lines = iter(self.stdout_lines)
+
+        async def _readline():
+            return next(lines, b"")
+
+        self.stdout = SimpleNamespace(readline=_readline)
+        self.stderr = SimpleNamespace(read=AsyncMock(return_value=self.stderr_data))
+        self.communicate = AsyncMock(return_value=(self.stdout_data, self.stderr_data))
+        # A still-running process (returncode None) exits cleanly once awaited.
+        self.wait = AsyncMock(return_value=self.returncode or 0)
+
+
 @pytest.fixture
 def make_mock_process():
     """Factory fixture for creating mock asyncio subprocess processes."""
 
-    def _make(returncode=0, stdout=b"", stderr=b""):
-        process = MagicMock()
-        process.returncode = returncode
-        process.pid = 12345
-        process.stdin = MagicMock()
-        process.stdin.write = MagicMock()
-        process.stdin.drain = AsyncMock()
-        process.stdin.close = MagicMock()
-        process.stdout = MagicMock()
-        process.stdout.readline = AsyncMock(return_value=b"")
-        process.stderr = MagicMock()
-        process.stderr.read = AsyncMock(return_value=stderr)
-        process.communicate = AsyncMock(return_value=(stdout, stderr))
-        process.wait = AsyncMock(return_value=returncode)
-        process.terminate = MagicMock()
-        process.kill = MagicMock()
-        return process
+    def _make(returncode=0, stdout=b"", stderr=b"", stdout_lines=()):
+        return FakeProc(
+            returncode=returncode,
+            stdout_data=stdout,
+            stderr_data=stderr,
+            stdout_lines=list(stdout_lines),
+        )
 
     return _make
 
@@ -217,6 +239,11 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
+    # Registered here too so the marker is known when pytest-xdist is absent.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests on one xdist worker under --dist loadgroup",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
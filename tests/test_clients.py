@@ -2,10 +2,16 @@
 
 import json
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import src.meta_mcp.clients as clients_mod
 from src.meta_mcp.clients import (
     ClientManager,
     _read_json,
@@ -14,6 +20,28 @@ from src.meta_mcp.clients import (
 from src.meta_mcp.models import ClientType
 
 
+# Config files the tests start from, serialised once at import.
+_CLAUDE_DESKTOP_CFG = b'{"mcpServers": {"s1": {"command": "s1"}}}'
+_CLAUDE_CODE_USER_CFG = json.dumps(
+    {"mcpServers": {"my-srv": {"type": "stdio", "command": "py", "args": []}}}
+).encode("utf-8")
+_EXISTING_SERVER_CFG = json.dumps(
+    {"mcpServers": {"existing": {"command": "old"}}}
+).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def mgr():
+    """ClientManager holds no state, so one instance serves the module."""
+    return ClientManager()
+
+
+def _load_config(path: Path) -> dict:
+    """Parse a written client config straight from its bytes."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 class TestJsonHelpers:
     """Low-level JSON read/write functions."""
 
@@ -30,164 +58,142 @@ class TestJsonHelpers:
         f.write_text("NOT JSON", encoding="utf-8")
         assert _read_json(f) == {}
 
-    def test_write_json_creates_parent(self, tmp_path):
+    def test_write_json_byte_exact(self, tmp_path):
+        """Parent dirs are created; output is 2-space indented with a final newline."""
         target = tmp_path / "sub" / "dir" / "out.json"
         assert _write_json(target, {"key": "val"}) is True
-        assert target.is_file()
-        data = json.loads(target.read_text(encoding="utf-8"))
-        assert data["key"] == "val"
-
-    def test_write_json_trailing_newline(self, tmp_path):
-        target = tmp_path / "out.json"
-        _write_json(target, {"x": 1})
-        assert target.read_text(encoding="utf-8").endswith("\n")
+        assert target.read_bytes() == b'{\n  "key": "val"\n}\n'
 
 
 class TestClientManagerDetection:
     """Client detection with mocked filesystem."""
 
-    def test_detect_claude_desktop_not_present(self, tmp_path):
-        with patch("src.meta_mcp.clients._home", return_value=tmp_path), \
-             patch("src.meta_mcp.clients._appdata", return_value=tmp_path / "AppData"), \
-             patch("src.meta_mcp.clients._SYSTEM", "Linux"):
-            mgr = ClientManager()
-            clients = mgr.detect_clients()
-            # Claude Desktop config dir doesn't exist, so it shouldn't be detected
-            names = [c.name for c in clients]
-            # Only clients whose parent dirs exist will be detected
-            assert isinstance(clients, list)
-
-    def test_detect_claude_desktop_present(self, tmp_path):
+    def test_detect_claude_desktop_not_present(self, mgr, tmp_path, monkeypatch):
+        monkeypatch.setattr(clients_mod, "_home", lambda: tmp_path)
+        monkeypatch.setattr(clients_mod, "_appdata", lambda: tmp_path / "AppData")
+        monkeypatch.setattr(clients_mod, "_SYSTEM", "Linux")
+        clients = mgr.detect_clients()
+        # Claude Desktop config dir doesn't exist, so it shouldn't be detected
+        names = [c.name for c in clients]
+        # Only clients whose parent dirs exist will be detected
+        assert isinstance(clients, list)
+
+    def test_detect_claude_desktop_present(self, mgr, tmp_path, monkeypatch):
         config_dir = tmp_path / ".config" / "Claude"
         config_dir.mkdir(parents=True)
         config_path = config_dir / "claude_desktop_config.json"
-        config_path.write_text('{"mcpServers": {"s1": {"command": "s1"}}}', encoding="utf-8")
+        config_path.write_bytes(_CLAUDE_DESKTOP_CFG)
 
-        with patch("src.meta_mcp.clients._claude_desktop_config_path", return_value=config_path):
-            mgr = ClientManager()
-            result = mgr._detect_claude_desktop()
-            assert result is not None
-            assert result.name == "Claude Desktop"
-            assert "s1" in result.configured_servers
+        monkeypatch.setattr(clients_mod, "_claude_desktop_config_path", lambda: config_path)
+        result = mgr._detect_claude_desktop()
+        assert result is not None
+        assert result.name == "Claude Desktop"
+        assert "s1" in result.configured_servers
 
-    def test_detect_claude_code_not_present(self, tmp_path):
+    def test_detect_claude_code_not_present(self, mgr, tmp_path, monkeypatch):
         """Claude Code is not detected when neither ~/.claude.json nor the CLI exist."""
         fake_user_config = tmp_path / ".claude.json"  # does not exist
-        with patch("src.meta_mcp.clients._claude_code_user_config_path", return_value=fake_user_config), \
-             patch("src.meta_mcp.clients._claude_cli_available", return_value=False):
-            mgr = ClientManager()
-            assert mgr._detect_claude_code() is None
+        monkeypatch.setattr(clients_mod, "_claude_code_user_config_path", lambda: fake_user_config)
+        monkeypatch.setattr(clients_mod, "_claude_cli_available", lambda: False)
+        assert mgr._detect_claude_code() is None
 
-    def test_detect_claude_code_with_user_config(self, tmp_path):
+    def test_detect_claude_code_with_user_config(self, mgr, tmp_path, monkeypatch):
         """Claude Code detected via ~/.claude.json with servers listed."""
         user_config = tmp_path / ".claude.json"
-        user_config.write_text(
-            json.dumps({"mcpServers": {"my-srv": {"type": "stdio", "command": "py", "args": []}}}),
-            encoding="utf-8",
-        )
-        with patch("src.meta_mcp.clients._claude_code_user_config_path", return_value=user_config), \
-             patch("src.meta_mcp.clients._claude_cli_available", return_value=False), \
-             patch("src.meta_mcp.clients._claude_code_project_config_path", return_value=None):
-            mgr = ClientManager()
-            result = mgr._detect_claude_code()
-            assert result is not None
-            assert result.name == "Claude Code"
-            assert result.config_path == str(user_config)
-            assert "my-srv" in result.configured_servers
-
-    def test_detect_cursor(self, tmp_path):
+        user_config.write_bytes(_CLAUDE_CODE_USER_CFG)
+        monkeypatch.setattr(clients_mod, "_claude_code_user_config_path", lambda: user_config)
+        monkeypatch.setattr(clients_mod, "_claude_cli_available", lambda: False)
+        monkeypatch.setattr(clients_mod, "_claude_code_project_config_path", lambda: None)
+        result = mgr._detect_claude_code()
+        assert result is not None
+        assert result.name == "Claude Code"
+        assert result.config_path == str(user_config)
+        assert "my-srv" in result.configured_servers
+
+    def test_detect_cursor(self, mgr, tmp_path, monkeypatch):
         cursor_dir = tmp_path / ".cursor"
         cursor_dir.mkdir()
         config_path = cursor_dir / "mcp.json"
         config_path.write_text('{"mcpServers": {}}', encoding="utf-8")
 
-        with patch("src.meta_mcp.clients._cursor_config_path", return_value=config_path):
-            mgr = ClientManager()
-            result = mgr._detect_cursor()
-            assert result is not None
-            assert result.name == "Cursor"
+        monkeypatch.setattr(clients_mod, "_cursor_config_path", lambda: config_path)
+        result = mgr._detect_cursor()
+        assert result is not None
+        assert result.name == "Cursor"
 
 
 class TestClientManagerConfiguration:
     """Server configuration writing."""
 
-    def test_configure_claude_code_includes_type(self, tmp_path):
+    def test_configure_claude_code_includes_type(self, mgr, tmp_path, monkeypatch):
         """Claude Code entries must include 'type': 'stdio'."""
         config_path = tmp_path / ".claude.json"
-        mgr = ClientManager()
-        with patch.object(mgr, "_config_path_for_client", return_value=config_path):
-            ok = mgr.configure_server_for_client(
-                client=ClientType.CLAUDE_CODE,
-                server_name="test-srv",
-                command="test-cmd",
-                args=["--flag"],
-                env={"KEY": "val"},
-            )
+        monkeypatch.setattr(mgr, "_config_path_for_client", lambda client: config_path)
+        ok = mgr.configure_server_for_client(
+            client=ClientType.CLAUDE_CODE,
+            server_name="test-srv",
+            command="test-cmd",
+            args=["--flag"],
+            env={"KEY": "val"},
+        )
         assert ok is True
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = _load_config(config_path)
         srv = data["mcpServers"]["test-srv"]
         assert srv["type"] == "stdio", "Claude Code requires 'type': 'stdio'"
         assert srv["command"] == "test-cmd"
         assert srv["args"] == ["--flag"]
         assert srv["env"]["KEY"] == "val"
 
-    def test_configure_standard_client_no_type(self, tmp_path):
+    def test_configure_standard_client_no_type(self, mgr, tmp_path, monkeypatch):
         """Non-Claude-Code clients should NOT have a 'type' field."""
         config_path = tmp_path / "mcp.json"
-        mgr = ClientManager()
-        with patch.object(mgr, "_config_path_for_client", return_value=config_path):
-            ok = mgr.configure_server_for_client(
-                client=ClientType.CURSOR,
-                server_name="test-srv",
-                command="test-cmd",
-                args=["--flag"],
-            )
+        monkeypatch.setattr(mgr, "_config_path_for_client", lambda client: config_path)
+        ok = mgr.configure_server_for_client(
+            client=ClientType.CURSOR,
+            server_name="test-srv",
+            command="test-cmd",
+            args=["--flag"],
+        )
         assert ok is True
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = _load_config(config_path)
         srv = data["mcpServers"]["test-srv"]
         assert "type" not in srv, "Standard clients should not have 'type' field"
         assert srv["command"] == "test-cmd"
 
-    def test_configure_zed_client(self, tmp_path):
+    def test_configure_zed_client(self, mgr, tmp_path, monkeypatch):
         config_path = tmp_path / "settings.json"
         config_path.write_text("{}", encoding="utf-8")
-        mgr = ClientManager()
-        with patch.object(mgr, "_config_path_for_client", return_value=config_path):
-            ok = mgr.configure_server_for_client(
-                client=ClientType.ZED,
-                server_name="my-server",
-                command="my-cmd",
-                args=[],
-            )
+        monkeypatch.setattr(mgr, "_config_path_for_client", lambda client: config_path)
+        ok = mgr.configure_server_for_client(
+            client=ClientType.ZED,
+            server_name="my-server",
+            command="my-cmd",
+            args=[],
+        )
         assert ok is True
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = _load_config(config_path)
         assert "my-server" in data["context_servers"]
 
-    def test_configure_preserves_existing(self, tmp_path):
+    def test_configure_preserves_existing(self, mgr, tmp_path, monkeypatch):
         config_path = tmp_path / "mcp.json"
-        config_path.write_text(
-            json.dumps({"mcpServers": {"existing": {"command": "old"}}}),
-            encoding="utf-8",
+        config_path.write_bytes(_EXISTING_SERVER_CFG)
+        monkeypatch.setattr(mgr, "_config_path_for_client", lambda client: config_path)
+        mgr.configure_server_for_client(
+            client=ClientType.CLAUDE_CODE,
+            server_name="new-srv",
+            command="new-cmd",
         )
-        mgr = ClientManager()
-        with patch.object(mgr, "_config_path_for_client", return_value=config_path):
-            mgr.configure_server_for_client(
-                client=ClientType.CLAUDE_CODE,
-                server_name="new-srv",
-                command="new-cmd",
-            )
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = _load_config(config_path)
         assert "existing" in data["mcpServers"]
         assert "new-srv" in data["mcpServers"]
 
-    def test_configure_returns_false_when_path_none(self):
-        mgr = ClientManager()
-        with patch.object(mgr, "_config_path_for_client", return_value=None):
-            ok = mgr.configure_server_for_client(
-                client=ClientType.CLAUDE_CODE,
-                server_name="x",
-                command="x",
-            )
+    def test_configure_returns_false_when_path_none(self, mgr, monkeypatch):
+        monkeypatch.setattr(mgr, "_config_path_for_client", lambda client: None)
+        ok = mgr.configure_server_for_client(
+            client=ClientType.CLAUDE_CODE,
+            server_name="x",
+            command="x",
+        )
         assert ok is False
 
 
@@ -0,0 +1,56 @@
+"""Tests for MCP server discovery helpers."""
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from src.meta_mcp.discovery import MCPDiscovery, _CATEGORY_TERMS
+from src.meta_mcp.models import MCPServerCategory
+
+
+def _naive_category(name, description):
+    name_lower, desc_lower = name.lower(), description.lower()
+    for category, terms in _CATEGORY_TERMS:
+        if any(t in name_lower or t in desc_lower for t in terms):
+            return category
+    return MCPServerCategory.OTHER
+
+
+# Text built from category terms and filler so most examples match something.
+_fragments = st.sampled_from(
+    sorted({t for _, terms in _CATEGORY_TERMS for t in terms})
+    + ["x", "-", "Hub", "gui", "ver", "doc"]
+)
+_texts = st.lists(_fragments, max_size=5).map("".join)
+
+
+@pytest.fixture(scope="module")
+def discovery():
+    return MCPDiscovery()
+
+
+class TestCategorizeServer:
+    """Single-pass categorisation keeps the elif-chain priority."""
+
+    @pytest.mark.parametrize(
+        "name, description, expected",
+        [
+            ("brave-search", "", MCPServerCategory.SEARCH),
+            ("github", "search issues", MCPServerCategory.VERSION_CONTROL),
+            ("tool", "browser automation", MCPServerCategory.AUTOMATION),
+            ("helper", "a guide", MCPServerCategory.CODING),
+            ("zen", "", MCPServerCategory.ORCHESTRATION),
+            ("weather", "forecasts", MCPServerCategory.OTHER),
+        ],
+    )
+    def test_known_servers(self, discovery, name, description, expected):
+        assert discovery._categorize_server(name, description) == expected
+
+    def test_terms_do_not_span_name_and_description(self, discovery):
+        assert discovery._categorize_server("gi", "t") == MCPServerCategory.OTHER
+
+    @settings(max_examples=300, deadline=None)
+    @given(name=_texts, description=_texts)
+    def test_matches_naive_scan(self, discovery, name, description):
+        assert discovery._categorize_server(name, description) == _naive_category(
+            name, description
+        )
@@ -2,14 +2,16 @@
 Tests for the Gateway Server mode.
 """
 
+import asyncio
 import json
 import pytest
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from meta_mcp import _json
 from meta_mcp.gateway import GatewayServer, _TOKENS_PER_TOOL_ESTIMATE
-from meta_mcp.gateway_registry import BackendConfig, GatewayRegistry
+from meta_mcp.gateway_registry import BackendConfig, GatewayRegistry, MemoryStorage
 from meta_mcp.models import DiscoveredTool, ServerToolsResult
 
 
@@ -18,6 +20,20 @@ from meta_mcp.models import DiscoveredTool, ServerToolsResult
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+def _make_registry(backends=None):
+    """Helper to create an in-memory registry with test data."""
+    initial = json.dumps(backends).encode("utf-8") if backends else None
+    return GatewayRegistry(storage=MemoryStorage(initial))
+
+
 class TestGatewayRegistry:
     def test_empty_registry_when_file_missing(self, temp_dir):
         path = temp_dir / "missing" / "backends.json"
@@ -59,55 +75,78 @@ class TestGatewayRegistry:
         assert "test" in reg2.backends
         assert reg2.get("test").command == "echo"
 
-    def test_auto_activate_backends(self, temp_dir):
+    def test_save_skips_unchanged_registry(self, temp_dir):
         path = temp_dir / "backends.json"
-        path.write_text(
-            json.dumps(
-                {
-                    "a": {"command": "a", "auto_activate": True},
-                    "b": {"command": "b", "auto_activate": False},
-                    "c": {"command": "c", "auto_activate": True},
-                }
-            ),
-            encoding="utf-8",
-        )
         reg = GatewayRegistry(registry_path=path)
-        assert sorted(reg.auto_activate_backends()) == ["a", "c"]
+        reg.add("test", BackendConfig(command="echo"))
+        reg.save()
+        path.write_bytes(b"sentinel")  # any rewrite would replace it
+
+        reg.save()
+        reg.add("test", BackendConfig(command="echo"))
+        reg.save()
+        assert path.read_bytes() == b"sentinel"
 
-    def test_remove(self, temp_dir):
+        reg.remove("test")
+        reg.save()
+        assert json.loads(path.read_bytes()) == {}
+        reg.add("other", BackendConfig(command="x"))
+        reg.save()
+        assert "other" in json.loads(path.read_bytes())
+
+    def test_save_format_matches_stdlib(self, temp_dir, json_backend):
+        """The file stays 2-space indented, unescaped UTF-8 with a final newline."""
         path = temp_dir / "backends.json"
         reg = GatewayRegistry(registry_path=path)
+        reg.add("café", BackendConfig(command="echo", description="naïve"))
+        reg.save()
+        data = {name: cfg.model_dump() for name, cfg in reg.backends.items()}
+        expected = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+        assert path.read_bytes() == expected.encode("utf-8")
+        assert GatewayRegistry(registry_path=path).backends == reg.backends
+
+    def test_auto_activate_backends(self):
+        reg = _make_registry(
+            {
+                "a": {"command": "a", "auto_activate": True},
+                "b": {"command": "b", "auto_activate": False},
+                "c": {"command": "c", "auto_activate": True},
+            }
+        )
+        assert sorted(reg.auto_activate_backends()) == ["a", "c"]
+
+    def test_remove(self):
+        reg = _make_registry()
         reg.add("x", BackendConfig(command="x"))
         assert reg.remove("x") is True
         assert reg.remove("x") is False
         assert reg.get("x") is None
 
-    def test_list_summary(self, temp_dir):
-        path = temp_dir / "backends.json"
-        reg = GatewayRegistry(registry_path=path)
+    def test_list_summary(self):
+        reg = _make_registry()
         reg.add("foo", BackendConfig(command="foo", description="Foo server"))
         summary = reg.list_summary()
         assert len(summary) == 1
         assert summary[0]["name"] == "foo"
         assert summary[0]["description"] == "Foo server"
 
+    def test_memory_storage_round_trip(self):
+        storage = MemoryStorage()
+        reg = GatewayRegistry(storage=storage)
+        reg.add("m", BackendConfig(command="m", auto_activate=True))
+        reg.save()
+        assert json.loads(storage.data)["m"]["command"] == "m"
+        assert GatewayRegistry(storage=storage).auto_activate_backends() == ["m"]
+
 
 # ---------------------------------------------------------------------------
 # Gateway server tests
 # ---------------------------------------------------------------------------
 
 
-def _make_registry(temp_dir, backends=None):
-    """Helper to create a registry with test data."""
-    path = temp_dir / "backends.json"
-    if backends:
-        path.write_text(json.dumps(backends), encoding="utf-8")
-    return GatewayRegistry(registry_path=path)
-
-
 class TestGatewayServer:
-    def test_starts_with_minimal_tools(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    def test_starts_with_minimal_tools(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
 
         tool_names = gw._get_gateway_tool_names()
@@ -123,15 +162,47 @@ class TestGatewayServer:
         # Should NOT have 30+ tools
         assert len(tool_names) <= 10
 
-    def test_list_backends_empty(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_orchestrator_created_lazily(self):
+        gw = GatewayServer(registry=_make_registry())
+        gw._list_backends()
+        gw._context_budget()
+        await gw.shutdown()
+        assert gw._orchestrator is None
+        assert gw.orchestrator is gw.orchestrator
+
+    async def test_auto_activate_runs_concurrently(self):
+        reg = _make_registry({
+            "a": {"command": "a", "auto_activate": True},
+            "b": {"command": "b", "auto_activate": True},
+            "c": {"command": "c"},
+        })
+        gw = GatewayServer(registry=reg)
+        started = []
+        both_started = asyncio.Event()
+
+        async def _activate(name):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            # Sequential activation would never get past this wait.
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            if name == "b":
+                raise RuntimeError("boom")
+            return "ok"
+
+        with patch.object(gw, "_activate_backend", side_effect=_activate):
+            await gw._auto_activate()
+
+        assert sorted(started) == ["a", "b"]
+
+    def test_list_backends_empty(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = gw._list_backends()
         assert "No backends registered" in result
 
-    def test_list_backends_with_entries(self, temp_dir):
+    def test_list_backends_with_entries(self):
         reg = _make_registry(
-            temp_dir,
             {
                 "engram": {
                     "command": "py",
@@ -153,32 +224,28 @@ class TestGatewayServer:
         assert "inactive" in result
         assert "[auto]" in result
 
-    def test_context_budget_baseline(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    def test_context_budget_baseline(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = gw._context_budget()
         assert "Context Budget Report" in result
         assert "Gateway tools" in result
         assert "Proxied backend tools" in result
 
-    @pytest.mark.asyncio
-    async def test_activate_unknown_backend(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_activate_unknown_backend(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = await gw._activate_backend("nonexistent")
         assert "Unknown backend" in result
 
-    @pytest.mark.asyncio
-    async def test_deactivate_inactive_backend(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_deactivate_inactive_backend(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = await gw._deactivate_backend("nothing")
         assert "not active" in result
 
-    @pytest.mark.asyncio
-    async def test_activate_already_active(self, temp_dir):
+    async def test_activate_already_active(self):
         reg = _make_registry(
-            temp_dir,
             {"test": {"command": "echo"}},
         )
         gw = GatewayServer(registry=reg)
@@ -191,11 +258,9 @@ class TestGatewayServer:
         assert "already active" in result
         assert "test_hello" in result
 
-    @pytest.mark.asyncio
-    async def test_activate_and_register_tools(self, temp_dir):
+    async def test_activate_and_register_tools(self):
         """Test that activate_backend discovers tools and registers proxies."""
         reg = _make_registry(
-            temp_dir,
             {"myserver": {"command": "echo", "args": ["test"]}},
         )
         gw = GatewayServer(registry=reg)
@@ -225,12 +290,31 @@ class TestGatewayServer:
         assert "myserver" in gw.active_backends
         assert "myserver_tool_a" in gw._proxy_tool_map
         assert "myserver_tool_b" in gw._proxy_tool_map
+        assert gw._tools_by_backend["myserver"] == ["myserver_tool_a", "myserver_tool_b"]
+
+    async def test_activate_dedupes_repeated_tool_names(self):
+        reg = _make_registry({"dup": {"command": "echo"}})
+        gw = GatewayServer(registry=reg)
+        discovered = ServerToolsResult(
+            server="dup",
+            tools=[
+                DiscoveredTool(name="t", description="first", parameters={}),
+                DiscoveredTool(name="t", description="second", parameters={}),
+            ],
+        )
 
-    @pytest.mark.asyncio
-    async def test_deactivate_removes_tools(self, temp_dir):
+        with patch.object(gw.orchestrator, "start_server", new_callable=AsyncMock), \
+                patch.object(gw.orchestrator, "discover_server_tools",
+                             new_callable=AsyncMock, return_value=discovered):
+            result = await gw._activate_backend("dup")
+
+        assert "1 tool(s)" in result
+        assert gw._proxy_tool_map == {"dup_t": ("dup", "t")}
+        assert gw._tools_by_backend["dup"] == ["dup_t"]
+
+    async def test_deactivate_removes_tools(self):
         """Test that deactivate_backend removes proxied tools."""
         reg = _make_registry(
-            temp_dir,
             {"myserver": {"command": "echo"}},
         )
         gw = GatewayServer(registry=reg)
@@ -243,6 +327,7 @@ class TestGatewayServer:
             ],
         )
         gw._proxy_tool_map["myserver_tool_a"] = ("myserver", "tool_a")
+        gw._tools_by_backend["myserver"] = ["myserver_tool_a"]
 
         with patch.object(gw.orchestrator, "stop_server", new_callable=AsyncMock):
             result = await gw._deactivate_backend("myserver")
@@ -250,9 +335,30 @@ class TestGatewayServer:
         assert "Deactivated" in result
         assert "myserver" not in gw.active_backends
         assert "myserver_tool_a" not in gw._proxy_tool_map
+        assert "myserver" not in gw._tools_by_backend
 
-    def test_register_backend(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_deactivate_leaves_other_backends(self):
+        """Only the deactivated backend's proxies are removed, via the reverse index."""
+        reg = _make_registry({"a": {"command": "echo"}, "b": {"command": "echo"}})
+        gw = GatewayServer(registry=reg)
+        for backend in ("a", "b"):
+            gw.active_backends[backend] = ServerToolsResult(
+                server=backend,
+                tools=[DiscoveredTool(name="t", description="", parameters={})],
+            )
+            gw._proxy_tool_map[f"{backend}_t"] = (backend, "t")
+            gw._tools_by_backend[backend] = [f"{backend}_t"]
+
+        with patch.object(gw, "_remove_tool") as remove_tool, \
+                patch.object(gw.orchestrator, "stop_server", new_callable=AsyncMock):
+            await gw._deactivate_backend("a")
+
+        remove_tool.assert_called_once_with("a_t")
+        assert gw._proxy_tool_map == {"b_t": ("b", "t")}
+        assert gw._tools_by_backend == {"b": ["b_t"]}
+
+    def test_register_backend(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = gw._register_backend(
             name="new-server",
@@ -267,8 +373,8 @@ class TestGatewayServer:
         assert reg.get("new-server") is not None
         assert reg.get("new-server").command == "npx"
 
-    def test_register_backend_invalid_args(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    def test_register_backend_invalid_args(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         result = gw._register_backend(
             name="bad",
@@ -280,16 +386,15 @@ class TestGatewayServer:
         )
         assert "Invalid args JSON" in result
 
-    def test_make_proxy_returns_callable(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    def test_make_proxy_returns_callable(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
         proxy = gw._make_proxy("server", "tool")
         assert callable(proxy)
         assert proxy.__name__ == "server_tool"
 
-    @pytest.mark.asyncio
-    async def test_proxy_forwards_call(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_proxy_forwards_call(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
 
         with patch.object(
@@ -308,9 +413,8 @@ class TestGatewayServer:
         )
         assert result == "proxied result"
 
-    @pytest.mark.asyncio
-    async def test_proxy_returns_json_for_non_string(self, temp_dir):
-        reg = _make_registry(temp_dir)
+    async def test_proxy_returns_json_for_non_string(self):
+        reg = _make_registry()
         gw = GatewayServer(registry=reg)
 
         with patch.object(
@@ -324,9 +428,23 @@ class TestGatewayServer:
 
         assert json.loads(result) == {"key": "value"}
 
-    def test_context_budget_with_active_backends(self, temp_dir):
+    async def test_proxy_result_formatting_matches_stdlib(self, json_backend):
+        reg = _make_registry()
+        gw = GatewayServer(registry=reg)
+        payload = {"name": "café", "items": [1, 2.5, None, True], "nested": {"a": []}}
+
+        with patch.object(
+            gw.orchestrator,
+            "forward_tool_call",
+            new_callable=AsyncMock,
+            return_value=payload,
+        ):
+            result = await gw._make_proxy("s", "t")()
+
+        assert result == json.dumps(payload, indent=2, ensure_ascii=False)
+
+    def test_context_budget_with_active_backends(self):
         reg = _make_registry(
-            temp_dir,
             {
                 "a": {"command": "a", "estimated_tokens": 500},
                 "b": {"command": "b", "estimated_tokens": 4500},
@@ -349,65 +467,56 @@ class TestGatewayServer:
         assert "a: 2 tools" in result
         assert "Savings" in result
 
+    def test_context_budget_does_not_rescan_tools(self):
+        gw = GatewayServer(registry=_make_registry())
+        expected = len(gw._get_gateway_tool_names())
+
+        with patch.object(gw, "_get_gateway_tool_names", side_effect=AssertionError):
+            result = gw._context_budget()
+
+        assert f"**Gateway tools** (always loaded): {expected}" in result
+
 
 # ---------------------------------------------------------------------------
 # Orchestrator forward_tool_call tests
 # ---------------------------------------------------------------------------
 
 
-class TestForwardToolCall:
-    @pytest.mark.asyncio
-    async def test_forward_success(self):
-        from meta_mcp.orchestration import ServerOrchestrator
-
-        orch = ServerOrchestrator()
-
-        # Create a mock process
-        proc = MagicMock()
-        proc.returncode = None
-        proc.stdin = MagicMock()
-        proc.stdin.write = MagicMock()
-        proc.stdin.drain = AsyncMock()
-        proc.stdout = MagicMock()
-
-        # Simulate JSON-RPC response
-        response = json.dumps({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {
-                "content": [{"type": "text", "text": "hello world"}],
-            },
-        }) + "\n"
-        proc.stdout.readline = AsyncMock(return_value=response.encode("utf-8"))
-
-        orch._processes["test"] = proc
-        orch._servers["test"] = MagicMock(command="echo", status="running")
+def _rpc_line(**fields) -> bytes:
+    return (json.dumps({"jsonrpc": "2.0", "id": 1, **fields}) + "\n").encode("utf-8")
 
-        result = await orch.forward_tool_call("test", "greet", {"name": "world"})
-        assert result == "hello world"
 
-    @pytest.mark.asyncio
-    async def test_forward_error(self):
-        from meta_mcp.orchestration import ServerOrchestrator
+@pytest.fixture
+def mock_orch():
+    """An orchestrator with one running fake backend ``test``; yields (orch, proc)."""
+    from meta_mcp.orchestration import ServerOrchestrator
 
-        orch = ServerOrchestrator()
+    orch = ServerOrchestrator()
+    proc = MagicMock()
+    proc.returncode = None
+    proc.stdin.drain = AsyncMock()
+    orch._processes["test"] = proc
+    orch._servers["test"] = MagicMock(command="echo", status="running")
+    yield orch, proc
 
-        proc = MagicMock()
-        proc.returncode = None
-        proc.stdin = MagicMock()
-        proc.stdin.write = MagicMock()
-        proc.stdin.drain = AsyncMock()
-        proc.stdout = MagicMock()
 
-        response = json.dumps({
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {"code": -1, "message": "tool not found"},
-        }) + "\n"
-        proc.stdout.readline = AsyncMock(return_value=response.encode("utf-8"))
+class TestForwardToolCall:
+    async def test_forward_success(self, mock_orch):
+        orch, proc = mock_orch
+        proc.stdout.readline = AsyncMock(return_value=_rpc_line(
+            result={"content": [{"type": "text", "text": "hello world"}]},
+        ))
 
-        orch._processes["test"] = proc
-        orch._servers["test"] = MagicMock(command="echo", status="running")
+        result = await orch.forward_tool_call("test", "greet", {"name": "world"})
+        assert result == "hello world"
+        sent = json.loads(proc.stdin.write.call_args.args[0])
+        assert sent["params"] == {"name": "greet", "arguments": {"name": "world"}}
+
+    async def test_forward_error(self, mock_orch):
+        orch, proc = mock_orch
+        proc.stdout.readline = AsyncMock(return_value=_rpc_line(
+            error={"code": -1, "message": "tool not found"},
+        ))
 
         with pytest.raises(RuntimeError, match="tool not found"):
             await orch.forward_tool_call("test", "missing", {})
@@ -1,7 +1,10 @@
 """Tests for ConversationalMemory (R7)."""
 
+import json
+
 import pytest
 
+from src.meta_mcp import memory as memory_mod
 from src.meta_mcp.memory import ConversationalMemory, _MAX_RECORDS
 
 
@@ -67,6 +70,79 @@ class TestConversationalMemory:
         assert len(mem._state.installations) <= _MAX_RECORDS
 
 
+class TestJournal:
+    """Append-only NDJSON persistence."""
+
+    def test_writes_append_one_line(self, tmp_path):
+        path = tmp_path / "mem.json"
+        mem = ConversationalMemory(memory_path=str(path))
+        mem.record_installation(server="s1", option="o", success=True)
+        before = path.read_bytes()
+        mem.record_failure(server="s2", error_sig="e", error_msg="boom")
+        after = path.read_bytes()
+        assert after.startswith(before)
+        added = after[len(before):].decode("utf-8").splitlines()
+        assert len(added) == 1
+        assert json.loads(added[0])["kind"] == "failure"
+
+    def test_corrupt_line_keeps_other_records(self, tmp_path):
+        path = tmp_path / "mem.json"
+        mem = ConversationalMemory(memory_path=str(path))
+        mem.record_installation(server="s1", option="o", success=True)
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("NOT VALID JSON\n")
+        mem.record_installation(server="s2", option="o", success=True)
+
+        reloaded = ConversationalMemory(memory_path=str(path))
+        assert [r.server_name for r in reloaded._state.installations] == ["s1", "s2"]
+
+    def test_non_object_lines_skip_the_parser(self, tmp_path, monkeypatch):
+        path = tmp_path / "mem.json"
+        mem = ConversationalMemory(memory_path=str(path))
+        mem.record_installation(server="s1", option="o", success=True)
+        with open(path, "ab") as fh:
+            fh.write(b"NOT VALID JSON\n\n[1, 2]\n")
+
+        calls = []
+        real = memory_mod._json.loads
+        monkeypatch.setattr(memory_mod._json, "loads", lambda b: calls.append(b) or real(b))
+        reloaded = ConversationalMemory(memory_path=str(path))
+        assert len(calls) == 1
+        assert [r.server_name for r in reloaded._state.installations] == ["s1"]
+
+    def test_legacy_snapshot_is_migrated(self, tmp_path):
+        path = tmp_path / "mem.json"
+        legacy = {
+            "installations": [{"server_name": "old", "option_name": "official"}],
+            "failures": [],
+            "preferences": {"interaction_count": 7},
+        }
+        path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+        mem = ConversationalMemory(memory_path=str(path))
+        assert mem._state.installations[0].server_name == "old"
+
+        mem.record_installation(server="new", option="official", success=True)
+        kinds = [json.loads(l)["kind"] for l in path.read_text().splitlines()]
+        assert kinds == ["installation", "installation", "preferences"]
+        reloaded = ConversationalMemory(memory_path=str(path))
+        assert [r.server_name for r in reloaded._state.installations] == ["old", "new"]
+        assert reloaded.get_preferences().interaction_count == 7
+
+    def test_compaction_bounds_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(memory_mod, "_MAX_RECORDS", 5)
+        monkeypatch.setattr(memory_mod, "_COMPACT_AFTER", 20)
+        path = tmp_path / "mem.json"
+        mem = ConversationalMemory(memory_path=str(path))
+        for i in range(50):
+            mem.record_installation(server=f"s{i}", option="o", success=True)
+        assert len(path.read_text().splitlines()) <= 20
+
+        reloaded = ConversationalMemory(memory_path=str(path))
+        assert [r.server_name for r in reloaded._state.installations] == [
+            f"s{i}" for i in range(45, 50)
+        ]
+
+
 class TestPreferences:
     """Preference learning from installation history."""
 
@@ -94,6 +170,17 @@ class TestPreferences:
         prefs = mem.get_preferences()
         assert prefs.prefers_official is True
 
+    def test_prefers_official_counts_successes_only(self, tmp_path):
+        mem = ConversationalMemory(memory_path=str(tmp_path / "mem.json"))
+        mem.record_installation(server="s", option="Recommended-npm", success=True)
+        for _ in range(3):
+            mem.record_installation(server="s", option="official", success=False)
+        for _ in range(2):
+            mem.record_installation(server="s", option="enhanced", success=True)
+        prefs = mem.get_preferences()
+        assert prefs.prefers_official is False
+        assert prefs.preferred_install_method == "enhanced"
+
 
 class TestErrorSignature:
     """Error signature extraction."""
@@ -110,3 +197,10 @@ class TestErrorSignature:
     def test_empty_yields_unknown(self):
         sig = ConversationalMemory._extract_error_signature("\n\n")
         assert sig == "unknown_error"
+
+    def test_repeated_message_is_cached(self):
+        extract = ConversationalMemory._extract_error_signature
+        extract.cache_clear()
+        for _ in range(3):
+            assert extract("Command not found: foo\ntrace") == "Command not found: foo"
+        assert extract.cache_info().hits == 2
@@ -2,13 +2,16 @@
 
 import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.meta_mcp import _json
 from src.meta_mcp.orchestration import (
     ServerOrchestrator,
+    _INITIALIZED_NOTIFICATION,
     _build_jsonrpc_request,
+    _read_jsonrpc_response,
 )
 from src.meta_mcp.models import (
     MCPServerStatus,
@@ -24,41 +27,34 @@ def _jsonrpc_response(result=None, error=None, req_id=1):
         msg["error"] = error
     else:
         msg["result"] = result or {}
-    return (json.dumps(msg) + "\n").encode("utf-8")
+    return _json.dumps_line(msg)
 
 
-def _mock_process(returncode=None, stdout_lines=None, stderr=b""):
-    """Create a mock subprocess with configurable stdout readline."""
-    proc = MagicMock()
-    proc.returncode = returncode
-    proc.pid = 99
+@pytest.fixture(scope="module")
+def orch():
+    """Shared orchestrator for tests that never start a server.
 
-    proc.stdin = MagicMock()
-    proc.stdin.write = MagicMock()
-    proc.stdin.drain = AsyncMock()
-    proc.stdin.close = MagicMock()
+    Lifecycle and request-ID tests build their own so state cannot leak.
+    """
+    return ServerOrchestrator()
 
-    lines = list(stdout_lines or [])
-    line_iter = iter(lines)
 
-    async def _readline():
-        try:
-            return next(line_iter)
-        except StopIteration:
-            return b""
+@pytest.fixture
+def fake_subproc(monkeypatch, make_mock_process):
+    """Make ``asyncio.create_subprocess_exec`` hand back one running process.
 
-    proc.stdout = MagicMock()
-    proc.stdout.readline = AsyncMock(side_effect=_readline)
-
-    proc.stderr = MagicMock()
-    proc.stderr.read = AsyncMock(return_value=stderr)
+    ``asyncio.wait_for`` stays real; it simply awaits the patched spawn.
+    """
+    proc = make_mock_process(returncode=None)
+    monkeypatch.setattr(
+        "asyncio.create_subprocess_exec", AsyncMock(return_value=proc),
+    )
+    return proc
 
-    proc.communicate = AsyncMock(return_value=(b"", stderr))
-    proc.wait = AsyncMock(return_value=0)
-    proc.terminate = MagicMock()
-    proc.kill = MagicMock()
 
-    return proc
+async def _hanging_spawn(*args, **kwargs):
+    """A process spawn that never completes, so the startup timeout fires."""
+    await asyncio.Event().wait()
 
 
 # -- Tests: _build_jsonrpc_request ------------------------------------------
@@ -68,7 +64,7 @@ class TestBuildJsonrpcRequest:
 
     def test_basic_request(self):
         raw = _build_jsonrpc_request("initialize", request_id=1)
-        msg = json.loads(raw.decode("utf-8").strip())
+        msg = json.loads(raw)
         assert msg["jsonrpc"] == "2.0"
         assert msg["method"] == "initialize"
         assert msg["id"] == 1
@@ -79,95 +75,139 @@ class TestBuildJsonrpcRequest:
             params={"name": "my-tool", "arguments": {"q": "test"}},
             request_id=42,
         )
-        msg = json.loads(raw.decode("utf-8").strip())
+        msg = json.loads(raw)
         assert msg["params"]["name"] == "my-tool"
         assert msg["id"] == 42
 
     def test_request_without_params(self):
         raw = _build_jsonrpc_request("tools/list", request_id=5)
-        msg = json.loads(raw.decode("utf-8").strip())
+        msg = json.loads(raw)
         assert "params" not in msg
 
     def test_trailing_newline(self):
         raw = _build_jsonrpc_request("test")
         assert raw.endswith(b"\n")
 
+    def test_initialized_notification(self):
+        assert json.loads(_INITIALIZED_NOTIFICATION) == {
+            "jsonrpc": "2.0", "method": "notifications/initialized",
+        }
+        assert _INITIALIZED_NOTIFICATION.endswith(b"\n")
+
+
+# -- Tests: _read_jsonrpc_response -----------------------------------------
+
+class TestReadJsonrpcResponse:
+    """Parse response lines straight from the byte stream."""
+
+    @staticmethod
+    def _reader(data: bytes) -> asyncio.StreamReader:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    async def test_skips_noise_and_notifications(self):
+        data = (
+            b"\n"
+            b"starting server...\n"
+            b'{"jsonrpc":"2.0","method":"notifications/progress"}\n'
+            + _jsonrpc_response({"ok": True}, req_id=7)
+        )
+        msg = await _read_jsonrpc_response(self._reader(data), timeout=1)
+        assert msg["id"] == 7
+        assert msg["result"] == {"ok": True}
+
+    async def test_non_ascii_payload(self):
+        data = _jsonrpc_response({"text": "héllo ✓"}, req_id=2)
+        msg = await _read_jsonrpc_response(self._reader(data), timeout=1)
+        assert msg["result"]["text"] == "héllo ✓"
+
+    async def test_eof_raises(self):
+        with pytest.raises(ConnectionError):
+            await _read_jsonrpc_response(self._reader(b""), timeout=1)
+
 
 # -- Tests: _extract_tool_output -------------------------------------------
 
 class TestExtractToolOutput:
     """Collapse MCP content lists."""
 
-    def test_single_text_content(self):
+    def test_single_text_content(self, orch):
         data = {"content": [{"type": "text", "text": "hello"}]}
-        assert ServerOrchestrator._extract_tool_output(data) == "hello"
+        assert orch._extract_tool_output(data) == "hello"
 
-    def test_multiple_text_content(self):
+    def test_multiple_text_content(self, orch):
         data = {"content": [
             {"type": "text", "text": "a"},
             {"type": "text", "text": "b"},
         ]}
-        result = ServerOrchestrator._extract_tool_output(data)
+        result = orch._extract_tool_output(data)
         assert isinstance(result, list)
         assert "a" in result
         assert "b" in result
 
-    def test_non_dict_passthrough(self):
-        assert ServerOrchestrator._extract_tool_output("plain") == "plain"
+    def test_non_dict_passthrough(self, orch):
+        assert orch._extract_tool_output("plain") == "plain"
 
-    def test_no_content_key(self):
+    def test_no_content_key(self, orch):
         data = {"something": "else"}
-        assert ServerOrchestrator._extract_tool_output(data) == data
+        assert orch._extract_tool_output(data) == data
 
-    def test_non_list_content(self):
+    def test_non_list_content(self, orch):
         data = {"content": "not-a-list"}
-        assert ServerOrchestrator._extract_tool_output(data) == data
+        assert orch._extract_tool_output(data) == data
 
-    def test_mixed_content_types(self):
+    def test_mixed_content_types(self, orch):
         data = {"content": [
             {"type": "text", "text": "hello"},
             {"type": "image", "data": "base64..."},
         ]}
-        result = ServerOrchestrator._extract_tool_output(data)
+        result = orch._extract_tool_output(data)
         assert isinstance(result, list)
 
+    def test_mixed_content_keeps_order_and_non_text_items(self, orch):
+        image = {"type": "image", "data": "base64..."}
+        data = {"content": [
+            {"type": "text", "text": "a"},
+            image,
+            {"type": "text"},
+        ]}
+        assert orch._extract_tool_output(data) == ["a", image, ""]
+
+    def test_single_non_text_item_unwrapped(self, orch):
+        image = {"type": "image", "data": "base64..."}
+        assert orch._extract_tool_output({"content": [image]}) == image
+
+    def test_empty_content_list(self, orch):
+        assert orch._extract_tool_output({"content": []}) == []
+
 
 # -- Tests: ServerOrchestrator.start_server --------------------------------
 
 class TestStartServer:
     """Server process lifecycle."""
 
-    async def test_start_server_success(self):
-        orch = ServerOrchestrator()
-        proc = _mock_process(returncode=None)
-
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc), \
-             patch("asyncio.wait_for", new_callable=AsyncMock, return_value=proc):
-            model = await orch.start_server("test-srv", "echo")
+    async def test_start_server_success(self, fake_subproc):
+        model = await ServerOrchestrator().start_server("test-srv", "echo")
 
         assert model.server_name == "test-srv"
         assert model.status == MCPServerStatus.RUNNING
-        assert model.pid == 99
+        assert model.pid == fake_subproc.pid
 
-    async def test_start_already_running(self):
+    async def test_start_already_running(self, fake_subproc):
         orch = ServerOrchestrator()
-        proc = _mock_process(returncode=None)
-
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc), \
-             patch("asyncio.wait_for", new_callable=AsyncMock, return_value=proc):
-            await orch.start_server("srv", "echo")
-            # Start again -- should return existing
-            model = await orch.start_server("srv", "echo")
+        await orch.start_server("srv", "echo")
+        # Start again -- should return existing
+        model = await orch.start_server("srv", "echo")
 
         assert model.status == MCPServerStatus.RUNNING
 
     async def test_start_command_not_found(self):
         orch = ServerOrchestrator()
+        spawn = AsyncMock(side_effect=FileNotFoundError("not found"))
 
-        async def _raise_fnf(*args, **kwargs):
-            raise FileNotFoundError("not found")
-
-        with patch("asyncio.wait_for", side_effect=_raise_fnf):
+        with patch("asyncio.create_subprocess_exec", spawn):
             with pytest.raises(RuntimeError, match="Command not found"):
                 await orch.start_server("bad", "nonexistent")
 
@@ -176,10 +216,8 @@ class TestStartServer:
     async def test_start_timeout(self):
         orch = ServerOrchestrator()
 
-        async def _raise_timeout(*args, **kwargs):
-            raise asyncio.TimeoutError()
-
-        with patch("asyncio.wait_for", side_effect=_raise_timeout):
+        with patch("asyncio.create_subprocess_exec", _hanging_spawn), \
+             patch("src.meta_mcp.orchestration._STARTUP_TIMEOUT_S", 0.01):
             with pytest.raises(RuntimeError, match="Timed out"):
                 await orch.start_server("slow", "cmd")
 
@@ -189,39 +227,29 @@ class TestStartServer:
 class TestStopServer:
     """Server stop with graceful + forced shutdown."""
 
-    async def test_stop_unknown_raises(self):
-        orch = ServerOrchestrator()
+    async def test_stop_unknown_raises(self, orch):
         with pytest.raises(KeyError, match="No server tracked"):
             await orch.stop_server("nonexistent")
 
-    async def test_stop_already_exited(self):
+    async def test_stop_already_exited(self, fake_subproc):
         orch = ServerOrchestrator()
-        proc = _mock_process(returncode=0)
-
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc), \
-             patch("asyncio.wait_for", new_callable=AsyncMock, return_value=proc):
-            await orch.start_server("srv", "echo")
-            # Simulate process already exited
-            proc.returncode = 0
-            model = await orch.stop_server("srv")
+        await orch.start_server("srv", "echo")
+        # Simulate process already exited
+        fake_subproc.returncode = 0
+        model = await orch.stop_server("srv")
 
         assert model.status == MCPServerStatus.STOPPED
 
-    async def test_stop_graceful(self):
+    async def test_stop_graceful(self, fake_subproc):
         orch = ServerOrchestrator()
-        proc = _mock_process(returncode=None)
+        await orch.start_server("srv", "echo")
 
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc), \
-             patch("asyncio.wait_for", new_callable=AsyncMock, return_value=proc):
-            await orch.start_server("srv", "echo")
-
-        # Make wait return quickly (graceful shutdown)
-        proc.wait = AsyncMock(return_value=0)
-        with patch("asyncio.wait_for", new_callable=AsyncMock, return_value=0):
-            model = await orch.stop_server("srv")
+        # wait() returns straight away, so shutdown stays graceful
+        model = await orch.stop_server("srv")
 
         assert model.status == MCPServerStatus.STOPPED
-        proc.terminate.assert_called()
+        fake_subproc.terminate.assert_called()
+        fake_subproc.kill.assert_not_called()
 
 
 # -- Tests: ServerOrchestrator.restart_server ------------------------------
@@ -229,8 +257,7 @@ class TestStopServer:
 class TestRestartServer:
     """Restart = stop + start."""
 
-    async def test_restart_unknown_raises(self):
-        orch = ServerOrchestrator()
+    async def test_restart_unknown_raises(self, orch):
         with pytest.raises(KeyError, match="No server tracked"):
             await orch.restart_server("nonexistent")
 
@@ -240,25 +267,34 @@ class TestRestartServer:
 class TestDiscoverServerTools:
     """Tool discovery via temp process."""
 
-    async def test_discover_command_not_found(self):
-        orch = ServerOrchestrator()
-
-        async def _raise_fnf(*args, **kwargs):
-            raise FileNotFoundError("nope")
+    async def test_discover_command_not_found(self, orch):
+        spawn = AsyncMock(side_effect=FileNotFoundError("nope"))
 
-        with patch("asyncio.wait_for", side_effect=_raise_fnf):
+        with patch("asyncio.create_subprocess_exec", spawn):
             result = await orch.discover_server_tools("srv", "nonexistent")
 
         assert result.server == "srv"
         assert result.tools == []
 
-    async def test_discover_timeout(self):
-        orch = ServerOrchestrator()
-
-        async def _raise_timeout(*args, **kwargs):
-            raise asyncio.TimeoutError()
-
-        with patch("asyncio.wait_for", side_effect=_raise_timeout):
+    async def test_discover_lists_tools_and_prompts(self, make_mock_process, monkeypatch):
+        proc = make_mock_process(returncode=None, stdout_lines=[
+            _jsonrpc_response({"protocolVersion": "2024-11-05"}, req_id=1),
+            _jsonrpc_response({"tools": [{"name": "ping", "description": "Ping"}]}, req_id=2),
+            _jsonrpc_response({"prompts": [{"name": "greet"}]}, req_id=3),
+        ])
+        monkeypatch.setattr("asyncio.create_subprocess_exec", AsyncMock(return_value=proc))
+
+        result = await ServerOrchestrator().discover_server_tools("srv", "cmd")
+
+        assert [t.name for t in result.tools] == ["ping"]
+        assert result.tools[0].description == "Ping"
+        assert result.prompts == [{"name": "greet"}]
+        assert proc.stdin.write.call_count == 4
+        proc.terminate.assert_called_once()
+
+    async def test_discover_timeout(self, orch):
+        with patch("asyncio.create_subprocess_exec", _hanging_spawn), \
+             patch("src.meta_mcp.orchestration._STARTUP_TIMEOUT_S", 0.01):
             result = await orch.discover_server_tools("srv", "cmd")
 
         assert result.tools == []
@@ -290,13 +326,9 @@ class TestRunningServers:
         orch = ServerOrchestrator()
         assert orch.running_servers == {}
 
-    async def test_after_start(self):
+    async def test_after_start(self, fake_subproc):
         orch = ServerOrchestrator()
-        proc = _mock_process(returncode=None)
-
-        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, return_value=proc), \
-             patch("asyncio.wait_for", new_callable=AsyncMock, return_value=proc):
-            await orch.start_server("my-srv", "echo")
+        await orch.start_server("my-srv", "echo")
 
         servers = orch.running_servers
         assert "my-srv" in servers
@@ -1,195 +1,382 @@
 """Tests for Project Context Awareness (R4)."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.meta_mcp.project import ProjectAnalyzer
+import src.meta_mcp.project as project_mod
+from src.meta_mcp.project import ProjectAnalyzer, _ANALYSIS_CACHE_SIZE
+
+
+def _write_tree(root, files):
+    """Create *files* under *root*; a name ending in ``/`` is a directory."""
+    for name, contents in files.items():
+        path = root / name
+        if name.endswith("/"):
+            path.mkdir(parents=True)
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents, encoding="utf-8")
+
+
+def _git_remote(url):
+    return f'[remote "origin"]\n\turl = {url}\n'
+
+
+@pytest.fixture(scope="module")
+def project_tree(tmp_path_factory):
+    """A project with every marker the read-only detectors look for.
+
+    Built once per module; tests must not modify it.
+    """
+    root = tmp_path_factory.mktemp("proj")
+    (root / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
+    (root / ".git").mkdir()
+    (root / ".git" / "config").write_text(
+        '[remote "origin"]\n\turl = https://github.com/user/repo.git\n',
+        encoding="utf-8",
+    )
+    (root / ".github" / "workflows").mkdir(parents=True)
+    (root / "Dockerfile").write_text("FROM python:3.12\n", encoding="utf-8")
+    (root / ".env.example").write_text(
+        "DATABASE_URL=postgres://localhost/db\n", encoding="utf-8",
+    )
+    (root / ".env").write_text("REDIS_URL=redis://localhost\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def analyzer():
+    """A fresh ProjectAnalyzer, so no test sees another's cached analysis."""
+    return ProjectAnalyzer()
 
 
 class TestLanguageDetection:
-    """Detect primary language from marker files."""
+    """Detect primary language from marker files.
 
-    def test_detect_python(self, tmp_path):
+    Runs on pyfakefs's in-memory filesystem; ``test_detect_python_on_disk``
+    keeps the real filesystem path covered.
+    """
+
+    ROOT = Path("/proj")
+
+    def test_detect_python_on_disk(self, analyzer, tmp_path):
         (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
         result = analyzer.analyze_project(str(tmp_path))
         assert result.project.language == "python"
 
-    def test_detect_node(self, tmp_path):
-        (tmp_path / "package.json").write_text('{"name":"x"}', encoding="utf-8")
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.language == "node"
-
-    def test_detect_typescript_over_node(self, tmp_path):
-        (tmp_path / "package.json").write_text('{"name":"x"}', encoding="utf-8")
+    @pytest.mark.parametrize(
+        "files, expected",
+        [
+            ({"pyproject.toml": "[project]\nname='x'"}, "python"),
+            ({"package.json": '{"name":"x"}'}, "node"),
+            ({"package.json": '{"name":"x"}', "tsconfig.json": "{}"}, "typescript"),
+            ({"Cargo.toml": '[package]\nname="x"'}, "rust"),
+            ({}, None),
+        ],
+        ids=["python", "node", "typescript-over-node", "rust", "none"],
+    )
+    def test_detect_language(self, analyzer, fs, files, expected):
+        fs.create_dir(self.ROOT)
+        for name, contents in files.items():
+            fs.create_file(self.ROOT / name, contents=contents)
+        result = analyzer.analyze_project(str(self.ROOT))
+        assert result.project.language == expected
+
+
+class TestLanguageMarkerScan:
+    """Marker files are found with one directory listing, not a stat each."""
+
+    def test_single_scandir_no_per_marker_stat(self, analyzer, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[project]", encoding="utf-8")
+        (tmp_path / "package.json").write_text("{}", encoding="utf-8")
         (tmp_path / "tsconfig.json").write_text("{}", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.language == "typescript"
+        (tmp_path / ".git").mkdir()
 
-    def test_detect_rust(self, tmp_path):
-        (tmp_path / "Cargo.toml").write_text('[package]\nname="x"', encoding="utf-8")
-        analyzer = ProjectAnalyzer()
+        scans = []
+        real_scandir = os.scandir
+
+        def _counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+
+        with patch("src.meta_mcp.project.os.scandir", _counting_scandir), \
+             patch.object(Path, "is_file", side_effect=AssertionError("stat per marker")):
+            language = analyzer._detect_language(tmp_path)
+
+        assert language == "typescript"
+        assert len(scans) == 1
+
+    def test_analysis_lists_root_once(self, tmp_path):
+        """Every detector answers from one listing and only opens files that exist."""
+        _write_tree(tmp_path, {
+            "pyproject.toml": "[project]\nname='x'",
+            "requirements.txt": "flask\n",
+            ".env": "REDIS_URL=redis://localhost\n",
+            "Dockerfile": "FROM python:3.12\n",
+            ".git/config": '[remote "origin"]\n\turl = https://github.com/u/r.git\n',
+        })
+
+        scans = []
+        read = []
+        real_scandir = os.scandir
+        real_read_text = project_mod._read_text
+
+        def _counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+
+        def _recording_read_text(path):
+            read.append(path.name)
+            return real_read_text(path)
+
+        with patch("src.meta_mcp.project.os.scandir", _counting_scandir), \
+             patch("src.meta_mcp.project._read_text", _recording_read_text), \
+             patch.object(Path, "is_file", side_effect=AssertionError("stat per marker")), \
+             patch.object(Path, "exists", side_effect=AssertionError("stat per marker")):
+            result = ProjectAnalyzer().analyze_project(str(tmp_path))
+
+        assert len(scans) == 1
+        assert set(read) == {".env", "config", "pyproject.toml", "requirements.txt"}
+        assert result.project.framework == "flask"
+        assert result.project.services == ["redis"]
+        assert result.project.vcs == "git"
+        assert result.project.has_docker is True
+
+    def test_markers_match_regardless_of_case(self, analyzer, tmp_path):
+        """Case-insensitive filesystems would find these with a direct stat."""
+        _write_tree(tmp_path, {
+            "Requirements.txt": "flask\n",
+            "dockerfile": "FROM python:3.12\n",
+            "Agents.md": "# Agents\n",
+        })
         result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.language == "rust"
+        assert result.project.language == "python"
+        assert result.project.framework == "flask"
+        assert result.project.has_docker is True
+        assert result.agents_md == "# Agents\n"
 
-    def test_no_language_detected(self, tmp_path):
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.language is None
+    def test_exact_spelling_wins_over_other_case(self, analyzer, tmp_path):
+        # Both can exist on a case-sensitive filesystem.
+        _write_tree(tmp_path, {
+            "Requirements.txt": "django\n",
+            "requirements.txt": "flask\n",
+        })
+        assert analyzer._detect_framework(tmp_path, "python") == "flask"
+
+    def test_marker_directory_is_not_a_file(self, analyzer, tmp_path):
+        (tmp_path / "Cargo.toml").mkdir()
+        assert analyzer._detect_language(tmp_path) is None
 
 
 class TestFrameworkDetection:
     """Detect frameworks from dependency files."""
 
-    def test_detect_react(self, tmp_path):
-        (tmp_path / "package.json").write_text(
-            json.dumps({"name": "app", "dependencies": {"react": "^18"}}),
-            encoding="utf-8",
-        )
-        analyzer = ProjectAnalyzer()
+    @pytest.mark.parametrize(
+        "files, expected",
+        [
+            (
+                {"package.json": json.dumps({"name": "app", "dependencies": {"react": "^18"}})},
+                "react",
+            ),
+            (
+                {"package.json": json.dumps({"devDependencies": {"@angular/core": "^17"}})},
+                "angular",
+            ),
+            ({"pyproject.toml": '[project]\nname="x"\ndependencies=["fastapi"]'}, "fastapi"),
+            (
+                {"requirements.txt": "django>=4.0\n", "pyproject.toml": "[project]\nname='x'"},
+                "django",
+            ),
+            ({"pyproject.toml": "[project]\nname='x'"}, None),
+        ],
+        ids=["react", "scoped-angular", "fastapi", "django-from-requirements", "none"],
+    )
+    def test_detect_framework(self, analyzer, tmp_path, files, expected):
+        _write_tree(tmp_path, files)
         result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.framework == "react"
-
-    def test_detect_fastapi(self, tmp_path):
-        (tmp_path / "pyproject.toml").write_text(
-            '[project]\nname="x"\ndependencies=["fastapi"]', encoding="utf-8",
-        )
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.framework == "fastapi"
-
-    def test_detect_django_from_requirements(self, tmp_path):
-        (tmp_path / "requirements.txt").write_text("django>=4.0\n", encoding="utf-8")
-        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.framework == "django"
+        assert result.project.framework == expected
 
 
+@pytest.mark.xdist_group(name="project_tree")
 class TestVCSDetection:
     """Detect version control and provider."""
 
-    def test_detect_git(self, tmp_path):
+    def test_detect_github_provider(self, analyzer, project_tree):
+        assert analyzer._detect_vcs(project_tree) == ("git", "github")
+
+    @pytest.mark.parametrize(
+        "files, expected",
+        [
+            ({}, (None, None)),
+            ({".git/": None}, ("git", None)),
+            ({".git/config": _git_remote("git@gitlab.com:user/repo.git")}, ("git", "gitlab")),
+            (
+                {".git/config": _git_remote("https://bitbucket.org/user/repo.git")},
+                ("git", "bitbucket"),
+            ),
+            (
+                {".git/config": _git_remote("https://git.example.com/user/repo.git")},
+                ("git", "git.example.com"),
+            ),
+        ],
+        ids=["none", "no-remote", "gitlab", "bitbucket", "self-hosted"],
+    )
+    def test_detect_vcs(self, analyzer, tmp_path, files, expected):
+        _write_tree(tmp_path, files)
+        assert analyzer._detect_vcs(tmp_path) == expected
+
+    def test_vcs_in_analysis(self, analyzer, tmp_path):
         (tmp_path / ".git").mkdir()
-        analyzer = ProjectAnalyzer()
         result = analyzer.analyze_project(str(tmp_path))
         assert result.project.vcs == "git"
 
-    def test_detect_github_provider(self, tmp_path):
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-        (git_dir / "config").write_text(
-            '[remote "origin"]\n\turl = https://github.com/user/repo.git\n',
-            encoding="utf-8",
-        )
-        analyzer = ProjectAnalyzer()
-        # Access internal method for provider
-        vcs, provider = analyzer._detect_vcs(tmp_path)
-        assert provider == "github"
-
-    def test_detect_gitlab_provider(self, tmp_path):
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-        (git_dir / "config").write_text(
-            '[remote "origin"]\n\turl = git@gitlab.com:user/repo.git\n',
-            encoding="utf-8",
-        )
-        analyzer = ProjectAnalyzer()
-        vcs, provider = analyzer._detect_vcs(tmp_path)
-        assert provider == "gitlab"
-
-    def test_no_vcs(self, tmp_path):
-        analyzer = ProjectAnalyzer()
-        result = analyzer.analyze_project(str(tmp_path))
-        assert result.project.vcs is None
-
 
+@pytest.mark.xdist_group(name="project_tree")
 class TestCICDDetection:
     """Detect CI/CD systems."""
 
-    def test_github_actions(self, tmp_path):
-        (tmp_path / ".github" / "workflows").mkdir(parents=True)
-        analyzer = ProjectAnalyzer()
-        ci = analyzer._detect_ci_cd(tmp_path)
+    def test_github_actions(self, analyzer, project_tree):
+        ci = analyzer._detect_ci_cd(project_tree)
         assert ci == "github_actions"
 
-    def test_gitlab_ci(self, tmp_path):
-        (tmp_path / ".gitlab-ci.yml").write_text("stages: [build]", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
-        ci = analyzer._detect_ci_cd(tmp_path)
-        assert ci == "gitlab_ci"
+    @pytest.mark.parametrize(
+        "files, expected",
+        [
+            ({".gitlab-ci.yml": "stages: [build]"}, "gitlab_ci"),
+            ({"Jenkinsfile": "pipeline {}"}, "jenkins"),
+            ({".circleci/": None}, "circleci"),
+            ({".travis.yml": "language: python"}, "travis"),
+            ({"azure-pipelines.yml": "trigger: [main]"}, "azure_devops"),
+            ({"bitbucket-pipelines.yml": "pipelines: {}"}, "bitbucket_pipelines"),
+            ({".github/": None}, None),
+            ({}, None),
+        ],
+        ids=[
+            "gitlab", "jenkins", "circleci", "travis", "azure", "bitbucket",
+            "github-without-workflows", "none",
+        ],
+    )
+    def test_detect_ci_cd(self, analyzer, tmp_path, files, expected):
+        _write_tree(tmp_path, files)
+        assert analyzer._detect_ci_cd(tmp_path) == expected
+
+
+@pytest.mark.xdist_group(name="project_tree")
+class TestServiceDetection:
+    """Detect external services from env files."""
+
+    @pytest.mark.parametrize("service", ["postgres", "redis"])
+    def test_detect_service_from_env(self, analyzer, project_tree, service):
+        services = analyzer._detect_services(project_tree)
+        assert service in services
+
+
+@pytest.mark.xdist_group(name="project_tree")
+class TestDockerDetection:
+    """Detect Docker usage."""
+
+    def test_dockerfile_present(self, analyzer, project_tree):
+        assert analyzer._detect_docker(project_tree) is True
+
+    def test_no_docker(self, analyzer, tmp_path):
+        assert analyzer._detect_docker(tmp_path) is False
+
 
-    def test_no_ci(self, tmp_path):
+class TestAnalysisCache:
+    """Repeat analyses of an unchanged tree reuse the previous result."""
+
+    def test_unchanged_tree_skips_detectors(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
         analyzer = ProjectAnalyzer()
-        assert analyzer._detect_ci_cd(tmp_path) is None
+        first = analyzer.analyze_project(str(tmp_path))
 
+        with patch.object(analyzer, "_detect_language", side_effect=AssertionError("rescanned")):
+            second = analyzer.analyze_project(str(tmp_path))
 
-class TestServiceDetection:
-    """Detect external services from env files."""
+        assert second == first
+        assert second is not first
 
-    def test_detect_postgres_from_env(self, tmp_path):
-        (tmp_path / ".env.example").write_text(
-            "DATABASE_URL=postgres://localhost/db\n", encoding="utf-8",
-        )
+    def test_edited_marker_invalidates(self, tmp_path):
+        (tmp_path / "requirements.txt").write_text("flask\n", encoding="utf-8")
         analyzer = ProjectAnalyzer()
-        services = analyzer._detect_services(tmp_path)
-        assert "postgres" in services
+        assert analyzer.analyze_project(str(tmp_path)).project.framework == "flask"
+
+        (tmp_path / "requirements.txt").write_text("django>=4.0\n", encoding="utf-8")
+        assert analyzer.analyze_project(str(tmp_path)).project.framework == "django"
 
-    def test_detect_redis_from_env(self, tmp_path):
-        (tmp_path / ".env").write_text("REDIS_URL=redis://localhost\n", encoding="utf-8")
+    def test_new_marker_invalidates(self, tmp_path):
+        (tmp_path / "package.json").write_text('{"name":"x"}', encoding="utf-8")
         analyzer = ProjectAnalyzer()
-        services = analyzer._detect_services(tmp_path)
-        assert "redis" in services
+        assert analyzer.analyze_project(str(tmp_path)).project.language == "node"
 
+        (tmp_path / "tsconfig.json").write_text("{}", encoding="utf-8")
+        assert analyzer.analyze_project(str(tmp_path)).project.language == "typescript"
 
-class TestDockerDetection:
-    """Detect Docker usage."""
+    def test_git_config_edit_invalidates(self, tmp_path):
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        config = git_dir / "config"
+        config.write_text('[remote "origin"]\n\turl = git@gitlab.com:u/r.git\n', encoding="utf-8")
+        analyzer = ProjectAnalyzer()
+        servers = [r.server for r in analyzer.analyze_project(str(tmp_path)).recommendations]
+        assert "gitlab" in servers
+
+        config.write_text('[remote "origin"]\n\turl = https://github.com/u/r.git\n', encoding="utf-8")
+        servers = [r.server for r in analyzer.analyze_project(str(tmp_path)).recommendations]
+        assert "gitlab" not in servers
 
-    def test_dockerfile_present(self, tmp_path):
-        (tmp_path / "Dockerfile").write_text("FROM python:3.12\n", encoding="utf-8")
+    def test_cache_keeps_most_recently_used_roots(self, tmp_path):
+        roots = [tmp_path / str(i) for i in range(_ANALYSIS_CACHE_SIZE + 1)]
+        for root in roots:
+            root.mkdir()
         analyzer = ProjectAnalyzer()
-        assert analyzer._detect_docker(tmp_path) is True
+        for root in roots[:-1]:
+            analyzer.analyze_project(str(root))
+        analyzer.analyze_project(str(roots[0]))  # refresh the oldest entry
+        analyzer.analyze_project(str(roots[-1]))
 
-    def test_no_docker(self, tmp_path):
+        assert len(analyzer._cache) == _ANALYSIS_CACHE_SIZE
+        assert roots[0].resolve() in analyzer._cache
+        assert roots[1].resolve() not in analyzer._cache
+
+    def test_cached_result_not_shared_with_callers(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
         analyzer = ProjectAnalyzer()
-        assert analyzer._detect_docker(tmp_path) is False
+        analyzer.analyze_project(str(tmp_path)).recommendations.clear()
+        assert analyzer.analyze_project(str(tmp_path)).recommendations
 
 
 class TestRecommendations:
     """Context-aware server recommendations."""
 
-    def test_python_project_gets_serena(self, tmp_path):
+    def test_python_project_gets_serena(self, analyzer, tmp_path):
         (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
         result = analyzer.analyze_project(str(tmp_path))
         servers = [r.server for r in result.recommendations]
         assert "serena" in servers
 
-    def test_github_project_gets_github_rec(self, tmp_path):
+    def test_github_project_gets_github_rec(self, analyzer, tmp_path):
         git_dir = tmp_path / ".git"
         git_dir.mkdir()
         (git_dir / "config").write_text(
             '[remote "origin"]\n\turl = https://github.com/u/r.git\n',
             encoding="utf-8",
         )
-        analyzer = ProjectAnalyzer()
         result = analyzer.analyze_project(str(tmp_path))
         servers = [r.server for r in result.recommendations]
         assert "github" in servers
 
-    def test_deduplication(self, tmp_path):
+    def test_deduplication(self, analyzer, tmp_path):
         (tmp_path / "pyproject.toml").write_text("[project]\nname='x'", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
         result = analyzer.analyze_project(str(tmp_path))
         server_names = [r.server for r in result.recommendations]
         assert len(server_names) == len(set(server_names))
 
-    def test_nonexistent_directory(self):
-        analyzer = ProjectAnalyzer()
+    def test_nonexistent_directory(self, analyzer):
         result = analyzer.analyze_project("/nonexistent/path/xxx")
         assert result.recommendations == []
 
@@ -197,9 +384,8 @@ class TestRecommendations:
 class TestEnvVarMasking:
     """Sensitive env var value masking."""
 
-    def test_mask_api_key(self, tmp_path):
+    def test_mask_api_key(self, analyzer, tmp_path):
         (tmp_path / ".env").write_text("MY_API_KEY=sk-123456789\n", encoding="utf-8")
-        analyzer = ProjectAnalyzer()
         env_vars = analyzer._detect_env_vars(tmp_path)
         assert env_vars.get("MY_API_KEY", "").endswith("****")
         assert not env_vars.get("MY_API_KEY", "").endswith("sk-123456789")
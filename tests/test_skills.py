@@ -1,16 +1,21 @@
 """Tests for Agent Skills and Capability Stack Management (R9)."""
 
+import tracemalloc
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
+from hypothesis import given, settings, strategies as st
 
 from src.meta_mcp._parsing import parse_skill_md
 from src.meta_mcp.skills import (
     SkillsManager,
+    _INTENT_CATEGORY_MAP,
+    _expand_intent,
     _skill_from_frontmatter,
     _generate_frontmatter,
+    _iter_skill_files,
     _resolve_project_skills_dir,
 )
 from src.meta_mcp.models import SkillScope
@@ -179,19 +184,108 @@ class TestSearchSkills:
             assert "review" in results[0].name.lower() or "review" in results[0].provides.lower()
 
 
+_words = st.text(alphabet="abcdefgh", min_size=1, max_size=8)
+_tag_lists = st.lists(_words, max_size=5)
+
+
+class TestSkillScoring:
+    """Scoring helpers are pure and callable without a manager instance."""
+
+    def test_score_skill_entry_without_instance(self):
+        entry = {
+            "name": "code-review",
+            "description": "Review code changes",
+            "provides": "review",
+            "tags": ["quality"],
+        }
+        score = SkillsManager._score_skill_entry(entry, "review", {"quality"})
+        # name/description/provides hits, the same as word hits, one tag overlap
+        assert score == (50 + 30 + 20) + (15 + 10 + 8) + 12
+
+    @settings(max_examples=200, deadline=None)
+    @given(
+        tags=_tag_lists,
+        extra=_words,
+        intent=st.lists(_words, max_size=4).map(" ".join),
+        expanded=st.sets(_words, max_size=4),
+    )
+    def test_adding_a_tag_never_lowers_score(self, tags, extra, intent, expanded):
+        def _score(skill_tags):
+            skill = _skill_from_frontmatter(
+                {"name": "s", "description": "d", "tags": skill_tags},
+                SkillScope.PROJECT,
+            )
+            return SkillsManager._score_skill(skill, intent, expanded)
+
+        assert _score(tags + [extra]) >= _score(tags)
+
+    def test_score_skill_without_instance(self):
+        skill = _skill_from_frontmatter(
+            {"name": "db-tuner", "description": "Tune queries", "tags": ["database"]},
+            SkillScope.PROJECT,
+        )
+        assert SkillsManager._score_skill(skill, "db-tuner", set()) == 50 + 15
+        assert SkillsManager._score_skill(skill, "unrelated", set()) == 0
+
+
+def _naive_expand(intent_lower):
+    expanded = set()
+    for keyword, categories in _INTENT_CATEGORY_MAP.items():
+        if keyword in intent_lower:
+            expanded.update(categories)
+    return expanded
+
+
+# Intents built from map keywords plus filler, so matches are common.
+_intents = st.lists(
+    st.sampled_from(sorted(_INTENT_CATEGORY_MAP)) | st.sampled_from(["x", "code", "s", "ing"]),
+    max_size=6,
+).flatmap(lambda parts: st.sampled_from([" ", ""]).map(lambda sep: sep.join(parts)))
+
+
+class TestExpandIntent:
+    """The single-pass keyword scan matches checking every keyword in turn."""
+
+    def test_nested_keywords_are_found(self):
+        assert _expand_intent("code review") == _naive_expand("code review")
+        assert "security" in _expand_intent("security audit")
+
+    def test_no_keywords(self):
+        assert _expand_intent("hello world") == set()
+
+    def test_repeated_intent_is_cached(self):
+        _expand_intent.cache_clear()
+        first = _expand_intent("optimize sql")
+        assert _expand_intent("optimize sql") is first
+        assert isinstance(first, frozenset)
+        assert _expand_intent.cache_info().hits == 1
+
+    @settings(max_examples=300, deadline=None)
+    @given(intent=_intents)
+    def test_matches_naive_scan(self, intent):
+        assert _expand_intent(intent) == _naive_expand(intent)
+
+
 # -- Tests: SkillsManager.list_skills --------------------------------------
 
 class TestListSkills:
-    """List installed skills from filesystem."""
+    """List installed skills from filesystem.
 
-    def test_list_with_no_dirs(self, tmp_path):
-        mgr = SkillsManager(project_path=str(tmp_path))
-        with patch.object(mgr, "global_dir", tmp_path / "global"), \
+    Runs on pyfakefs's in-memory filesystem, except
+    ``test_list_project_skills_on_disk``.
+    """
+
+    ROOT = Path("/proj")
+
+    def test_list_with_no_dirs(self, fs):
+        fs.create_dir(self.ROOT)
+        mgr = SkillsManager(project_path=str(self.ROOT))
+        with patch.object(mgr, "global_dir", self.ROOT / "global"), \
              patch.object(mgr, "extra_dirs", []):
             result = mgr.list_skills()
         assert result.total == 0
 
-    def test_list_project_skills(self, tmp_path):
+    def test_list_project_skills_on_disk(self, tmp_path):
         proj_skills = tmp_path / ".claude" / "skills"
         _write_skill_md(proj_skills / "my-skill")
 
@@ -202,16 +296,80 @@ class TestListSkills:
         assert result.total >= 1
         assert any(s.name == "test-skill" for s in result.project_skills)
 
-    def test_list_global_skills(self, tmp_path):
-        global_dir = tmp_path / "global-skills"
+    def test_list_project_skills(self, fs):
+        _write_skill_md(self.ROOT / ".claude" / "skills" / "my-skill")
+
+        mgr = SkillsManager(project_path=str(self.ROOT))
+        with patch.object(mgr, "global_dir", self.ROOT / "empty-global"):
+            result = mgr.list_skills()
+
+        assert result.total >= 1
+        assert any(s.name == "test-skill" for s in result.project_skills)
+
+    def test_list_global_skills(self, fs):
+        global_dir = self.ROOT / "global-skills"
         _write_skill_md(global_dir / "global-review", name="global-review")
 
-        mgr = SkillsManager(project_path=str(tmp_path))
+        mgr = SkillsManager(project_path=str(self.ROOT))
         mgr.global_dir = global_dir
         result = mgr.list_skills()
         assert any(s.name == "global-review" for s in result.global_skills)
 
 
+class TestScanDirectoryStatBudget:
+    """Skill discovery walks directories with os.scandir, not per-child stats."""
+
+    def test_children_typed_by_scandir(self, tmp_path):
+        for i in range(50):
+            _write_skill_md(tmp_path / f"skill-{i:02d}", name=f"skill-{i:02d}")
+        (tmp_path / "README.md").write_text("not a skill", encoding="utf-8")
+
+        is_file_calls = []
+        real_is_file = Path.is_file
+
+        def _counting_is_file(self):
+            is_file_calls.append(self)
+            return real_is_file(self)
+
+        mgr = SkillsManager(project_path=str(tmp_path))
+        with patch.object(Path, "is_dir", side_effect=AssertionError("stat per child")), \
+             patch.object(Path, "is_file", _counting_is_file):
+            skills = mgr._scan_directory(tmp_path, SkillScope.PROJECT)
+
+        assert [s.name for s in skills] == [f"skill-{i:02d}" for i in range(50)]
+        assert len(is_file_calls) == 50
+
+    def test_missing_directory(self, tmp_path):
+        mgr = SkillsManager(project_path=str(tmp_path))
+        assert mgr._scan_directory(tmp_path / "absent", SkillScope.PROJECT) == []
+
+
+@pytest.fixture(scope="module")
+def many_skills_dir(tmp_path_factory):
+    """1000 minimal skill directories, created once for the module."""
+    root = tmp_path_factory.mktemp("many-skills")
+    for i in range(1000):
+        skill_dir = root / f"skill-{i:04d}"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("# skill\n", encoding="utf-8")
+    return root
+
+
+class TestScanDirectoryMemory:
+    """Skill discovery streams paths instead of materialising the tree."""
+
+    def test_peak_allocation_bounded(self, many_skills_dir):
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in _iter_skill_files(many_skills_dir))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == 1000
+        # Sorted names only (~70 KB); a list of Path pairs is ~700 KB.
+        assert peak < 200_000
+
+
 # -- Tests: SkillsManager.install_skill -----------------------------------
 
 class TestInstallSkill:
@@ -402,22 +560,35 @@ class TestSuggestAgentsMdUpdate:
 
 # -- Tests: SkillsManager.search_capabilities ------------------------------
 
+@pytest.fixture(scope="module")
+def search_mgr():
+    """One SkillsManager for the read-only capability searches."""
+    return SkillsManager()
+
+
 class TestSearchCapabilities:
     """Unified search across skills and prompts."""
 
-    def test_search_finds_skills(self):
-        mgr = SkillsManager()
-        result = mgr.search_capabilities("code review")
+    def test_search_finds_skills(self, search_mgr):
+        result = search_mgr.search_capabilities("code review")
         assert len(result.agent_skills) > 0
 
-    def test_search_finds_prompts(self):
-        mgr = SkillsManager()
-        result = mgr.search_capabilities("query")
-        assert len(result.mcp_prompts) > 0
-
-    def test_search_no_results(self):
-        mgr = SkillsManager()
-        result = mgr.search_capabilities("xyzzy_totally_unique_12345")
+    @pytest.mark.parametrize(
+        "intent,server,prompt",
+        [
+            ("query", "postgres", "postgres-query"),
+            ("pull request", "github", "github-pr-review"),
+            ("web", "brave-search", "brave-web-search"),
+            ("screenshot", "puppeteer", "puppeteer-screenshot"),
+        ],
+        ids=["postgres", "github", "brave-search", "puppeteer"],
+    )
+    def test_search_finds_known_prompts(self, search_mgr, intent, server, prompt):
+        result = search_mgr.search_capabilities(intent)
+        assert (server, prompt) in {(p.server, p.name) for p in result.mcp_prompts}
+
+    def test_search_no_results(self, search_mgr):
+        result = search_mgr.search_capabilities("xyzzy_totally_unique_12345")
         assert "No capabilities" in result.recommendation
 
 
@@ -426,20 +597,22 @@ class TestSearchCapabilities:
 class TestNormaliseName:
     """Filesystem-safe name normalisation."""
 
-    def test_strip_path_prefix(self):
-        assert SkillsManager._normalise_name("anthropics/skills/code-review") == "code-review"
-
-    def test_special_chars_replaced(self):
-        result = SkillsManager._normalise_name("my skill (v2)")
-        assert " " not in result
-        assert "(" not in result
-
-    def test_lowercase(self):
-        assert SkillsManager._normalise_name("MySkill") == "myskill"
-
-    def test_empty_string(self):
-        assert SkillsManager._normalise_name("") == "unnamed-skill"
-
-    def test_collapse_hyphens(self):
-        result = SkillsManager._normalise_name("a--b---c")
-        assert "--" not in result
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("anthropics/skills/code-review", "code-review"),
+            ("my skill (v2)", "my-skill-v2"),
+            ("MySkill", "myskill"),
+            ("", "unnamed-skill"),
+            ("a--b---c", "a-b-c"),
+        ],
+        ids=[
+            "strip_path_prefix",
+            "special_chars_replaced",
+            "lowercase",
+            "empty_string",
+            "collapse_hyphens",
+        ],
+    )
+    def test_normalise_name(self, raw, expected):
+        assert SkillsManager._normalise_name(raw) == expected
@@ -248,3 +248,30 @@ class TestFastMCPIntegration:
     def test_tool_count(self, server):
         """Verify exactly 31 tools registered after scalpel refactor."""
         assert len(server.tools) == 31, f"Expected 31 tools, got {len(server.tools)}"
+
+
+# ── Tool subclass registry ───────────────────────────────────────────
+
+
+class TestToolRegistry:
+    """Tool subclasses register themselves by name at class creation."""
+
+    def test_every_server_tool_is_registered(self, all_tools):
+        for tool in all_tools:
+            assert Tool.get_tool_class(tool.get_name()) is type(tool)
+
+    def test_duplicate_tool_name_rejected(self):
+        with pytest.raises(TypeError, match="'detect_clients'.*already registered"):
+
+            class DetectClientsTool(Tool):
+                def apply(self) -> str:
+                    """Shadow the real tool."""
+                    return ""
+
+        assert Tool.get_tool_class("detect_clients").__module__ == "src.meta_mcp.tools"
+
+    def test_subclass_without_apply_rejected(self):
+        with pytest.raises(TypeError, match="must define apply"):
+
+            class BrokenTool(Tool):
+                pass
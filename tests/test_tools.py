@@ -0,0 +1,104 @@
+"""Tests for the FastMCP tool layer: the sync-to-async bridge and report formatting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.meta_mcp.models import (
+    EcosystemHealthResult,
+    HealthStatus,
+    MCPConfiguration,
+    ServerHealthReport,
+)
+from src.meta_mcp.tools import CheckEcosystemHealthTool, run_async_safely
+
+
+async def _get_value():
+    return 42
+
+
+async def _loop_id():
+    return id(asyncio.get_running_loop())
+
+
+async def _boom():
+    raise ValueError("bad")
+
+
+@pytest.fixture
+def loop_counter(monkeypatch):
+    """Count event loops created while the test runs."""
+    counter = {"n": 0}
+    orig = asyncio.new_event_loop
+
+    def _counting():
+        counter["n"] += 1
+        return orig()
+
+    monkeypatch.setattr(asyncio, "new_event_loop", _counting)
+    return counter
+
+
+class TestRunAsyncSafely:
+    """run_async_safely reuses one loop instead of asyncio.run per call."""
+
+    def test_runs_simple_coroutine(self):
+        assert run_async_safely(_get_value()) == 42
+
+    def test_propagates_exceptions(self):
+        with pytest.raises(ValueError, match="bad"):
+            run_async_safely(_boom())
+
+    def test_reuses_event_loop(self, loop_counter):
+        for _ in range(10):
+            run_async_safely(_get_value())
+        assert loop_counter["n"] <= 1
+        assert len({run_async_safely(_loop_id()) for _ in range(5)}) == 1
+
+    async def test_reuses_event_loop_inside_running_loop(self, loop_counter):
+        """FastMCP calls sync tools from its own loop; that path must not spin up loops either."""
+        for _ in range(10):
+            assert run_async_safely(_get_value()) == 42
+        assert loop_counter["n"] <= 1
+
+    def test_nested_call_on_shared_loop_does_not_deadlock(self):
+        async def _outer():
+            return run_async_safely(_get_value()) + 1
+
+        assert run_async_safely(_outer()) == 43
+
+
+class TestEcosystemHealthReport:
+    """The report is assembled from parts in one join; pin its exact text."""
+
+    def test_report_text(self):
+        tool = CheckEcosystemHealthTool()
+        config = MCPConfiguration(mcpServers={"a": {"command": "a"}, "b": {"command": "b"}})
+        result = EcosystemHealthResult(
+            servers=[
+                ServerHealthReport(name="a", status=HealthStatus.HEALTHY, latency_ms=12, tools_count=3),
+                ServerHealthReport(
+                    name="b", status=HealthStatus.UNHEALTHY,
+                    error="not found", suggestion="install b",
+                ),
+            ],
+            summary={"healthy": 1, "unhealthy": 1, "degraded": 0},
+        )
+
+        async def _config():
+            return config
+
+        async def _health(servers):
+            return result
+
+        with patch.object(tool.config, "load_configuration", _config), \
+                patch.object(tool.verifier, "check_ecosystem_health", _health):
+            text = tool.apply()
+
+        assert text == (
+            "# Ecosystem Health Report\n\n"
+            "[OK] **a** (12ms) — 3 tools\n\n"
+            "[FAIL] **b**\n  Error: not found\n  Fix: install b\n\n"
+            "**Summary:** 1 healthy, 1 unhealthy, 0 degraded out of 2 total"
+        )
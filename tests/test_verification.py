@@ -1,18 +1,48 @@
 """Tests for Post-Install Verification Loop (R3)."""
 
+import asyncio
 import json
+import os
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.meta_mcp.verification import (
     ServerVerifier,
+    _StdioFramer,
+    _collect_capped,
+    _decode_head,
+    _categorize_error,
+    _SHARED_VERIFIERS_MAX,
+    check_ecosystem_health,
+    clear_verifiers,
+    clear_which_cache,
+    _proc_state,
+    _read_jsonrpc_response,
+    _read_responses,
 )
-from src.meta_mcp.models import HealthStatus, MCPConfigEntry
+from src.meta_mcp.models import HealthStatus, MCPConfigEntry, ServerHealthReport
 
 
 # -- Helpers -----------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _fresh_which_cache():
+    """PATH lookups are cached process-wide; keep tests independent."""
+    clear_which_cache()
+    yield
+    clear_which_cache()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_verifiers():
+    """The module-level wrappers share verifiers; keep tests independent."""
+    clear_verifiers()
+    yield
+    clear_verifiers()
+
+
 def _make_jsonrpc_response(result=None, error=None, req_id=1):
     """Build a JSON-RPC 2.0 response as bytes."""
     msg = {"jsonrpc": "2.0", "id": req_id}
@@ -23,6 +53,13 @@ def _make_jsonrpc_response(result=None, error=None, req_id=1):
     return (json.dumps(msg) + "\n").encode("utf-8")
 
 
+# Canonical responses for a healthy server with a single "ping" tool.  They
+# are bytes, so tests can share them without copying.
+_INIT_OK = _make_jsonrpc_response({"protocolVersion": "2024-11-05"}, req_id=1)
+_TOOLS_PING = _make_jsonrpc_response({"tools": [{"name": "ping"}]}, req_id=2)
+_CALL_OK = _make_jsonrpc_response({"content": []}, req_id=3)
+
+
 def _make_mock_process(
     returncode=None,
     stdout_lines=None,
@@ -51,15 +88,32 @@ def _make_mock_process(
 
     proc.stdout = MagicMock()
     proc.stdout.readline = AsyncMock(side_effect=_readline)
+    async def _read(n=-1):
+        return await _readline()
+
+    proc.stdout.read = AsyncMock(side_effect=_read)
 
     # stderr
     proc.stderr = MagicMock()
-    proc.stderr.read = AsyncMock(return_value=stderr)
+    stderr_chunks = iter([stderr] if stderr else [])
+
+    async def _read_stderr(n=-1):
+        return next(stderr_chunks, b"")
+
+    proc.stderr.read = AsyncMock(side_effect=_read_stderr)
+
+    # wait() blocks until the process exits or is terminated, like the real one
+    exited = asyncio.Event()
+
+    async def _wait():
+        if proc.returncode is None:
+            await exited.wait()
+        return proc.returncode
 
     proc.communicate = AsyncMock(return_value=(b"", stderr))
-    proc.wait = AsyncMock(return_value=0)
-    proc.terminate = MagicMock()
-    proc.kill = MagicMock()
+    proc.wait = AsyncMock(side_effect=_wait)
+    proc.terminate = MagicMock(side_effect=exited.set)
+    proc.kill = MagicMock(side_effect=exited.set)
 
     return proc
 
@@ -67,6 +121,172 @@ def _make_mock_process(
 # -- Tests -------------------------------------------------------------------
 
 
+class TestReadJsonrpcResponse:
+    """Framing of responses read from a server's stdout."""
+
+    def _reader(self, data):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return reader
+
+    async def test_newline_delimited(self):
+        reader = self._reader(b"log noise\n" + _make_jsonrpc_response({"ok": True}))
+        msg = await _read_jsonrpc_response(reader, timeout=1)
+        assert msg["result"] == {"ok": True}
+
+    async def test_content_length_framed(self):
+        body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"a": 1}}).encode()
+        frame = b"Content-Length: %d\r\n\r\n" % len(body) + body
+        msg = await _read_jsonrpc_response(self._reader(frame), timeout=1)
+        assert msg["result"] == {"a": 1}
+
+    async def test_eof_returns_none(self):
+        assert await _read_jsonrpc_response(self._reader(b""), timeout=1) is None
+
+    async def test_framer_reads_consecutive_messages(self):
+        framer = _StdioFramer(self._reader(
+            _make_jsonrpc_response({"n": 1}, req_id=1)
+            + _make_jsonrpc_response({"n": 2}, req_id=2)
+        ))
+        first = await _read_jsonrpc_response(framer, timeout=1)
+        second = await _read_jsonrpc_response(framer, timeout=1)
+        assert (first["id"], second["id"]) == (1, 2)
+        assert await _read_jsonrpc_response(framer, timeout=1) is None
+
+    async def test_framer_handles_lines_beyond_stream_limit(self):
+        big = {"tools": [{"name": "t" * 200_000}]}
+        framer = _StdioFramer(self._reader(_make_jsonrpc_response(big)))
+        msg = await _read_jsonrpc_response(framer, timeout=1)
+        assert msg["result"] == big
+
+    async def test_notification_stream_cannot_extend_timeout(self):
+        notification = json.dumps(
+            {"jsonrpc": "2.0", "method": "notifications/message"}
+        ).encode() + b"\n"
+
+        class Chatty:
+            async def readline(self):
+                await asyncio.sleep(0.02)
+                return notification
+
+        # Per-message timeouts would keep reading forever; fail instead.
+        responses = await asyncio.wait_for(
+            _read_responses(Chatty(), (1,), timeout=0.2), timeout=1,
+        )
+        assert responses == {}
+
+    async def test_framer_content_length(self):
+        body = json.dumps({"jsonrpc": "2.0", "id": 7, "result": {}}).encode()
+        framer = _StdioFramer(self._reader(
+            b"Content-Length: %d\r\n\r\n" % len(body) + body
+        ))
+        msg = await _read_jsonrpc_response(framer, timeout=1)
+        assert msg["id"] == 7
+
+
+class TestVerifyServer:
+    """End-to-end verification against a mocked stdio server."""
+
+    async def _verify(self, proc):
+        v = ServerVerifier(timeout=1)
+        with patch("shutil.which", return_value="/usr/bin/srv"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            return await v.verify_server("srv", "srv")
+
+    async def test_handshake_is_pipelined(self):
+        proc = _make_mock_process(stdout_lines=[
+            _INIT_OK,
+            _TOOLS_PING,
+            _CALL_OK,
+        ])
+        result = await self._verify(proc)
+        assert result.verdict == "fully_operational"
+        assert result.tools_discovered == ["ping"]
+        first_write = proc.stdin.write.call_args_list[0].args[0]
+        methods = [json.loads(line)["method"] for line in first_write.splitlines()]
+        assert methods == ["initialize", "notifications/initialized", "tools/list"]
+        # One drain for the handshake burst, one for the smoke-test call.
+        assert proc.stdin.drain.await_count == 2
+
+    async def test_responses_matched_by_id(self):
+        notification = (json.dumps({
+            "jsonrpc": "2.0", "method": "notifications/message", "params": {},
+        }) + "\n").encode()
+        proc = _make_mock_process(stdout_lines=[
+            notification,
+            _TOOLS_PING,
+            _INIT_OK,
+            _CALL_OK,
+        ])
+        result = await self._verify(proc)
+        assert result.mcp_handshake
+        assert result.tools_discovered == ["ping"]
+
+    async def test_smoke_test_skips_notifications(self):
+        progress = (json.dumps({
+            "jsonrpc": "2.0", "method": "notifications/progress", "params": {},
+        }) + "\n").encode()
+        proc = _make_mock_process(stdout_lines=[
+            _INIT_OK,
+            _TOOLS_PING,
+            progress,
+            _make_jsonrpc_response(error={"code": -1, "message": "nope"}, req_id=3),
+        ])
+        result = await self._verify(proc)
+        assert result.smoke_test.result == "error"
+        assert "nope" in result.smoke_test.error
+
+    async def test_startup_crash_reported(self):
+        proc = _make_mock_process(returncode=1, stderr=b"fatal: bad config")
+        result = await self._verify(proc)
+        assert not result.process_started
+        assert "exited immediately with code 1" in result.errors[0]
+        assert "bad config" in result.errors[0]
+
+    async def test_which_lookup_is_cached(self):
+        v = ServerVerifier(timeout=1)
+        with patch("shutil.which", return_value=None) as which:
+            for _ in range(2):
+                result = await v.verify_server("srv", "missing-binary")
+                assert "not found on PATH" in result.errors[0]
+        assert which.call_count == 1
+
+    def test_path_commands_skip_path_search(self, tmp_path):
+        v = ServerVerifier()
+        with patch("shutil.which") as which:
+            assert v._which(sys.executable, "/nowhere") == sys.executable
+            assert v._which(str(tmp_path / "missing"), "/nowhere") is None
+        which.assert_not_called()
+
+    def test_which_cache_expires(self):
+        v = ServerVerifier()
+        with patch("shutil.which", return_value="/usr/bin/srv") as which, \
+             patch("src.meta_mcp.verification.time.monotonic", side_effect=[0, 1, 100]):
+            for _ in range(3):
+                v._which("srv", None)
+        assert which.call_count == 2
+
+    def test_which_cache_follows_path_changes(self):
+        v = ServerVerifier()
+        with patch("shutil.which", return_value="/usr/bin/srv") as which, \
+             patch.dict(os.environ, {"PATH": "/usr/bin"}):
+            v._which("srv", None)
+            v._which("srv", None)
+            os.environ["PATH"] = "/opt/bin:/usr/bin"
+            v._which("srv", None)
+        assert which.call_count == 2
+        assert which.call_args.kwargs["path"] == "/opt/bin:/usr/bin"
+
+    async def test_initialize_error_fails(self):
+        proc = _make_mock_process(stdout_lines=[
+            _make_jsonrpc_response(error={"code": -1, "message": "boom"}, req_id=1),
+        ])
+        result = await self._verify(proc)
+        assert result.verdict == "failed"
+        assert "boom" in result.errors[0]
+
+
 class TestBuildResult:
     """Verdict logic in _build_result."""
 
@@ -155,6 +375,147 @@ class TestSelfHeal:
         result = await v.self_heal("srv", "ETIMEDOUT during startup", "cmd")
         assert result["category"] == "timeout"
 
+    async def test_npm_fix_uses_exec_argv(self):
+        v = ServerVerifier()
+        proc = _make_mock_process(returncode=0)
+        with patch("shutil.which", return_value="/usr/bin/npm"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn:
+            attempted, _ = await v._fix_missing_node_module("my-server --stdio", "")
+        assert attempted
+        assert spawn.call_args.args == ("npm", "install", "-g", "my-server")
+        assert spawn.call_args.kwargs["stdout"] == asyncio.subprocess.DEVNULL
+
+    async def test_npm_fix_reports_capped_stderr(self):
+        v = ServerVerifier()
+        proc = _make_mock_process(returncode=1, stderr=b"E404 not found\n")
+        with patch("shutil.which", return_value="/usr/bin/npm"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            attempted, message = await v._fix_missing_node_module("nope", "")
+        assert not attempted
+        assert "E404 not found" in message
+        proc.communicate.assert_not_called()
+
+    async def test_npm_fix_kills_process_group_on_timeout(self):
+        v = ServerVerifier()
+        proc = _make_mock_process()
+        spawn = AsyncMock(return_value=proc)
+
+        async def _timeout(aw, timeout):
+            aw.close()
+            raise asyncio.TimeoutError
+
+        with patch("shutil.which", return_value="/usr/bin/npm"), \
+             patch("asyncio.create_subprocess_exec", spawn), \
+             patch("asyncio.wait_for", side_effect=_timeout), \
+             patch("src.meta_mcp.verification._kill_process_group",
+                   AsyncMock()) as kill:
+            attempted, message = await v._fix_missing_node_module("slow", "")
+        assert not attempted
+        assert "timed out" in message
+        assert spawn.call_args.kwargs["start_new_session"]
+        kill.assert_awaited_once_with(proc)
+
+    @pytest.mark.parametrize("fix, args, which", [
+        ("_fix_missing_node_module", ("slow", ""), "/usr/bin/npm"),
+        ("_fix_missing_browser", (), "/usr/bin/npx"),
+    ])
+    async def test_cancelled_fix_kills_process_group(self, fix, args, which):
+        v = ServerVerifier()
+        proc = _make_mock_process()  # wait() blocks until killed
+        with patch("shutil.which", return_value=which), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)), \
+             patch("src.meta_mcp.verification._kill_process_group",
+                   AsyncMock()) as kill:
+            task = asyncio.ensure_future(getattr(v, fix)(*args))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        kill.assert_awaited_once_with(proc)
+
+    async def test_cancelled_uv_install_kills_both_groups(self):
+        v = ServerVerifier()
+        curl, sh = _make_mock_process(), _make_mock_process()
+        for proc in (curl, sh):
+            async def communicate(proc=proc):
+                await proc.wait()
+                return b"", b""
+            proc.communicate = communicate
+        with patch("shutil.which", return_value="/usr/bin/curl"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=[curl, sh])), \
+             patch("src.meta_mcp.verification._kill_process_group",
+                   AsyncMock()) as kill:
+            task = asyncio.ensure_future(v._try_install_uv())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert [c.args[0] for c in kill.await_args_list] == [curl, sh]
+
+    def test_decode_head_matches_full_decode(self):
+        data = ("é" * 400).encode() + b"\xff" + b"tail"
+        assert _decode_head(data) == data.decode("utf-8", errors="replace")[:300]
+        assert _decode_head(b"\xe2\x82") == "\ufffd"
+        assert _decode_head(None) == ""
+
+    async def test_collect_capped_discards_overflow(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"x" * 10000)
+        reader.feed_eof()
+        data = await _collect_capped(reader, limit=100)
+        assert data == b"x" * 100
+        assert reader.at_eof()
+
+    async def test_npm_fix_rejects_option_like_package(self):
+        v = ServerVerifier()
+        with patch("shutil.which", return_value="/usr/bin/npm"), \
+             patch("asyncio.create_subprocess_exec") as spawn:
+            attempted, message = await v._fix_missing_node_module("--prefix=/", "")
+        assert not attempted
+        spawn.assert_not_called()
+
+    async def test_uv_install_pipes_curl_into_sh_without_shell(self):
+        v = ServerVerifier()
+        curl = _make_mock_process(returncode=0)
+        sh = _make_mock_process(returncode=0)
+        spawn = AsyncMock(side_effect=[curl, sh])
+        with patch("shutil.which", return_value="/usr/bin/curl"), \
+             patch("asyncio.create_subprocess_exec", spawn), \
+             patch("asyncio.create_subprocess_shell") as shell:
+            attempted, _ = await v._try_install_uv()
+        assert attempted
+        shell.assert_not_called()
+        assert spawn.call_args_list[0].args[0] == "/usr/bin/curl"
+        assert spawn.call_args_list[1].args == ("sh",)
+        assert all(c.kwargs["start_new_session"] for c in spawn.call_args_list)
+
+    async def test_uv_install_reports_download_failure(self):
+        v = ServerVerifier()
+        curl = _make_mock_process(returncode=6, stderr=b"could not resolve host")
+        sh = _make_mock_process(returncode=0)
+        with patch("shutil.which", return_value="/usr/bin/curl"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=[curl, sh])):
+            attempted, message = await v._try_install_uv()
+        assert not attempted
+        assert "could not resolve host" in message
+
+    async def test_successful_fix_is_cached(self):
+        v = ServerVerifier()
+        fix = AsyncMock(return_value=(True, "installed"))
+        with patch.object(v, "_attempt_auto_fix", fix):
+            first = await v.self_heal("srv", "Cannot find module 'x'", "npx")
+            second = await v.self_heal("srv", "Cannot find module 'y'", "npx")
+        assert fix.await_count == 1
+        assert second == first
+
+    async def test_failed_fix_is_not_cached(self):
+        v = ServerVerifier()
+        fix = AsyncMock(return_value=(False, "npm missing"))
+        with patch.object(v, "_attempt_auto_fix", fix):
+            await v.self_heal("srv", "Cannot find module 'x'", "npx")
+            await v.self_heal("srv", "Cannot find module 'x'", "npx")
+        assert fix.await_count == 2
+
 
 class TestPickSimpleTool:
     """Tool selection for smoke testing."""
@@ -225,6 +586,34 @@ class TestBuildTestInput:
         inp = v._build_test_input(tool)
         assert inp == {"flag": True}
 
+    @pytest.mark.parametrize("input_schema", [None, {}])
+    def test_falls_back_to_parameters_like_pick(self, input_schema):
+        v = ServerVerifier()
+        tool = {"name": "t", "inputSchema": input_schema, "parameters": {
+            "properties": {"q": {"type": "string"}},
+            "required": ["q"],
+        }}
+        assert v._pick_simple_tool([tool]) is tool
+        assert v._build_test_input(tool) == {"q": "test"}
+
+    def test_container_defaults_are_fresh(self):
+        v = ServerVerifier()
+        tool = {"inputSchema": {
+            "properties": {"a": {"type": "array"}, "o": {"type": "object"}},
+            "required": ["a", "o"],
+        }}
+        first = v._build_test_input(tool)
+        first["a"].append(1)
+        assert v._build_test_input(tool) == {"a": [], "o": {}}
+
+    def test_union_type_falls_back_to_string(self):
+        v = ServerVerifier()
+        tool = {"inputSchema": {
+            "properties": {"q": {"type": ["string", "null"]}},
+            "required": ["q"],
+        }}
+        assert v._build_test_input(tool) == {"q": "test"}
+
     def test_no_required_params(self):
         v = ServerVerifier()
         tool = {"inputSchema": {"properties": {"opt": {"type": "string"}}}}
@@ -254,3 +643,310 @@ class TestEcosystemHealth:
             result = await v.check_ecosystem_health(config)
         assert len(result.servers) == 1
         assert result.servers[0].status in (HealthStatus.UNHEALTHY, HealthStatus.DEGRADED)
+
+    async def test_crashed_check_reported_unknown(self):
+        v = ServerVerifier(max_concurrency=1)
+        config = {
+            "ok": MCPConfigEntry(command="a", args=[]),
+            "boom": MCPConfigEntry(command="b", args=[]),
+        }
+
+        async def _check(name, entry, heal_tasks=None, probed=None):
+            if name == "boom":
+                raise RuntimeError("kaput")
+            return ServerHealthReport(name=name, status=HealthStatus.HEALTHY)
+
+        with patch.object(v, "_check_single_server_health", side_effect=_check):
+            result = await v.check_ecosystem_health(config)
+        statuses = {r.name: r.status for r in result.servers}
+        assert statuses == {"ok": HealthStatus.HEALTHY, "boom": HealthStatus.UNKNOWN}
+        assert result.summary["unknown"] == 1
+
+    async def test_concurrency_limit_respected(self):
+        running = 0
+        peak = 0
+
+        async def _check(self, name, entry, heal_tasks=None, probed=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ServerHealthReport(name=name, status=HealthStatus.HEALTHY)
+
+        config = {
+            f"srv{i}": MCPConfigEntry(command="x", args=[]) for i in range(6)
+        }
+        with patch.object(ServerVerifier, "_check_single_server_health", _check):
+            result = await check_ecosystem_health(config, max_concurrency=2)
+        assert peak == 2
+        assert result.summary["healthy"] == 6
+
+    async def test_hung_check_cut_off_at_deadline(self):
+        v = ServerVerifier(timeout=0.05)
+        config = {
+            "fast": MCPConfigEntry(command="a", args=[]),
+            "hung": MCPConfigEntry(command="b", args=[]),
+        }
+        healthy = v._build_result(
+            process_started=True, mcp_handshake=True,
+            tools_discovered=[], smoke_test=None, errors=[],
+        )
+
+        async def _verify(server_name, **kwargs):
+            if server_name == "hung":
+                await asyncio.sleep(30)
+            return healthy
+
+        with patch.object(v, "verify_server", side_effect=_verify):
+            result = await asyncio.wait_for(v.check_ecosystem_health(config), 5)
+        statuses = {r.name: r.status for r in result.servers}
+        assert statuses == {"fast": HealthStatus.HEALTHY, "hung": HealthStatus.UNHEALTHY}
+        assert "timed out" in result.servers[1].error
+        assert result.servers[1].suggestion == _categorize_error("timeout")[1]
+
+    def test_deadline_covers_every_phase_per_batch(self):
+        v = ServerVerifier(timeout=10)
+        # spawn + handshake + smoke test for each wave of concurrent checks
+        assert v._health_deadline(1) == 30
+        assert v._health_deadline(2) == 60
+        assert ServerVerifier(timeout=10, health_check_method="ping")._health_deadline(1) == 40
+
+    async def test_slow_server_within_its_timeouts_is_healthy(self):
+        """Each phase stays under ``timeout`` while the total exceeds 2x it."""
+        proc = _make_mock_process(stdout_lines=[_INIT_OK, _TOOLS_PING, _CALL_OK])
+        fast_read = proc.stdout.read.side_effect
+
+        async def _slow_read(n=-1):
+            await asyncio.sleep(0.4)
+            return await fast_read(n)
+
+        async def _slow_spawn(*args, **kwargs):
+            await asyncio.sleep(0.85)
+            return proc
+
+        proc.stdout.read = AsyncMock(side_effect=_slow_read)
+        v = ServerVerifier(timeout=1)
+        config = {"slow": MCPConfigEntry(command="srv", args=[])}
+        with patch("shutil.which", return_value="/usr/bin/srv"), \
+             patch("asyncio.create_subprocess_exec", side_effect=_slow_spawn):
+            result = await v.check_ecosystem_health(config)
+        report = result.servers[0]
+        assert report.status == HealthStatus.HEALTHY, report.error
+        assert report.latency_ms > 2 * 1000
+
+    async def test_slow_heal_cut_off_at_deadline(self):
+        v = ServerVerifier(timeout=0.05)
+        config = {"srv": MCPConfigEntry(command="npx", args=[])}
+        failed = MagicMock(
+            verdict="failed", errors=["Cannot find module 'x'"], tools_discovered=[],
+        )
+        cancelled = asyncio.Event()
+
+        async def _slow_fix(*args):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return True, "installed"
+
+        with patch.object(v, "verify_server", AsyncMock(return_value=failed)), \
+             patch.object(v, "_attempt_auto_fix", side_effect=_slow_fix):
+            result = await asyncio.wait_for(v.check_ecosystem_health(config), 5)
+        report = result.servers[0]
+        # The probe result stands; only the auto-fix was cut short.
+        assert report.status == HealthStatus.UNHEALTHY
+        assert report.error == "Cannot find module 'x'"
+        assert report.suggestion == _categorize_error("Cannot find module")[1]
+        assert cancelled.is_set()
+
+    async def test_shared_failure_healed_once(self):
+        v = ServerVerifier(timeout=1)
+        config = {
+            f"srv{i}": MCPConfigEntry(command="npx", args=[]) for i in range(3)
+        }
+        failed = MagicMock(verdict="failed", errors=["Cannot find module 'x'"])
+        fix = AsyncMock(return_value=(False, "npm missing"))
+        with patch.object(v, "verify_server", AsyncMock(return_value=failed)), \
+             patch.object(v, "_attempt_auto_fix", fix):
+            result = await v.check_ecosystem_health(config)
+        assert fix.await_count == 1
+        assert result.summary["unhealthy"] == 3
+        assert len({r.suggestion for r in result.servers}) == 1
+
+    async def test_wrappers_reuse_one_verifier_per_setting(self):
+        with patch.object(
+            ServerVerifier, "check_ecosystem_health", autospec=True,
+        ) as check:
+            await check_ecosystem_health({}, timeout=3)
+            await check_ecosystem_health({}, timeout=3)
+            await check_ecosystem_health({}, timeout=4)
+        first, second, third = (c.args[0] for c in check.call_args_list)
+        assert first is second
+        assert first is not third
+        assert third.timeout == 4
+
+    async def test_wrappers_keep_a_bounded_set_of_verifiers(self):
+        with patch.object(
+            ServerVerifier, "check_ecosystem_health", autospec=True,
+        ) as check:
+            await check_ecosystem_health({}, timeout=1)
+            for timeout in range(2, _SHARED_VERIFIERS_MAX + 2):
+                await check_ecosystem_health({}, timeout=timeout)
+            await check_ecosystem_health({}, timeout=2)
+            await check_ecosystem_health({}, timeout=1)
+        verifiers = [c.args[0] for c in check.call_args_list]
+        assert verifiers[-2] is verifiers[1]  # still shared
+        assert verifiers[-1] is not verifiers[0]  # evicted, rebuilt
+
+
+class TestCategorizeError:
+    """Remediation matching keeps map-order priority."""
+
+    def test_earliest_map_entry_wins(self):
+        # "permission denied" appears first in the text, but missing_binary
+        # precedes permission in the remediation map.
+        category, _ = _categorize_error("Permission denied; ENOENT")
+        assert category == "missing_binary"
+
+    def test_case_insensitive(self):
+        assert _categorize_error("econnrefused")[0] == "connection_refused"
+
+    def test_no_match(self):
+        assert _categorize_error("all good") is None
+
+    def test_repeated_errors_hit_cache(self):
+        _categorize_error.cache_clear()
+        for _ in range(3):
+            _categorize_error("connect ECONNREFUSED 127.0.0.1:3000")
+        assert _categorize_error.cache_info().hits == 2
+
+
+class TestWarmSessions:
+    """health_check_method='ping' reuses verified server processes."""
+
+    async def test_second_check_pings_warm_process(self):
+        proc = _make_mock_process(stdout_lines=[
+            _INIT_OK,
+            _TOOLS_PING,
+            _CALL_OK,
+            _make_jsonrpc_response({}, req_id=100),
+        ])
+        spawn = AsyncMock(return_value=proc)
+        v = ServerVerifier(timeout=1, health_check_method="ping")
+        config = {"srv": MCPConfigEntry(command="srv", args=[])}
+        with patch("shutil.which", return_value="/usr/bin/srv"), \
+             patch("asyncio.create_subprocess_exec", spawn):
+            first = await v.check_ecosystem_health(config)
+            assert "srv" in v.warm_sessions
+            second = await v.check_ecosystem_health(config)
+        assert spawn.await_count == 1
+        assert first.servers[0].status == HealthStatus.HEALTHY
+        assert second.servers[0].status == HealthStatus.HEALTHY
+        assert second.servers[0].tools_count == 1
+        proc.terminate.assert_not_called()
+
+        await v.close()
+        proc.terminate.assert_called_once()
+        assert v.warm_sessions == {}
+
+    async def test_warm_session_drains_stderr_until_evicted(self):
+        proc = _make_mock_process(stdout_lines=[_INIT_OK, _TOOLS_PING, _CALL_OK])
+        chunks = iter([b"log line\n"] * 5)
+        silent = asyncio.Event()
+
+        async def _read_stderr(n=-1):
+            chunk = next(chunks, None)
+            if chunk is None:
+                await silent.wait()  # a live server that has gone quiet
+                return b""
+            return chunk
+
+        proc.stderr.read = AsyncMock(side_effect=_read_stderr)
+        v = ServerVerifier(timeout=1, health_check_method="ping")
+        config = {"srv": MCPConfigEntry(command="srv", args=[])}
+        with patch("shutil.which", return_value="/usr/bin/srv"), \
+             patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            await v.check_ecosystem_health(config)
+        drain = v.warm_sessions["srv"].stderr_drain
+        await asyncio.sleep(0.01)
+        assert proc.stderr.read.await_count == 6
+        assert not drain.done()
+
+        await v.close()
+        assert drain.cancelled()
+
+    async def test_skip_reports_unknown(self):
+        v = ServerVerifier(health_check_method="skip")
+        config = {"srv": MCPConfigEntry(command="srv", args=[])}
+        with patch("asyncio.create_subprocess_exec") as spawn:
+            result = await v.check_ecosystem_health(config)
+        spawn.assert_not_called()
+        assert result.servers[0].status == HealthStatus.UNKNOWN
+
+    def test_rejects_unknown_method(self):
+        with pytest.raises(ValueError):
+            ServerVerifier(health_check_method="telepathy")
+
+
+class TestTerminateProcess:
+    """Process teardown escalation."""
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+    def test_proc_state_of_running_process(self):
+        assert _proc_state(os.getpid()) in ("R", "S")
+
+    def test_proc_state_of_missing_pid(self):
+        assert _proc_state(None) is None
+
+    async def test_stopped_process_killed_immediately(self):
+        v = ServerVerifier()
+        proc = _make_mock_process()
+        with patch("src.meta_mcp.verification._proc_state", return_value="T"):
+            await v._terminate_process(proc)
+        proc.kill.assert_called_once()
+        proc.terminate.assert_not_called()
+
+
+class TestHealthyCache:
+    """healthy_cache_ttl reuses healthy reports until the binary changes."""
+
+    async def test_healthy_report_reused_until_binary_changes(self, tmp_path):
+        binary = tmp_path / "srv"
+        binary.write_text("#!/bin/sh\n")
+        binary.chmod(0o755)
+        v = ServerVerifier(healthy_cache_ttl=60)
+        config = {"srv": MCPConfigEntry(command=str(binary), args=[])}
+        verify = AsyncMock(return_value=v._build_result(
+            process_started=True,
+            mcp_handshake=True,
+            tools_discovered=["t"],
+            smoke_test=None,
+            errors=[],
+        ))
+        with patch.object(v, "verify_server", verify):
+            await v.check_ecosystem_health(config)
+            second = await v.check_ecosystem_health(config)
+            assert verify.await_count == 1
+            assert second.servers[0].status == HealthStatus.HEALTHY
+
+            stat = binary.stat()
+            os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            await v.check_ecosystem_health(config)
+        assert verify.await_count == 2
+
+    async def test_disabled_by_default(self):
+        v = ServerVerifier()
+        config = {"srv": MCPConfigEntry(command=sys.executable, args=[])}
+        verify = AsyncMock(return_value=v._build_result(
+            process_started=True,
+            mcp_handshake=True,
+            tools_discovered=[],
+            smoke_test=None,
+            errors=[],
+        ))
+        with patch.object(v, "verify_server", verify):
+            await v.check_ecosystem_health(config)
+            await v.check_ecosystem_health(config)
+        assert verify.await_count == 2